@@ -1,47 +1,104 @@
+import os
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.admin import Admin
 from app.models.admin_session import AdminSession
-from app.utils.auth import decode_access_token
+from app.schemas.admin import AdminPrincipal
+from app.utils.auth import decode_access_token, hash_token
+from app.utils.cache import TTLCache
 from app.utils.exceptions import UnauthorizedException, ForbiddenException
+from app.utils.metrics import ADMIN_SESSION_LOOKUPS
 
 
 oauth2_scheme_admin = OAuth2PasswordBearer(tokenUrl="/api/admin/auth/login")
 
+# 검증된 관리자 세션 캐시 (토큰 다이제스트 → AdminPrincipal)
+# 세션 expires_at, JWT exp, ADMIN_SESSION_CACHE_TTL 중 가장 이른 시각에 만료
+ADMIN_SESSION_CACHE_TTL = float(os.getenv("ADMIN_SESSION_CACHE_TTL", "60"))
+_session_cache = TTLCache(maxsize=int(os.getenv("ADMIN_SESSION_CACHE_SIZE", "1024")))
+
+
+def get_admin_session_cache() -> TTLCache:
+    """관리자 세션 캐시 조회 (통계 및 테스트용)"""
+    return _session_cache
+
+
+def invalidate_admin_session(token: str):
+    """로그아웃 시 해당 토큰의 캐시 항목 제거"""
+    _session_cache.delete(hash_token(token))
+
+
+def invalidate_admin_sessions(admin_id: int):
+    """관리자 수정/삭제 커밋 후 해당 관리자의 모든 캐시 항목 제거"""
+    _session_cache.delete_where(lambda key, principal: principal.id == admin_id)
+
+
+def _to_timestamp(value: datetime) -> float:
+    """DB의 UTC datetime(naive 포함)을 epoch 초로 변환"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
 
 async def get_current_admin(
     token: str = Depends(oauth2_scheme_admin),
-    db: Session = Depends(get_db)
-) -> Admin:
-    """현재 로그인한 관리자 조회 (JWT + 세션 검증)"""
+    db: AsyncSession = Depends(get_async_db)
+) -> AdminPrincipal:
+    """현재 로그인한 관리자 조회 (JWT + 세션 검증, 캐시 적중 시 DB 조회 없음)"""
+    cache_key = hash_token(token)
+    principal = _session_cache.get(cache_key)
+    if principal is not None:
+        ADMIN_SESSION_LOOKUPS.inc("cache_hit")
+        return principal
+
     # JWT 검증
     token_data = decode_access_token(token)
 
-    # 세션 검증
-    session = db.query(AdminSession).filter(
-        AdminSession.token == token,
-        AdminSession.expires_at > datetime.utcnow()
-    ).first()
-
-    if not session:
+    # 세션 + 관리자 단일 조회
+    result = await db.execute(
+        select(
+            AdminSession.expires_at,
+            Admin.id,
+            Admin.email,
+            Admin.username,
+            Admin.role,
+            Admin.is_active,
+            Admin.created_at,
+            Admin.version
+        ).join(
+            Admin, Admin.id == AdminSession.admin_id
+        ).where(
+            AdminSession.token_hash == cache_key,
+            AdminSession.expires_at > datetime.utcnow(),
+            Admin.email == token_data.email
+        )
+    )
+    row = result.first()
+
+    if row is None:
+        ADMIN_SESSION_LOOKUPS.inc("miss")
         raise UnauthorizedException("세션이 만료되었거나 유효하지 않습니다")
+    ADMIN_SESSION_LOOKUPS.inc("db_hit")
 
-    # 관리자 조회
-    admin = db.query(Admin).filter(Admin.email == token_data.email).first()
+    principal = AdminPrincipal.model_validate(row)
 
-    if admin is None:
-        raise UnauthorizedException("관리자를 찾을 수 없습니다")
+    expires_at = min(_to_timestamp(row.expires_at), time.time() + ADMIN_SESSION_CACHE_TTL)
+    if token_data.exp is not None:
+        expires_at = min(expires_at, float(token_data.exp))
+    _session_cache.set(cache_key, principal, expires_at=expires_at)
 
-    return admin
+    return principal
 
 
 async def get_current_active_admin(
-    current_admin: Admin = Depends(get_current_admin)
-) -> Admin:
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+) -> AdminPrincipal:
     """활성화된 관리자만 허용"""
     if not current_admin.is_active:
         raise ForbiddenException("비활성화된 관리자입니다")
@@ -50,8 +107,8 @@ async def get_current_active_admin(
 
 
 async def get_super_admin(
-    current_admin: Admin = Depends(get_current_active_admin)
-) -> Admin:
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
+) -> AdminPrincipal:
     """슈퍼 관리자만 허용"""
     if current_admin.role != "super_admin":
         raise ForbiddenException("슈퍼 관리자 권한이 필요합니다")
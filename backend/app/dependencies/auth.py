@@ -1,17 +1,37 @@
+import os
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import User
+from app.schemas import UserPrincipal
 from app.utils.auth import decode_access_token
+from app.utils.cache import TTLCache
 from app.utils.exceptions import UnauthorizedException, ForbiddenException
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# 인증된 사용자 스냅샷 캐시 (이메일 → UserPrincipal)
+_principal_cache = TTLCache(
+    maxsize=int(os.getenv("PRINCIPAL_CACHE_SIZE", "4096")),
+    default_ttl=float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+)
+
+
+def get_principal_cache() -> TTLCache:
+    """사용자 스냅샷 캐시 조회 (통계 및 테스트용)"""
+    return _principal_cache
+
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """토큰에서 현재 사용자 조회"""
+def invalidate_user_principal(user_id: int):
+    """사용자 정보 변경 커밋 후 캐시된 스냅샷 무효화"""
+    _principal_cache.delete_where(lambda email, principal: principal.id == user_id)
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> UserPrincipal:
+    """토큰에서 현재 사용자 조회 (캐시 적중 시 DB 조회 없음)"""
     try:
         token_data = decode_access_token(token)
         if token_data is None or token_data.email is None:
@@ -19,14 +39,29 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except Exception:
         raise UnauthorizedException("인증 정보를 확인할 수 없습니다")
 
-    user = db.query(User).filter(User.email == token_data.email).first()
-    if user is None:
+    principal = _principal_cache.get(token_data.email)
+    if principal is not None:
+        return principal
+
+    # 스냅샷에 필요한 컬럼만 조회
+    row = db.query(
+        User.id,
+        User.email,
+        User.username,
+        User.is_active,
+        User.enable_2fa,
+        User.created_at,
+        User.version
+    ).filter(User.email == token_data.email).first()
+    if row is None:
         raise UnauthorizedException("인증 정보를 확인할 수 없습니다")
 
-    return user
+    principal = UserPrincipal.model_validate(row)
+    _principal_cache.set(principal.email, principal)
+    return principal
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(current_user: UserPrincipal = Depends(get_current_user)) -> UserPrincipal:
     """활성 사용자 확인"""
     if not current_user.is_active:
         raise ForbiddenException("비활성 사용자입니다")
@@ -1,72 +1,106 @@
+import asyncio
 import os
 import secrets
+import time
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.database import engine, Base
+from app.database import engine, async_engine, replica_set
+from app.migrations import check_schema, run_migrations
 from app.routers import examples, auth, users, admin, auth_profiles, email_configs, emails
 from app.utils.auth import set_secret_key
+from app.utils.password_hashing import start_password_hasher, stop_password_hasher
+from app.utils.admin_utils import get_session_reaper
+from app.utils.exceptions import UnauthorizedException
+from app.utils.metrics import CONTENT_TYPE, METRICS_ENABLED, MetricsMiddleware, get_metrics_registry, metrics_authorized
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.query_stats import begin_query_stats, current_query_stats, end_query_stats, install_query_stats
+from app.utils.replicas import PrimaryWriteTrackingMiddleware
+from app.utils.responses import get_json_response_class
 
 # 환경 변수 로드
 load_dotenv()
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
-
-# JWT SECRET_KEY 설정: 환경 변수 우선, 없으면 자동 생성
-SECRET_KEY = os.getenv("SECRET_KEY")
-if not SECRET_KEY:
-    SECRET_KEY = secrets.token_urlsafe(48)
-    print("[WARNING] SECRET_KEY not set in .env. Using auto-generated key (will change on restart).")
-    print(f"[INFO] Generated SECRET_KEY: {SECRET_KEY[:10]}...")
-else:
-    print("[INFO] SECRET_KEY loaded from .env")
-
-set_secret_key(SECRET_KEY)
-
-app = FastAPI(title="Module 5 API", version="1.0.0")
-
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# 라우터 등록
-app.include_router(examples.router)
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(admin.router)
-app.include_router(auth_profiles.router)
-app.include_router(email_configs.router)
-app.include_router(emails.router)
+# true면 시작 시 마이그레이션 실행 (단일 프로세스 개발 환경용, 운영에서는 `python migrate.py`)
+AUTO_MIGRATE = os.getenv("AUTO_MIGRATE", "false").lower() == "true"
+
+# true면 응답에 요청별 SQL 문 수/DB 시간 Server-Timing 헤더 추가 (개발용)
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# 모든 응답과 전역 예외 핸들러에 사용할 JSON 응답 클래스 (JSON_RESPONSE 환경 변수)
+JSONResponse = get_json_response_class()
+
+
+def configure_secret_key():
+    """JWT SECRET_KEY 설정: 환경 변수 우선, 없으면 자동 생성"""
+    secret_key = os.getenv("SECRET_KEY")
+    if not secret_key:
+        secret_key = secrets.token_urlsafe(48)
+        print("[WARNING] SECRET_KEY not set in .env. Using auto-generated key (will change on restart).")
+        print(f"[INFO] Generated SECRET_KEY: {secret_key[:10]}...")
+    else:
+        print("[INFO] SECRET_KEY loaded from .env")
+
+    set_secret_key(secret_key)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """스키마 버전 확인 후 해싱 프로세스 풀과 백그라운드 작업 시작"""
+    if AUTO_MIGRATE:
+        await asyncio.to_thread(run_migrations, engine)
+    # DDL 없이 버전 쿼리 1회 (마이그레이션 누락 시 시작 실패)
+    await asyncio.to_thread(check_schema, engine)
+
+    start_password_hasher()
+    # 백그라운드 작업 (만료 세션 정리, 복제본 지연 측정)
+    background_tasks = [asyncio.create_task(get_session_reaper().run_forever())]
+    if replica_set.replicas:
+        background_tasks.append(asyncio.create_task(replica_set.run_forever()))
+
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        stop_password_hasher()
+        await async_engine.dispose()
+
+
+# DEBUG 모드: 요청별 SQL 문 수/DB 시간을 Server-Timing 헤더로 노출
+async def add_server_timing(request, call_next):
+    token = begin_query_stats()
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+        stats = current_query_stats()
+        response.headers["Server-Timing"] = stats.server_timing(time.perf_counter() - start)
+        return response
+    finally:
+        end_query_stats(token)
 
 
 # ============================================
 # 전역 예외 핸들러
 # ============================================
 
-@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request, exc):
-    """HTTP 예외 핸들러 (401, 404, 403 등)"""
+    """HTTP 예외 핸들러 (401, 404, 403, 429 등, 예외의 헤더 유지)"""
     return JSONResponse(
         status_code=exc.status_code,
         content={
             "error": "HTTPException",
             "message": exc.detail,
             "status_code": exc.status_code
-        }
+        },
+        headers=getattr(exc, "headers", None)
     )
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
     """Pydantic 검증 에러 핸들러 (422)"""
     details = []
@@ -87,7 +121,6 @@ async def validation_exception_handler(request, exc):
     )
 
 
-@app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """일반 예외 핸들러 (500)"""
     # 개발 환경에서는 상세 에러 출력
@@ -109,6 +142,71 @@ async def general_exception_handler(request, exc):
 # 엔드포인트
 # ============================================
 
-@app.get("/api/health")
 def health_check():
     return {"status": "ok", "message": "FastAPI 서버가 정상 작동 중입니다."}
+
+
+def metrics(request: Request):
+    """Prometheus 텍스트 형식 메트릭 (METRICS_ENABLED=true일 때만 등록, METRICS_TOKEN 설정 시 Bearer 인증)"""
+    if not metrics_authorized(request.headers.get("authorization")):
+        raise UnauthorizedException()
+    return Response(get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
+
+# ============================================
+# 앱 생성
+# ============================================
+
+def create_app() -> FastAPI:
+    """FastAPI 앱 생성 (import 시 DB 접근 없음, DB 확인은 lifespan에서)"""
+    configure_secret_key()
+
+    app = FastAPI(
+        title="Module 5 API",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=JSONResponse
+    )
+
+    # CORS 설정
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:3000"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    # 복제본이 있을 때만 클라이언트별 primary 커밋 추적 (커밋 후 max_lag초 동안 primary에서 읽기)
+    if replica_set.replicas:
+        app.add_middleware(PrimaryWriteTrackingMiddleware, max_lag=replica_set.max_lag)
+    if DEBUG:
+        install_query_stats()
+        app.middleware("http")(add_server_timing)
+    # 프로파일 토큰 헤더/샘플링으로 선택된 요청만 스택 샘플링
+    app.add_middleware(ProfilingMiddleware)
+    # 가장 바깥 미들웨어 (CORS/다른 미들웨어 시간 포함, 라우트 템플릿별 집계)
+    if METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    # 라우터 등록
+    app.include_router(examples.router)
+    app.include_router(auth.router)
+    app.include_router(users.router)
+    app.include_router(admin.router)
+    app.include_router(auth_profiles.router)
+    app.include_router(email_configs.router)
+    app.include_router(emails.router)
+
+    # 전역 예외 핸들러
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, general_exception_handler)
+
+    app.add_api_route("/api/health", health_check, methods=["GET"])
+    if METRICS_ENABLED:
+        app.add_api_route("/metrics", metrics, methods=["GET"], include_in_schema=False)
+
+    return app
+
+
+app = create_app()
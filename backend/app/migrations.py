@@ -0,0 +1,230 @@
+"""스키마 버전 관리 및 마이그레이션
+
+서버는 시작 시 schema_version 테이블을 한 번 조회해 버전만 확인하고,
+DDL은 `python migrate.py`로 한 번만 실행합니다 (여러 워커가 동시에 DDL을 실행하지 않음).
+"""
+
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.database import Base
+from app.models.admin import Admin
+from app.models.admin_session import AdminSession
+from app.models.example import EXAMPLES_FTS_DDL, Example
+from app.models.user import User
+from app.utils.auth import hash_token
+
+
+schema_version_table = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class SchemaVersionError(RuntimeError):
+    """DB 스키마 버전이 코드와 맞지 않음"""
+
+
+class Migration:
+    """버전 하나에 해당하는 마이그레이션
+
+    vacuum=True면 적용 후 (트랜잭션 밖에서) SQLite VACUUM을 실행합니다.
+    """
+
+    def __init__(self, version: int, description: str, upgrade: Callable[[Connection], None], vacuum: bool = False):
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+        self.vacuum = vacuum
+
+
+# ============================================
+# 마이그레이션 정의
+# ============================================
+
+def create_initial_schema(connection: Connection):
+    """모델 기준 테이블 생성 (기존 테이블은 유지)"""
+    import app.models  # noqa: F401 (모든 모델을 Base.metadata에 등록)
+
+    Base.metadata.create_all(bind=connection)
+
+
+def migrate_admin_session_tokens(connection: Connection):
+    """admin_sessions.token(JWT 원문) → token_hash(SHA-256 다이제스트)
+
+    SQLite는 UNIQUE 인덱스가 걸린 컬럼을 DROP COLUMN으로 제거할 수 없으므로
+    테이블을 새 스키마로 재생성하고 세션 행을 다이제스트로 변환해 복사합니다.
+    """
+    inspector = inspect(connection)
+    if "admin_sessions" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("admin_sessions")}
+    if "token" not in columns:
+        return
+
+    # 기존 인덱스 이름이 새 테이블과 겹치므로 먼저 제거
+    for index in inspector.get_indexes("admin_sessions"):
+        connection.execute(text(f'DROP INDEX IF EXISTS "{index["name"]}"'))
+    connection.execute(text("ALTER TABLE admin_sessions RENAME TO admin_sessions_old"))
+
+    AdminSession.__table__.create(bind=connection)
+
+    rows = connection.execute(text(
+        "SELECT id, admin_id, token, created_at, expires_at FROM admin_sessions_old"
+    )).all()
+    if rows:
+        connection.execute(
+            text(
+                "INSERT INTO admin_sessions (id, admin_id, token_hash, created_at, expires_at) "
+                "VALUES (:id, :admin_id, :token_hash, :created_at, :expires_at)"
+            ),
+            [
+                {
+                    "id": row.id,
+                    "admin_id": row.admin_id,
+                    "token_hash": hash_token(row.token),
+                    "created_at": row.created_at,
+                    "expires_at": row.expires_at,
+                }
+                for row in rows
+            ]
+        )
+
+    connection.execute(text("DROP TABLE admin_sessions_old"))
+
+
+def create_admin_session_indexes(connection: Connection):
+    """admin_sessions.expires_at 인덱스 (만료 세션 정리용, 기존 DB에는 없음)"""
+    for index in AdminSession.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def enable_sqlite_incremental_vacuum(connection: Connection):
+    """기존 SQLite 파일에 auto_vacuum=INCREMENTAL 설정 (VACUUM 후 적용됨)"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+
+
+def create_admin_list_indexes(connection: Connection):
+    """admins 목록 페이지네이션/필터 인덱스"""
+    for index in Admin.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def create_user_list_indexes(connection: Connection):
+    """users 목록 페이지네이션/필터 인덱스 (관리자용 사용자 목록)"""
+    for index in User.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def add_row_version_columns(connection: Connection):
+    """users/admins.version 컬럼 추가 (ETag용 행 버전, 기존 행은 1)"""
+    inspector = inspect(connection)
+    for table in ("users", "admins"):
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        if "version" not in columns:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+def create_example_list_indexes(connection: Connection):
+    """examples 목록 페이지네이션/created_at 범위 필터 인덱스"""
+    for index in Example.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def create_example_search_index(connection: Connection):
+    """examples 전문 검색 인덱스 (SQLite FTS5 테이블 + 동기화 트리거, 기존 행 색인)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in EXAMPLES_FTS_DDL:
+        connection.execute(text(statement))
+    connection.execute(text("INSERT INTO examples_fts(examples_fts) VALUES ('rebuild')"))
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "initial schema", create_initial_schema),
+    Migration(2, "admin_sessions token digests", migrate_admin_session_tokens, vacuum=True),
+    Migration(3, "admin_sessions indexes", create_admin_session_indexes),
+    Migration(4, "sqlite incremental auto_vacuum", enable_sqlite_incremental_vacuum, vacuum=True),
+    Migration(5, "admins list indexes", create_admin_list_indexes),
+    Migration(6, "users list indexes", create_user_list_indexes),
+    Migration(7, "users/admins row version", add_row_version_columns),
+    Migration(8, "examples list indexes", create_example_list_indexes),
+    Migration(9, "examples full-text search", create_example_search_index),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+# ============================================
+# 버전 확인 및 실행
+# ============================================
+
+def get_schema_version(connection: Connection) -> int:
+    """적용된 최신 버전 조회 (schema_version 테이블이 없으면 0)"""
+    try:
+        # 콜드 스타트에서 select() 컴파일 비용을 피하려고 문자열 SQL 사용
+        return connection.execute(text("SELECT max(version) FROM schema_version")).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        connection.rollback()
+        return 0
+
+
+def check_schema(engine: Engine) -> int:
+    """서버 시작 시 스키마 버전 확인 (쿼리 1회)
+
+    Raises:
+        SchemaVersionError: 마이그레이션이 적용되지 않았거나 코드보다 최신 스키마인 경우
+    """
+    with engine.connect() as connection:
+        version = get_schema_version(connection)
+
+    if version < SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"DB 스키마 버전({version})이 필요한 버전({SCHEMA_VERSION})보다 낮습니다. "
+            "`python migrate.py`를 먼저 실행하세요"
+        )
+    if version > SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"DB 스키마 버전({version})이 코드가 아는 버전({SCHEMA_VERSION})보다 높습니다"
+        )
+    return version
+
+
+def run_migrations(engine: Engine) -> list[Migration]:
+    """적용되지 않은 마이그레이션을 버전 순서대로 실행 (버전마다 별도 트랜잭션)
+
+    Returns:
+        이번에 적용된 마이그레이션 목록
+    """
+    with engine.begin() as connection:
+        schema_version_table.create(bind=connection, checkfirst=True)
+        current = get_schema_version(connection)
+
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        with engine.begin() as connection:
+            migration.upgrade(connection)
+            connection.execute(schema_version_table.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.utcnow()
+            ))
+        applied.append(migration)
+
+    if engine.dialect.name == "sqlite" and any(migration.vacuum for migration in applied):
+        # VACUUM은 트랜잭션 안에서 실행할 수 없음
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM"))
+
+    return applied
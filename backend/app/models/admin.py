@@ -1,11 +1,16 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func, literal_column
 from app.database import Base
 
 
 class Admin(Base):
     """관리자 모델"""
     __tablename__ = "admins"
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (created_at, id) 및 역할 필터
+        Index("ix_admins_created_at_id", "created_at", "id"),
+        Index("ix_admins_role_created_at_id", "role", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -20,3 +25,9 @@ class Admin(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # 행 버전 (ORM으로 수정할 때마다 UPDATE 문에서 1씩 증가, ETag 생성에 사용)
+    # 낙관적 잠금(version_id_col)이 아니므로 동시 수정도 StaleDataError 없이 둘 다 반영됨
+    version = Column(
+        Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, LargeBinary, DateTime, ForeignKey
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -9,6 +9,7 @@ class AdminSession(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     admin_id = Column(Integer, ForeignKey("admins.id"), nullable=False)
-    token = Column(String(500), unique=True, nullable=False, index=True)
+    # JWT 원문 대신 SHA-256 다이제스트(32바이트) 저장 (app.utils.auth.hash_token)
+    token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import DDL, Column, DateTime, Index, Integer, String, event
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -6,9 +6,44 @@ from app.database import Base
 
 class Example(Base):
     __tablename__ = "examples"
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (created_at, id) 및 created_at 범위 필터
+        Index("ix_examples_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     description = Column(String(500))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+# ============================================
+# 전문 검색 인덱스 (SQLite FTS5)
+# ============================================
+# examples를 원본으로 하는 external content FTS5 테이블을 트리거로 동기화합니다.
+# create_all/drop_all 시 함께 생성/삭제되며, 기존 DB는 마이그레이션에서 생성 후 rebuild합니다.
+
+EXAMPLES_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS examples_fts USING fts5("
+    "name, description, content='examples', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS examples_fts_insert AFTER INSERT ON examples BEGIN "
+    "INSERT INTO examples_fts(rowid, name, description) VALUES (new.id, new.name, new.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS examples_fts_delete AFTER DELETE ON examples BEGIN "
+    "INSERT INTO examples_fts(examples_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS examples_fts_update AFTER UPDATE OF name, description ON examples BEGIN "
+    "INSERT INTO examples_fts(examples_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO examples_fts(rowid, name, description) VALUES (new.id, new.name, new.description); "
+    "END",
+)
+
+for statement in EXAMPLES_FTS_DDL:
+    event.listen(Example.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Example.__table__, "before_drop", DDL("DROP TABLE IF EXISTS examples_fts").execute_if(dialect="sqlite")
+)
@@ -1,11 +1,18 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func, literal_column
 
 from app.database import Base
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # 관리자용 사용자 목록 키셋 페이지네이션 (created_at, id) 및 필터
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_is_active_created_at_id", "is_active", "created_at", "id"),
+        Index("ix_users_enable_2fa_created_at_id", "enable_2fa", "created_at", "id"),
+        Index("ix_users_auth_profile_created_at_id", "auth_profile_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -19,3 +26,9 @@ class User(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # 행 버전 (ORM으로 수정할 때마다 UPDATE 문에서 1씩 증가, ETag 생성에 사용)
+    # 낙관적 잠금(version_id_col)이 아니므로 동시 수정도 StaleDataError 없이 둘 다 반영됨
+    version = Column(
+        Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1
+    )
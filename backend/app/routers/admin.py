@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select, delete, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import load_only
 from datetime import datetime, timedelta
-from typing import List
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_async_db, get_async_read_db, get_async_read_sessionmaker, replica_set
 from app.models.admin import Admin
 from app.models.admin_session import AdminSession
 from app.models.user import User
@@ -13,46 +17,112 @@ from app.schemas.admin import (
     AdminLogin,
     AdminResponse,
     AdminUpdate,
-    AdminToken
+    AdminToken,
+    AdminPrincipal,
+    AdminPage
 )
 from app.schemas.two_factor import User2FASettings
+from app.schemas.user import UserPage
 from app.dependencies.admin_auth import (
     get_current_active_admin,
     get_super_admin,
+    get_admin_session_cache,
+    invalidate_admin_session,
+    invalidate_admin_sessions,
     oauth2_scheme_admin
 )
+from app.dependencies.auth import get_principal_cache, invalidate_user_principal
+from app.routers.examples import get_example_count_cache
 from app.utils.auth import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
+    password_needs_rehash,
     create_access_token,
+    get_token_cache,
+    hash_token,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
+from app.utils.password_hashing import get_password_hasher
+from app.utils.admin_utils import get_session_reaper
+from app.utils.pool_metrics import get_pool_stats
+from app.utils.cache import TTLCache
+from app.utils.export import export_response
+from app.utils.user_import import UserImporter, iter_records
+from app.utils.pagination import keyset_after, prefix_match_any, split_page
+from app.utils.etag import conditional_response, make_etag
+from app.utils.profiling import (
+    collapsed_text,
+    create_profile_token,
+    get_profile_store
+)
+from app.utils.rate_limit import client_ip, get_login_throttle, login_account_key
+from app.utils.responses import model_response, orm_response, page_response
 from app.utils.exceptions import (
     UnauthorizedException,
     ForbiddenException,
     NotFoundException,
-    BadRequestException
+    BadRequestException,
+    raise_for_integrity_error
 )
 
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
+# 관리자 목록 전체 개수 캐시 (필터 조건 → 개수, 관리자 생성/수정/삭제 시 비움)
+_admin_count_cache = TTLCache(
+    maxsize=256, default_ttl=float(os.getenv("ADMIN_COUNT_CACHE_TTL", "30"))
+)
+
+
+# 사용자 목록 전체 개수 캐시 (사용자 수가 많으므로 매 요청 COUNT 하지 않음)
+_app_user_count_cache = TTLCache(
+    maxsize=256, default_ttl=float(os.getenv("APP_USER_COUNT_CACHE_TTL", "60"))
+)
+
+
+# 사용자 가져오기 배치 크기 (배치마다 중복 확인 2회 + INSERT 1회 + 커밋)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+
+
+def get_admin_count_cache() -> TTLCache:
+    """관리자 목록 개수 캐시 조회 (통계 및 테스트용)"""
+    return _admin_count_cache
+
+
+def get_app_user_count_cache() -> TTLCache:
+    """사용자 목록 개수 캐시 조회 (통계 및 테스트용)"""
+    return _app_user_count_cache
+
 
 # ============================================
 # 인증 엔드포인트
 # ============================================
 
 @router.post("/auth/login", response_model=AdminToken)
-def admin_login(admin_login: AdminLogin, db: Session = Depends(get_db)):
-    """관리자 로그인 (JWT + 세션 생성)"""
+async def admin_login(request: Request, admin_login: AdminLogin, db: AsyncSession = Depends(get_async_db)):
+    """관리자 로그인 (JWT + 세션 생성)
+
+    IP별 시도 횟수/계정별 실패 잠금을 넘으면 DB 조회 전에 429 (Retry-After)로 거부합니다.
+    """
+    throttle = get_login_throttle()
+    account = login_account_key("admin", admin_login.email)
+    throttle.check(client_ip(request), account)
+
     # 1. 관리자 조회
-    admin = db.query(Admin).filter(Admin.email == admin_login.email).first()
+    admin = await db.scalar(select(Admin).where(Admin.email == admin_login.email))
     if not admin:
+        throttle.record_failure(account)
         raise UnauthorizedException("이메일 또는 비밀번호가 올바르지 않습니다")
 
     # 2. 비밀번호 검증
-    if not verify_password(admin_login.password, admin.hashed_password):
+    if not await verify_password_async(admin_login.password, admin.hashed_password):
+        throttle.record_failure(account)
         raise UnauthorizedException("이메일 또는 비밀번호가 올바르지 않습니다")
+    throttle.record_success(account)
+
+    # 레거시/저비용 해시는 새 형식으로 재해싱 (세션 저장과 함께 커밋)
+    if password_needs_rehash(admin.hashed_password):
+        admin.hashed_password = await hash_password_async(admin_login.password)
 
     # 3. 활성 상태 확인
     if not admin.is_active:
@@ -65,35 +135,38 @@ def admin_login(admin_login: AdminLogin, db: Session = Depends(get_db)):
     expires_at = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     session = AdminSession(
         admin_id=admin.id,
-        token=token,
+        token_hash=hash_token(token),
         expires_at=expires_at
     )
     db.add(session)
-    db.commit()
+    await db.commit()
 
     return AdminToken(access_token=token, role=admin.role)
 
 
 @router.post("/auth/logout")
-def admin_logout(
-    current_admin: Admin = Depends(get_current_active_admin),
+async def admin_logout(
+    current_admin: AdminPrincipal = Depends(get_current_active_admin),
     token: str = Depends(oauth2_scheme_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """관리자 로그아웃 (세션 삭제)"""
     # 세션 삭제
-    db.query(AdminSession).filter(AdminSession.token == token).delete()
-    db.commit()
+    await db.execute(delete(AdminSession).where(AdminSession.token_hash == hash_token(token)))
+    await db.commit()
+    invalidate_admin_session(token)
 
     return {"message": "로그아웃되었습니다"}
 
 
 @router.get("/users/me", response_model=AdminResponse)
-def get_current_admin_profile(
-    current_admin: Admin = Depends(get_current_active_admin)
+async def get_current_admin_profile(
+    request: Request,
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
 ):
-    """현재 로그인한 관리자 프로필 조회"""
-    return current_admin
+    """현재 로그인한 관리자 프로필 조회 (행 버전 ETag, 변경 없으면 304)"""
+    etag = make_etag("admin", current_admin.id, current_admin.version)
+    return conditional_response(request, etag, lambda: orm_response(AdminResponse, current_admin))
 
 
 # ============================================
@@ -101,98 +174,116 @@ def get_current_admin_profile(
 # ============================================
 
 @router.post("/users", response_model=AdminResponse, status_code=status.HTTP_201_CREATED)
-def create_admin(
+async def create_admin(
     admin_create: AdminCreate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_super_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: AdminPrincipal = Depends(get_super_admin)
 ):
-    """관리자 생성 (슈퍼 관리자 전용)"""
-    # 이메일 중복 확인
-    existing_email = db.query(Admin).filter(Admin.email == admin_create.email).first()
-    if existing_email:
-        raise BadRequestException("이미 등록된 이메일입니다")
-
-    # 사용자명 중복 확인
-    existing_username = db.query(Admin).filter(Admin.username == admin_create.username).first()
-    if existing_username:
-        raise BadRequestException("이미 사용 중인 사용자명입니다")
-
-    # 관리자 생성
+    """관리자 생성 (슈퍼 관리자 전용, 중복은 유니크 제약으로 확인)"""
     new_admin = Admin(
         email=admin_create.email,
         username=admin_create.username,
-        hashed_password=hash_password(admin_create.password),
+        hashed_password=await hash_password_async(admin_create.password),
         role=admin_create.role,
         is_active=True
     )
     db.add(new_admin)
-    db.commit()
-    db.refresh(new_admin)
-
-    return new_admin
-
-
-@router.get("/users", response_model=List[AdminResponse])
-def list_admins(
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_super_admin),
-    skip: int = 0,
-    limit: int = 100
+    try:
+        # id/created_at은 INSERT ... RETURNING으로 채워지므로 refresh 불필요
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_integrity_error(exc)
+    _admin_count_cache.clear()
+
+    return orm_response(AdminResponse, new_admin, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/users", response_model=AdminPage)
+async def list_admins(
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_admin: AdminPrincipal = Depends(get_super_admin),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    q: Optional[str] = Query(None, min_length=1, description="이메일/사용자명 접두사 (대소문자 구분)")
 ):
-    """관리자 목록 조회 (슈퍼 관리자 전용)"""
-    admins = db.query(Admin).offset(skip).limit(limit).all()
-    return admins
+    """관리자 목록 조회 (슈퍼 관리자 전용, (created_at, id) 순 커서 페이지네이션)
+
+    ETag는 페이지 행의 (id, version)과 total/next_cursor로 만들어
+    직렬화 없이 304 여부를 판단합니다.
+    """
+    filters = []
+    if role is not None:
+        filters.append(Admin.role == role)
+    if is_active is not None:
+        filters.append(Admin.is_active == is_active)
+    if q:
+        filters.append(prefix_match_any((Admin.email, Admin.username), q))
+
+    query = select(Admin).options(
+        load_only(
+            Admin.id, Admin.email, Admin.username, Admin.role, Admin.is_active, Admin.created_at, Admin.version
+        )
+    ).where(*filters)
+    if cursor:
+        query = query.where(keyset_after(Admin.created_at, Admin.id, cursor))
+
+    # limit + 1개 조회로 다음 페이지 존재 여부 확인
+    result = await db.scalars(query.order_by(Admin.created_at, Admin.id).limit(limit + 1))
+    admins, next_cursor = split_page(result.all(), limit)
+
+    count_key = (role, is_active, q)
+    total = _admin_count_cache.get(count_key)
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(Admin).where(*filters))
+        _admin_count_cache.set(count_key, total)
+
+    etag = make_etag("admins", total, next_cursor, *(f"{admin.id}:{admin.version}" for admin in admins))
+    return conditional_response(request, etag, lambda: page_response(AdminResponse, admins, total, next_cursor))
 
 
 @router.get("/users/{admin_id}", response_model=AdminResponse)
-def get_admin(
+async def get_admin(
     admin_id: int,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_super_admin)
+    db: AsyncSession = Depends(get_async_read_db),
+    current_admin: AdminPrincipal = Depends(get_super_admin)
 ):
     """관리자 상세 조회 (슈퍼 관리자 전용)"""
-    admin = db.query(Admin).filter(Admin.id == admin_id).first()
+    admin = await db.get(Admin, admin_id)
     if not admin:
         raise NotFoundException("관리자를 찾을 수 없습니다")
 
-    return admin
+    return orm_response(AdminResponse, admin)
 
 
 @router.put("/users/{admin_id}", response_model=AdminResponse)
-def update_admin(
+async def update_admin(
     admin_id: int,
     admin_update: AdminUpdate,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_super_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: AdminPrincipal = Depends(get_super_admin)
 ):
-    """관리자 수정 (슈퍼 관리자 전용)"""
-    admin = db.query(Admin).filter(Admin.id == admin_id).first()
+    """관리자 수정 (슈퍼 관리자 전용, 이메일/사용자명 중복은 유니크 제약으로 확인)"""
+    admin = await db.get(Admin, admin_id)
     if not admin:
         raise NotFoundException("관리자를 찾을 수 없습니다")
 
     # 업데이트할 필드만 적용
     update_data = admin_update.model_dump(exclude_unset=True)
 
-    # 이메일 중복 확인
-    if "email" in update_data and update_data["email"] != admin.email:
-        existing_email = db.query(Admin).filter(Admin.email == update_data["email"]).first()
-        if existing_email:
-            raise BadRequestException("이미 등록된 이메일입니다")
-
-    # 사용자명 중복 확인
-    if "username" in update_data and update_data["username"] != admin.username:
-        existing_username = db.query(Admin).filter(Admin.username == update_data["username"]).first()
-        if existing_username:
-            raise BadRequestException("이미 사용 중인 사용자명입니다")
-
     # role 변경 시 최소 1명의 슈퍼 관리자 유지 검증
     if "role" in update_data and admin.role == "super_admin" and update_data["role"] != "super_admin":
         # 다른 슈퍼 관리자가 있는지 확인 (현재 관리자 제외)
-        other_super_admins = db.query(Admin).filter(
-            Admin.role == "super_admin",
-            Admin.id != admin_id,
-            Admin.is_active == True
-        ).count()
+        other_super_admins = await db.scalar(
+            select(func.count(Admin.id)).where(
+                Admin.role == "super_admin",
+                Admin.id != admin_id,
+                Admin.is_active == True
+            )
+        )
 
         if other_super_admins == 0:
             raise BadRequestException("시스템에 최소 1명의 슈퍼 관리자가 필요합니다")
@@ -201,20 +292,25 @@ def update_admin(
     for key, value in update_data.items():
         setattr(admin, key, value)
 
-    db.commit()
-    db.refresh(admin)
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise_for_integrity_error(exc)
+    invalidate_admin_sessions(admin.id)
+    _admin_count_cache.clear()
 
-    return admin
+    return orm_response(AdminResponse, admin)
 
 
 @router.delete("/users/{admin_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_admin(
+async def delete_admin(
     admin_id: int,
-    db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_super_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: AdminPrincipal = Depends(get_super_admin)
 ):
     """관리자 삭제 (슈퍼 관리자 전용)"""
-    admin = db.query(Admin).filter(Admin.id == admin_id).first()
+    admin = await db.get(Admin, admin_id)
     if not admin:
         raise NotFoundException("관리자를 찾을 수 없습니다")
 
@@ -224,18 +320,22 @@ def delete_admin(
 
     # 슈퍼 관리자 삭제 시 최소 1명 유지 검증
     if admin.role == "super_admin":
-        other_super_admins = db.query(Admin).filter(
-            Admin.role == "super_admin",
-            Admin.id != admin_id,
-            Admin.is_active == True
-        ).count()
+        other_super_admins = await db.scalar(
+            select(func.count(Admin.id)).where(
+                Admin.role == "super_admin",
+                Admin.id != admin_id,
+                Admin.is_active == True
+            )
+        )
 
         if other_super_admins == 0:
             raise BadRequestException("시스템에 최소 1명의 슈퍼 관리자가 필요합니다")
 
     # 관리자 삭제
-    db.delete(admin)
-    db.commit()
+    await db.delete(admin)
+    await db.commit()
+    invalidate_admin_sessions(admin_id)
+    _admin_count_cache.clear()
 
     return None
 
@@ -245,15 +345,15 @@ def delete_admin(
 # ============================================
 
 @router.put("/users/{user_id}/2fa", response_model=dict)
-def admin_update_user_2fa(
+async def admin_update_user_2fa(
     user_id: int,
     settings: User2FASettings,
-    current_admin: Admin = Depends(get_current_active_admin),
-    db: Session = Depends(get_db)
+    current_admin: AdminPrincipal = Depends(get_current_active_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """관리자가 사용자의 2차 인증 설정 변경"""
     # 사용자 조회
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise NotFoundException("사용자를 찾을 수 없습니다")
 
@@ -263,7 +363,7 @@ def admin_update_user_2fa(
             raise BadRequestException("2차 인증을 활성화하려면 인증 프로필을 선택해야 합니다")
 
         # 인증 프로필 존재 및 활성화 확인
-        profile = db.query(AuthProfile).filter(AuthProfile.id == settings.auth_profile_id).first()
+        profile = await db.get(AuthProfile, settings.auth_profile_id)
         if not profile:
             raise NotFoundException("인증 프로필을 찾을 수 없습니다")
         if not profile.is_active:
@@ -273,7 +373,9 @@ def admin_update_user_2fa(
     user.enable_2fa = settings.enable_2fa
     user.auth_profile_id = settings.auth_profile_id if settings.enable_2fa else None
 
-    db.commit()
+    await db.commit()
+    invalidate_user_principal(user.id)
+    _app_user_count_cache.clear()
 
     return {
         "message": f"사용자 '{user.username}'의 2차 인증 설정이 업데이트되었습니다",
@@ -281,3 +383,254 @@ def admin_update_user_2fa(
         "enable_2fa": user.enable_2fa,
         "auth_profile_id": user.auth_profile_id
     }
+
+
+# ============================================
+# 사용자 디렉터리 엔드포인트 (관리자 전용)
+# ============================================
+
+# fields로 선택할 수 있는 사용자 컬럼 (id, created_at은 커서용으로 항상 조회)
+APP_USER_FIELDS = {
+    "email": User.email,
+    "username": User.username,
+    "is_active": User.is_active,
+    "enable_2fa": User.enable_2fa,
+    "auth_profile_id": User.auth_profile_id,
+    "created_at": User.created_at,
+    "updated_at": User.updated_at,
+}
+APP_USER_DEFAULT_FIELDS = "email,username,is_active,enable_2fa,created_at"
+
+
+@router.get("/app-users", response_model=UserPage, response_model_exclude_unset=True)
+async def list_app_users(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_admin: AdminPrincipal = Depends(get_current_active_admin),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    q: Optional[str] = Query(None, min_length=1, description="이메일/사용자명 접두사 (대소문자 구분)"),
+    is_active: Optional[bool] = None,
+    enable_2fa: Optional[bool] = None,
+    auth_profile_id: Optional[int] = None,
+    fields: str = Query(APP_USER_DEFAULT_FIELDS, description="응답에 포함할 컬럼 (쉼표 구분)")
+):
+    """사용자 목록 조회 ((created_at, id) 순 커서 페이지네이션, 요청한 컬럼만 조회)"""
+    requested = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in APP_USER_FIELDS]
+    if unknown:
+        raise BadRequestException(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+    filters = []
+    if q:
+        filters.append(prefix_match_any((User.email, User.username), q))
+    if is_active is not None:
+        filters.append(User.is_active == is_active)
+    if enable_2fa is not None:
+        filters.append(User.enable_2fa == enable_2fa)
+    if auth_profile_id is not None:
+        filters.append(User.auth_profile_id == auth_profile_id)
+
+    columns = [User.id, User.created_at] + [
+        APP_USER_FIELDS[name] for name in requested if name != "created_at"
+    ]
+    query = select(*columns).where(*filters)
+    if cursor:
+        query = query.where(keyset_after(User.created_at, User.id, cursor))
+
+    result = await db.execute(query.order_by(User.created_at, User.id).limit(limit + 1))
+    rows, next_cursor = split_page(result.all(), limit)
+
+    count_key = (q, is_active, enable_2fa, auth_profile_id)
+    total = _app_user_count_cache.get(count_key)
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(User).where(*filters))
+        _app_user_count_cache.set(count_key, total)
+
+    keys = ["id"] + requested
+    items = [{key: row._mapping[key] for key in keys} for row in rows]
+    return model_response(UserPage, {"items": items, "total": total, "next_cursor": next_cursor}, exclude_unset=True)
+
+
+@router.post("/app-users/import", response_model=dict)
+async def import_app_users(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: AdminPrincipal = Depends(get_super_admin),
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$")
+):
+    """사용자 일괄 가져오기 (슈퍼 관리자 전용)
+
+    본문은 NDJSON(한 줄에 {"email", "username", "password"}) 또는
+    헤더가 있는 CSV이며, 스트리밍으로 읽어 배치 단위로 저장합니다.
+    실패한 행은 건너뛰고 행별 결과를 반환합니다.
+    """
+    importer = UserImporter(db, batch_size=IMPORT_BATCH_SIZE)
+    report = await importer.run(iter_records(request.stream(), fmt))
+    if report["created"]:
+        _app_user_count_cache.clear()
+    return report
+
+
+# ============================================
+# 내보내기 엔드포인트 (NDJSON/CSV 스트리밍)
+# ============================================
+
+USER_EXPORT_COLUMNS = (
+    User.id, User.email, User.username, User.is_active, User.enable_2fa,
+    User.auth_profile_id, User.created_at, User.updated_at
+)
+ADMIN_EXPORT_COLUMNS = (
+    Admin.id, Admin.email, Admin.username, Admin.role, Admin.is_active, Admin.enable_2fa,
+    Admin.auth_profile_id, Admin.created_at, Admin.updated_at
+)
+
+
+@router.get("/export/users")
+async def export_users(
+    current_admin: AdminPrincipal = Depends(get_current_active_admin),
+    session_factory: async_sessionmaker = Depends(get_async_read_sessionmaker),
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    gzip: bool = False
+):
+    """사용자 전체 내보내기 (id 순, 비밀번호 해시 제외)"""
+    query = select(*USER_EXPORT_COLUMNS).order_by(User.id)
+    return export_response(session_factory, query, "users", fmt, gzip)
+
+
+@router.get("/export/admins")
+async def export_admins(
+    current_admin: AdminPrincipal = Depends(get_super_admin),
+    session_factory: async_sessionmaker = Depends(get_async_read_sessionmaker),
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    gzip: bool = False
+):
+    """관리자 전체 내보내기 (슈퍼 관리자 전용, id 순, 비밀번호 해시 제외)"""
+    query = select(*ADMIN_EXPORT_COLUMNS).order_by(Admin.id)
+    return export_response(session_factory, query, "admins", fmt, gzip)
+
+
+# ============================================
+# 시스템 상태 엔드포인트 (슈퍼 관리자 전용)
+# ============================================
+
+@router.get("/system/password-hasher", response_model=dict)
+async def get_password_hasher_stats(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """비밀번호 해싱 풀 상태 조회 (큐 깊이, 지연 시간)"""
+    return get_password_hasher().stats()
+
+
+@router.get("/system/caches", response_model=dict)
+async def get_cache_stats(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """인메모리 캐시 적중률 조회"""
+    return {
+        "jwt": get_token_cache().stats(),
+        "user_principal": get_principal_cache().stats(),
+        "admin_session": get_admin_session_cache().stats(),
+        "admin_count": _admin_count_cache.stats(),
+        "app_user_count": _app_user_count_cache.stats(),
+        "example_count": get_example_count_cache().stats(),
+    }
+
+
+@router.get("/system/session-reaper", response_model=dict)
+async def get_session_reaper_stats(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """만료 세션 정리 현황 조회 (회수된 행 수, 잠금 시간)"""
+    return get_session_reaper().stats()
+
+
+@router.get("/system/login-throttle", response_model=dict)
+async def get_login_throttle_stats(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """로그인 시도 제한 통계 (IP별/계정별 허용·거부 횟수)"""
+    return get_login_throttle().stats()
+
+
+@router.get("/system/db-pool", response_model=dict)
+async def get_db_pool_stats(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """DB 커넥션 풀 상태 조회 (대출 중 연결, 대기 시간, overflow)"""
+    return get_pool_stats()
+
+
+@router.get("/system/replicas", response_model=dict)
+async def get_replica_stats(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """읽기 복제본 상태 조회 (지연 시간, primary 대체 횟수)"""
+    return replica_set.stats()
+
+
+# ============================================
+# 요청 프로파일링 (슈퍼 관리자 전용)
+# ============================================
+
+def _collapsed_response(body: str, filename: str) -> Response:
+    """collapsed stack 텍스트 다운로드 응답 (flamegraph.pl, speedscope 호환)"""
+    return Response(
+        body,
+        media_type="text/plain",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.post("/system/profiles/token", response_model=dict)
+async def issue_profile_token(
+    current_admin: AdminPrincipal = Depends(get_super_admin),
+    token: str = Depends(oauth2_scheme_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """프로파일 토큰 발급 (요청에 X-Profile-Token 헤더로 붙이면 해당 요청을 프로파일)
+
+    토큰은 현재 관리자 세션에 묶이므로 로그아웃, 강등, 비활성화, 삭제 시 즉시 무효가 됩니다.
+    """
+    session_id = await db.scalar(
+        select(AdminSession.id).where(AdminSession.token_hash == hash_token(token))
+    )
+    if session_id is None:
+        raise UnauthorizedException("세션이 만료되었거나 유효하지 않습니다")
+    profile_token, expires_at = create_profile_token(current_admin.email, session_id)
+    return {"header": "X-Profile-Token", "token": profile_token, "expires_at": expires_at}
+
+
+@router.get("/system/profiles", response_model=dict)
+async def list_profiles(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """보관 중인 프로파일 목록 (최근 순, 스택 제외)"""
+    return {"items": [profile.summary() for profile in get_profile_store().list()]}
+
+
+@router.get("/system/profiles/collapsed")
+async def download_all_profiles(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """보관 중인 모든 프로파일을 합친 collapsed stack"""
+    return _collapsed_response(collapsed_text(get_profile_store().list()), "profiles.collapsed.txt")
+
+
+@router.get("/system/profiles/{profile_id}/collapsed")
+async def download_profile(
+    profile_id: int,
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """프로파일 하나의 collapsed stack"""
+    profile = get_profile_store().get(profile_id)
+    if profile is None:
+        raise NotFoundException("프로파일을 찾을 수 없습니다")
+    return _collapsed_response(collapsed_text([profile]), f"profile-{profile_id}.collapsed.txt")
+
+
+@router.delete("/system/profiles", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_profiles(
+    current_admin: AdminPrincipal = Depends(get_super_admin)
+):
+    """보관 중인 프로파일 삭제"""
+    get_profile_store().clear()
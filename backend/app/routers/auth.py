@@ -1,5 +1,6 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -16,11 +17,20 @@ from app.schemas import (
 from app.utils.auth import (
     hash_password,
     verify_password,
+    password_needs_rehash,
     create_access_token,
     create_temp_token,
     verify_temp_token
 )
-from app.utils.exceptions import BadRequestException, UnauthorizedException, ForbiddenException
+from app.utils.exceptions import (
+    BadRequestException,
+    UnauthorizedException,
+    ForbiddenException,
+    raise_for_integrity_error
+)
+from app.utils.metrics import TWO_FACTOR_VERIFICATIONS
+from app.utils.rate_limit import client_ip, get_login_throttle, login_account_key
+from app.utils.responses import orm_response
 from app.services.external_auth import verify_external_auth
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
@@ -28,44 +38,56 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
-    """회원가입"""
-    # 이메일 중복 체크
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise BadRequestException("이미 등록된 이메일입니다")
-
-    # 사용자명 중복 체크
-    existing_username = db.query(User).filter(User.username == user_data.username).first()
-    if existing_username:
-        raise BadRequestException("이미 사용 중인 사용자명입니다")
-
-    # 비밀번호 해싱 및 사용자 생성
-    hashed_password = hash_password(user_data.password)
+    """회원가입
+
+    이메일/사용자명 중복은 유니크 제약으로 확인합니다 (INSERT 1회 + 커밋).
+    """
     new_user = User(
         email=user_data.email,
         username=user_data.username,
-        hashed_password=hashed_password,
+        hashed_password=hash_password(user_data.password),
         is_active=True
     )
-
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    try:
+        # INSERT ... RETURNING으로 id/created_at을 받아 커밋 전에 응답 생성
+        # (커밋 후 만료된 속성을 다시 조회하지 않음)
+        db.flush()
+        response = UserResponse.model_validate(new_user)
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise_for_integrity_error(exc)
 
-    return new_user
+    return orm_response(UserResponse, response, status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=LoginResponse)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
-    """로그인 (1차 인증)"""
+def login(request: Request, user_credentials: UserLogin, db: Session = Depends(get_db)):
+    """로그인 (1차 인증)
+
+    IP별 시도 횟수/계정별 실패 잠금을 넘으면 DB 조회 전에 429 (Retry-After)로 거부합니다.
+    """
+    throttle = get_login_throttle()
+    account = login_account_key("user", user_credentials.email)
+    throttle.check(client_ip(request), account)
+
     # 이메일로 사용자 조회
     user = db.query(User).filter(User.email == user_credentials.email).first()
     if not user:
+        throttle.record_failure(account)
         raise UnauthorizedException("이메일 또는 비밀번호가 올바르지 않습니다")
 
     # 비밀번호 검증
     if not verify_password(user_credentials.password, user.hashed_password):
+        throttle.record_failure(account)
         raise UnauthorizedException("이메일 또는 비밀번호가 올바르지 않습니다")
+    throttle.record_success(account)
+
+    # 레거시/저비용 해시는 새 형식으로 재해싱
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = hash_password(user_credentials.password)
+        db.commit()
 
     # 활성 사용자 확인
     if not user.is_active:
@@ -93,11 +115,15 @@ def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/verify-2fa", response_model=TwoFactorAuthResponse)
-def verify_2fa(auth_request: TwoFactorAuthRequest, db: Session = Depends(get_db)):
-    """2차 인증 검증"""
-    # 임시 토큰 검증 및 이메일 추출
+def verify_2fa(request: Request, auth_request: TwoFactorAuthRequest, db: Session = Depends(get_db)):
+    """2차 인증 검증 (로그인과 같은 IP별 제한 + 계정별 2차 인증 실패 잠금)"""
+    # 임시 토큰 검증 및 이메일 추출 (서명 확인만 하므로 시도 제한보다 먼저 수행)
     email = verify_temp_token(auth_request.temp_token)
 
+    throttle = get_login_throttle()
+    account = login_account_key("2fa", email)
+    throttle.check(client_ip(request), account)
+
     # 사용자 조회
     user = db.query(User).filter(User.email == email).first()
     if not user:
@@ -116,7 +142,11 @@ def verify_2fa(auth_request: TwoFactorAuthRequest, db: Session = Depends(get_db)
     )
 
     if not success:
+        TWO_FACTOR_VERIFICATIONS.inc("failure")
+        throttle.record_failure(account)
         raise UnauthorizedException(f"2차 인증 실패: {error_msg}")
+    TWO_FACTOR_VERIFICATIONS.inc("success")
+    throttle.record_success(account)
 
     # 인증 성공: 최종 JWT 토큰 발급
     access_token = create_access_token(data={"sub": user.email})
@@ -1,24 +1,201 @@
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db, get_async_read_sessionmaker
+from app.dependencies.admin_auth import get_current_active_admin
 from app.models import Example
-from app.schemas import ExampleCreate, ExampleResponse
+from app.schemas import (
+    ExampleBulkCreate,
+    ExampleBulkCreateResult,
+    ExampleBulkDelete,
+    ExampleBulkDeleteResult,
+    ExampleCreate,
+    ExamplePage,
+    ExampleResponse
+)
+from app.schemas.admin import AdminPrincipal
+from app.utils.cache import TTLCache
+from app.utils.etag import conditional_response, make_etag
+from app.utils.exceptions import BadRequestException
+from app.utils.export import export_response
+from app.utils.pagination import created_range, keyset_after, split_page
+from app.utils.responses import orm_response, page_response
+from app.utils.search import example_matches, search_page_query, split_search_page
 
 router = APIRouter(prefix="/api/examples", tags=["examples"])
 
+# 한 페이지 최대 행 수 (전체가 필요하면 /export 스트리밍 사용)
+EXAMPLES_MAX_LIMIT = int(os.getenv("EXAMPLES_MAX_LIMIT", "500"))
+
+# 일괄 생성/삭제 시 트랜잭션 하나에서 처리할 행 수 (배치마다 커밋해 쓰기 잠금 시간 제한)
+EXAMPLES_BULK_BATCH_SIZE = int(os.getenv("EXAMPLES_BULK_BATCH_SIZE", "1000"))
+
+# 목록 전체 개수 캐시 (created_at 범위 → 개수, 생성/삭제 시 비움)
+_example_count_cache = TTLCache(
+    maxsize=256, default_ttl=float(os.getenv("EXAMPLE_COUNT_CACHE_TTL", "30"))
+)
+
+
+def get_example_count_cache() -> TTLCache:
+    """예제 목록 개수 캐시 조회 (통계 및 테스트용)"""
+    return _example_count_cache
+
+
+@router.get("/", response_model=ExamplePage)
+def get_examples(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=EXAMPLES_MAX_LIMIT),
+    created_after: Optional[datetime] = Query(None, description="이 시각 이후 생성 (포함)"),
+    created_before: Optional[datetime] = Query(None, description="이 시각 이전 생성 (미포함)")
+):
+    """예제 목록 ((created_at, id) 순 커서 페이지네이션, 페이지 행으로 ETag)"""
+    filters = created_range(Example.created_at, created_after, created_before)
+    query = select(Example).where(*filters)
+    if cursor:
+        query = query.where(keyset_after(Example.created_at, Example.id, cursor))
+
+    rows = db.scalars(query.order_by(Example.created_at, Example.id).limit(limit + 1)).all()
+    examples, next_cursor = split_page(rows, limit)
+
+    count_key = (created_after, created_before)
+    total = _example_count_cache.get(count_key)
+    if total is None:
+        total = db.scalar(select(func.count()).select_from(Example).where(*filters))
+        _example_count_cache.set(count_key, total)
+
+    etag = make_etag("examples", total, next_cursor, *(f"{e.id}:{e.updated_at}" for e in examples))
+    return conditional_response(request, etag, lambda: page_response(ExampleResponse, examples, total, next_cursor))
+
+
+@router.get("/export")
+async def export_examples(
+    session_factory: async_sessionmaker = Depends(get_async_read_sessionmaker),
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    gzip: bool = False,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+):
+    """예제 전체 스트리밍 내보내기 ((created_at, id) 순, 메모리 사용량 일정)"""
+    query = select(
+        Example.id, Example.name, Example.description, Example.created_at, Example.updated_at
+    ).where(
+        *created_range(Example.created_at, created_after, created_before)
+    ).order_by(Example.created_at, Example.id)
+    return export_response(session_factory, query, "examples", fmt, gzip)
+
+
+@router.get("/search", response_model=ExamplePage)
+def search_examples(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (단어마다 접두사 일치, 모든 단어 포함)"),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=EXAMPLES_MAX_LIMIT)
+):
+    """예제 전문 검색 (SQLite FTS5 bm25 순위, (rank, id) 키셋 커서)"""
+    matches = example_matches(db.get_bind().dialect.name, q)
+    rows = db.execute(search_page_query(matches, cursor, limit)).all()
+    page, next_cursor = split_search_page(rows, limit)
+
+    by_id = {}
+    if page:
+        by_id = {e.id: e for e in db.scalars(select(Example).where(Example.id.in_([row.id for row in page])))}
+    examples = [by_id[row.id] for row in page if row.id in by_id]
+
+    count_key = ("search", q)
+    total = _example_count_cache.get(count_key)
+    if total is None:
+        total = db.scalar(select(func.count()).select_from(matches))
+        _example_count_cache.set(count_key, total)
+
+    etag = make_etag("examples-search", total, next_cursor, *(f"{e.id}:{e.updated_at}" for e in examples))
+    return conditional_response(request, etag, lambda: page_response(ExampleResponse, examples, total, next_cursor))
+
+
+# ============================================
+# 일괄 생성/삭제
+# ============================================
+
+@router.post("/bulk", response_model=ExampleBulkCreateResult, status_code=status.HTTP_201_CREATED)
+def bulk_create_examples(
+    payload: ExampleBulkCreate,
+    db: Session = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
+):
+    """예제 일괄 생성 (관리자 전용, 배치마다 executemany INSERT ... RETURNING 1회 + 커밋)"""
+    ids = []
+    for start in range(0, len(payload.items), EXAMPLES_BULK_BATCH_SIZE):
+        batch = payload.items[start:start + EXAMPLES_BULK_BATCH_SIZE]
+        result = db.execute(insert(Example).returning(Example.id), [item.model_dump() for item in batch])
+        ids.extend(result.scalars().all())
+        db.commit()
+
+    _example_count_cache.clear()
+    ids.sort()
+    return {"created": len(ids), "ids": ids}
+
+
+def delete_example_batch(db: Session, filters: list, batch_size: int) -> int:
+    """조건에 맞는 예제를 최대 batch_size개 삭제 후 커밋
+
+    Returns:
+        삭제된 개수
+    """
+    batch_ids = select(Example.id).where(*filters).order_by(Example.id).limit(batch_size)
+    deleted = db.execute(
+        delete(Example).where(Example.id.in_(batch_ids)).execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return deleted
+
+
+@router.delete("/bulk", response_model=ExampleBulkDeleteResult)
+def bulk_delete_examples(
+    payload: ExampleBulkDelete,
+    db: Session = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_active_admin)
+):
+    """예제 일괄 삭제 (관리자 전용, id 목록 또는 created_at 범위, 배치 단위로 커밋)"""
+    filters = created_range(Example.created_at, payload.created_after, payload.created_before)
+    if payload.ids is None and not filters:
+        raise BadRequestException("삭제할 id 목록 또는 created_at 범위를 지정해야 합니다")
+
+    deleted = 0
+    if payload.ids is not None:
+        # id 목록은 배치 크기로 나눠 IN 조건 하나씩
+        for start in range(0, len(payload.ids), EXAMPLES_BULK_BATCH_SIZE):
+            batch_ids = payload.ids[start:start + EXAMPLES_BULK_BATCH_SIZE]
+            deleted += delete_example_batch(db, [Example.id.in_(batch_ids), *filters], EXAMPLES_BULK_BATCH_SIZE)
+    else:
+        while True:
+            batch_deleted = delete_example_batch(db, filters, EXAMPLES_BULK_BATCH_SIZE)
+            deleted += batch_deleted
+            if batch_deleted < EXAMPLES_BULK_BATCH_SIZE:
+                break
+
+    if deleted:
+        _example_count_cache.clear()
+    return {"deleted": deleted}
 
-@router.get("/", response_model=list[ExampleResponse])
-def get_examples(db: Session = Depends(get_db)):
-    return db.query(Example).all()
 
+# ============================================
+# 단건 조회/생성/삭제
+# ============================================
 
 @router.get("/{example_id}", response_model=ExampleResponse)
-def get_example(example_id: int, db: Session = Depends(get_db)):
+def get_example(example_id: int, db: Session = Depends(get_read_db)):
     example = db.query(Example).filter(Example.id == example_id).first()
     if not example:
         raise HTTPException(status_code=404, detail="Example not found")
-    return example
+    return orm_response(ExampleResponse, example)
 
 
 @router.post("/", response_model=ExampleResponse)
@@ -27,7 +204,8 @@ def create_example(example: ExampleCreate, db: Session = Depends(get_db)):
     db.add(db_example)
     db.commit()
     db.refresh(db_example)
-    return db_example
+    _example_count_cache.clear()
+    return orm_response(ExampleResponse, db_example)
 
 
 @router.delete("/{example_id}")
@@ -37,4 +215,5 @@ def delete_example(example_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Example not found")
     db.delete(example)
     db.commit()
+    _example_count_cache.clear()
     return {"message": "Deleted successfully"}
@@ -1,61 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import User, AuthProfile
-from app.schemas import UserResponse, UserUpdate, User2FASettings
-from app.dependencies.auth import get_current_active_user
-from app.utils.exceptions import BadRequestException, NotFoundException
+from app.schemas import UserResponse, UserUpdate, User2FASettings, UserPrincipal
+from app.dependencies.auth import get_current_active_user, invalidate_user_principal
+from app.utils.etag import conditional_response, make_etag
+from app.utils.responses import orm_response
+from app.utils.exceptions import (
+    BadRequestException,
+    NotFoundException,
+    UnauthorizedException,
+    raise_for_integrity_error
+)
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 
+def _get_user_for_update(db: Session, current_user: UserPrincipal) -> User:
+    """캐시된 스냅샷 대신 수정 가능한 ORM 객체 조회"""
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if user is None:
+        raise UnauthorizedException("인증 정보를 확인할 수 없습니다")
+    return user
+
+
 @router.get("/me", response_model=UserResponse)
-def get_current_user_profile(current_user: User = Depends(get_current_active_user)):
-    """현재 사용자 프로필 조회"""
-    return current_user
+def get_current_user_profile(request: Request, current_user: UserPrincipal = Depends(get_current_active_user)):
+    """현재 사용자 프로필 조회 (행 버전 ETag, 변경 없으면 304)"""
+    etag = make_etag("user", current_user.id, current_user.version)
+    return conditional_response(request, etag, lambda: orm_response(UserResponse, current_user))
 
 
 @router.put("/me", response_model=UserResponse)
 def update_current_user_profile(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserPrincipal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """현재 사용자 프로필 수정"""
-    # username 변경 시 중복 체크
+    """현재 사용자 프로필 수정 (중복은 유니크 제약으로 확인)"""
+    user = _get_user_for_update(db, current_user)
+
     if user_update.username is not None:
-        existing_user = db.query(User).filter(
-            User.username == user_update.username,
-            User.id != current_user.id
-        ).first()
-        if existing_user:
-            raise BadRequestException("이미 사용 중인 사용자명입니다")
-        current_user.username = user_update.username
-
-    # email 변경 시 중복 체크
+        user.username = user_update.username
     if user_update.email is not None:
-        existing_user = db.query(User).filter(
-            User.email == user_update.email,
-            User.id != current_user.id
-        ).first()
-        if existing_user:
-            raise BadRequestException("이미 등록된 이메일입니다")
-        current_user.email = user_update.email
+        user.email = user_update.email
 
-    db.commit()
-    db.refresh(current_user)
+    try:
+        db.flush()
+        response = UserResponse.model_validate(user)
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise_for_integrity_error(exc)
+    invalidate_user_principal(user.id)
 
-    return current_user
+    return orm_response(UserResponse, response)
 
 
 @router.put("/me/2fa", response_model=UserResponse)
 def update_user_2fa_settings(
     settings: User2FASettings,
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserPrincipal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """현재 사용자의 2차 인증 설정 변경"""
+    user = _get_user_for_update(db, current_user)
+
     # 2FA 활성화 시 auth_profile_id 필수
     if settings.enable_2fa:
         if not settings.auth_profile_id:
@@ -69,10 +81,11 @@ def update_user_2fa_settings(
             raise BadRequestException("비활성화된 인증 프로필입니다")
 
     # 설정 업데이트
-    current_user.enable_2fa = settings.enable_2fa
-    current_user.auth_profile_id = settings.auth_profile_id if settings.enable_2fa else None
+    user.enable_2fa = settings.enable_2fa
+    user.auth_profile_id = settings.auth_profile_id if settings.enable_2fa else None
 
     db.commit()
-    db.refresh(current_user)
+    db.refresh(user)
+    invalidate_user_principal(user.id)
 
-    return current_user
+    return user
@@ -1,7 +1,34 @@
-from app.schemas.example import ExampleCreate, ExampleResponse
-from app.schemas.user import UserCreate, UserLogin, UserResponse, Token, TokenData, UserUpdate
+from app.schemas.example import (
+    ExampleCreate,
+    ExampleResponse,
+    ExamplePage,
+    ExampleBulkCreate,
+    ExampleBulkCreateResult,
+    ExampleBulkDelete,
+    ExampleBulkDeleteResult
+)
+from app.schemas.user import (
+    UserCreate,
+    UserLogin,
+    UserResponse,
+    Token,
+    TokenData,
+    UserUpdate,
+    UserPrincipal,
+    UserSummary,
+    UserPage
+)
 from app.schemas.error import ErrorResponse, ErrorDetail
-from app.schemas.admin import AdminCreate, AdminLogin, AdminResponse, AdminUpdate, AdminToken
+from app.schemas.admin import (
+    AdminCreate,
+    AdminLogin,
+    AdminResponse,
+    AdminUpdate,
+    AdminToken,
+    AdminPrincipal,
+    AdminPage
+)
+from app.schemas.pagination import CursorPage
 from app.schemas.auth_profile import (
     AuthProfileCreate,
     AuthProfileUpdate,
@@ -19,12 +46,20 @@ from app.schemas.two_factor import (
 __all__ = [
     "ExampleCreate",
     "ExampleResponse",
+    "ExamplePage",
+    "ExampleBulkCreate",
+    "ExampleBulkCreateResult",
+    "ExampleBulkDelete",
+    "ExampleBulkDeleteResult",
     "UserCreate",
     "UserLogin",
     "UserResponse",
     "Token",
     "TokenData",
     "UserUpdate",
+    "UserPrincipal",
+    "UserSummary",
+    "UserPage",
     "ErrorResponse",
     "ErrorDetail",
     "AdminCreate",
@@ -32,6 +67,9 @@ __all__ = [
     "AdminResponse",
     "AdminUpdate",
     "AdminToken",
+    "AdminPrincipal",
+    "AdminPage",
+    "CursorPage",
     "AuthProfileCreate",
     "AuthProfileUpdate",
     "AuthProfileRead",
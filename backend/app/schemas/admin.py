@@ -1,7 +1,9 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from datetime import datetime
 from typing import Optional
 
+from app.schemas.pagination import CursorPage
+
 
 class AdminCreate(BaseModel):
     """관리자 생성 스키마"""
@@ -30,6 +32,23 @@ class AdminResponse(BaseModel):
         from_attributes = True
 
 
+class AdminPage(CursorPage[AdminResponse]):
+    """관리자 목록 페이지 스키마"""
+
+
+class AdminPrincipal(BaseModel):
+    """인증된 관리자 스냅샷 (불변, 세션 캐시 저장용)"""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    email: str
+    username: str
+    role: str
+    is_active: bool
+    created_at: datetime
+    version: int
+
+
 class AdminUpdate(BaseModel):
     """관리자 수정 스키마"""
     username: Optional[str] = None
@@ -1,5 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.schemas.pagination import CursorPage
 
 
 class ExampleCreate(BaseModel):
@@ -16,3 +18,30 @@ class ExampleResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ExamplePage(CursorPage[ExampleResponse]):
+    """예제 목록 페이지 스키마"""
+
+
+class ExampleBulkCreate(BaseModel):
+    """예제 일괄 생성 요청"""
+    items: list[ExampleCreate] = Field(..., min_length=1, max_length=100_000)
+
+
+class ExampleBulkCreateResult(BaseModel):
+    """예제 일괄 생성 결과 (ids는 오름차순)"""
+    created: int
+    ids: list[int]
+
+
+class ExampleBulkDelete(BaseModel):
+    """예제 일괄 삭제 요청 (조건을 함께 주면 모두 만족하는 행만 삭제)"""
+    ids: list[int] | None = Field(None, min_length=1, max_length=100_000)
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+
+
+class ExampleBulkDeleteResult(BaseModel):
+    """예제 일괄 삭제 결과"""
+    deleted: int
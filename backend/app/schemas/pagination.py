@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """커서 페이지네이션 응답 스키마"""
+    items: List[T]
+    total: int  # 필터 조건에 맞는 전체 개수 (짧은 시간 캐시됨)
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 None)
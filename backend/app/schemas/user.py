@@ -1,5 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+from app.schemas.pagination import CursorPage
 
 
 class UserCreate(BaseModel):
@@ -31,8 +33,38 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     email: str | None = None
+    exp: int | None = None
 
 
 class UserUpdate(BaseModel):
     username: str | None = None
     email: EmailStr | None = None
+
+
+class UserPrincipal(BaseModel):
+    """인증된 사용자 스냅샷 (불변, 캐시 저장용)"""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    email: str
+    username: str
+    is_active: bool
+    enable_2fa: bool
+    created_at: datetime
+    version: int
+
+
+class UserSummary(BaseModel):
+    """관리자용 사용자 목록 항목 (fields로 요청한 컬럼만 포함)"""
+    id: int
+    email: str | None = None
+    username: str | None = None
+    is_active: bool | None = None
+    enable_2fa: bool | None = None
+    auth_profile_id: int | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class UserPage(CursorPage[UserSummary]):
+    """관리자용 사용자 목록 페이지 스키마"""
@@ -1,22 +1,171 @@
 """관리자 관련 유틸리티 함수"""
 
+import asyncio
+import os
+import threading
+import time
 from datetime import datetime
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
 from app.models.admin_session import AdminSession
 
 
-def cleanup_expired_sessions(db: Session) -> int:
-    """만료된 세션 삭제
+def delete_expired_session_batch(db: Session, now: datetime, batch_size: int) -> int:
+    """만료된 세션을 최대 batch_size개 삭제 후 커밋
 
     Args:
         db: 데이터베이스 세션
+        now: 만료 기준 시각 (UTC)
+        batch_size: 한 번에 삭제할 최대 개수
 
     Returns:
         삭제된 세션 개수
     """
+    expired_ids = select(AdminSession.id).where(
+        AdminSession.expires_at < now
+    ).limit(batch_size)
+
     deleted_count = db.query(AdminSession).filter(
-        AdminSession.expires_at < datetime.utcnow()
-    ).delete()
+        AdminSession.id.in_(expired_ids)
+    ).delete(synchronize_session=False)
     db.commit()
 
     return deleted_count
+
+
+def cleanup_expired_sessions(db: Session, batch_size: int = 500, pause: float = 0.0) -> int:
+    """만료된 세션 삭제 (배치 단위로 커밋하여 쓰기 잠금 시간 제한)
+
+    Args:
+        db: 데이터베이스 세션
+        batch_size: 배치당 삭제 개수
+        pause: 배치 사이 대기 시간 (초)
+
+    Returns:
+        삭제된 세션 개수
+    """
+    now = datetime.utcnow()
+    total = 0
+    while True:
+        deleted = delete_expired_session_batch(db, now, batch_size)
+        total += deleted
+        if deleted < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return total
+
+
+class SessionReaper:
+    """만료 세션 주기적 정리기
+
+    배치 단위로 삭제하고 배치 사이에 쉬어서 로그인(쓰기)이 오래 막히지 않도록 합니다.
+    정리 후 SQLite incremental vacuum으로 빈 페이지를 회수합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        batch_size: int = 500,
+        pause: float = 0.05,
+        interval: float = 300.0
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.pause = pause
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._total_reclaimed = 0
+        self._runs = 0
+        self._last_run: dict | None = None
+
+    def run_once(self) -> dict:
+        """한 번 정리 실행 후 결과 반환"""
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+        now = started_at
+        reclaimed = 0
+        batches = 0
+        lock_time = 0.0
+        max_lock_time = 0.0
+        vacuum_pages = None
+
+        db = self.session_factory()
+        try:
+            while True:
+                batch_start = time.perf_counter()
+                deleted = delete_expired_session_batch(db, now, self.batch_size)
+                batch_time = time.perf_counter() - batch_start
+
+                batches += 1
+                reclaimed += deleted
+                lock_time += batch_time
+                max_lock_time = max(max_lock_time, batch_time)
+
+                if deleted < self.batch_size:
+                    break
+                time.sleep(self.pause)
+
+            if reclaimed and db.get_bind().dialect.name == "sqlite":
+                vacuum_pages = self._incremental_vacuum(db)
+        finally:
+            db.close()
+
+        result = {
+            "started_at": started_at.isoformat(),
+            "reclaimed": reclaimed,
+            "batches": batches,
+            "lock_time_ms": round(lock_time * 1000, 3),
+            "max_batch_lock_time_ms": round(max_lock_time * 1000, 3),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            "freelist_pages_before_vacuum": vacuum_pages,
+        }
+        with self._lock:
+            self._runs += 1
+            self._total_reclaimed += reclaimed
+            self._last_run = result
+        return result
+
+    @staticmethod
+    def _incremental_vacuum(db: Session) -> int:
+        """빈 페이지 회수 (auto_vacuum=INCREMENTAL이 아니면 효과 없음)"""
+        freelist = db.execute(text("PRAGMA freelist_count")).scalar()
+        db.execute(text("PRAGMA incremental_vacuum"))
+        db.commit()
+        return freelist
+
+    async def run_forever(self):
+        """interval마다 정리 실행 (서버 시작 시 백그라운드 태스크로 실행)"""
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as exc:
+                print(f"[ERROR] Admin session reaper failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        """누적 정리 통계"""
+        with self._lock:
+            return {
+                "batch_size": self.batch_size,
+                "pause_ms": self.pause * 1000,
+                "interval_seconds": self.interval,
+                "runs": self._runs,
+                "total_reclaimed": self._total_reclaimed,
+                "last_run": self._last_run,
+            }
+
+
+_reaper = SessionReaper(
+    batch_size=int(os.getenv("ADMIN_SESSION_REAPER_BATCH", "500")),
+    pause=float(os.getenv("ADMIN_SESSION_REAPER_PAUSE_MS", "50")) / 1000,
+    interval=float(os.getenv("ADMIN_SESSION_REAPER_INTERVAL", "300"))
+)
+
+
+def get_session_reaper() -> SessionReaper:
+    """전역 세션 정리기 조회"""
+    return _reaper
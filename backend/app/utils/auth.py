@@ -1,13 +1,13 @@
-# WARNING: SHA-256은 비밀번호 해싱에 권장되지 않습니다.
-# 프로덕션 환경에서는 bcrypt, Argon2 등을 사용하세요.
-
 import hashlib
-import secrets
+import os
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 
 from app.schemas import TokenData
+from app.utils.cache import TTLCache
 from app.utils.exceptions import UnauthorizedException
+from app.utils.metrics import JWT_OPERATIONS
+from app.utils.password_hashing import get_password_hasher
 
 
 # JWT 설정 상수
@@ -17,11 +17,16 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 # SECRET_KEY는 서버 시작 시 main.py에서 생성됨
 _SECRET_KEY: str | None = None
 
+# 디코딩된 JWT 캐시 (토큰 다이제스트 → payload, 토큰의 exp 시각에 만료)
+_token_cache = TTLCache(maxsize=int(os.getenv("JWT_CACHE_SIZE", "4096")))
+
 
 def set_secret_key(secret_key: str):
     """서버 시작 시 SECRET_KEY 설정 (main.py에서 호출)"""
     global _SECRET_KEY
     _SECRET_KEY = secret_key
+    # 키가 바뀌면 이전 키로 검증된 토큰은 무효
+    _token_cache.clear()
 
 
 def get_secret_key() -> str:
@@ -32,24 +37,28 @@ def get_secret_key() -> str:
 
 
 def hash_password(password: str) -> str:
-    """SHA-256으로 비밀번호 해싱 (salt 포함)"""
-    # 랜덤 salt 생성 (16 bytes)
-    salt = secrets.token_hex(16)
-    # SHA-256으로 해싱
-    hashed = hashlib.sha256((salt + password).encode()).hexdigest()
-    return f"{salt}${hashed}"
+    """PBKDF2-SHA256으로 비밀번호 해싱 (프로세스 풀에서 계산)"""
+    return get_password_hasher().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
-    try:
-        # salt와 hash 분리
-        salt, stored_hash = hashed_password.split('$')
-        # 입력 비밀번호를 같은 salt로 해싱
-        hashed = hashlib.sha256((salt + plain_password).encode()).hexdigest()
-        return hashed == stored_hash
-    except:
-        return False
+    """비밀번호 검증 (레거시 salt$sha256 형식 포함)"""
+    return get_password_hasher().verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (async 핸들러용, 이벤트 루프를 막지 않음)"""
+    return await get_password_hasher().hash_async(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (async 핸들러용, 이벤트 루프를 막지 않음)"""
+    return await get_password_hasher().verify_async(plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """로그인 성공 후 재해싱이 필요한지 확인 (레거시 형식 또는 낮은 비용)"""
+    return get_password_hasher().needs_rehash(hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -68,20 +77,60 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     secret_key = get_secret_key()
 
     encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=ALGORITHM)
+    JWT_OPERATIONS.inc("encode", "ok")
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> TokenData:
-    """JWT 토큰 디코딩 (메모리의 SECRET_KEY 사용)"""
+def get_token_cache() -> TTLCache:
+    """JWT 디코딩 캐시 조회 (통계 및 테스트용)"""
+    return _token_cache
+
+
+def hash_token(token: str) -> bytes:
+    """토큰의 고정 길이 SHA-256 다이제스트 (캐시/세션 키)"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _decode_token(token: str) -> dict:
+    """JWT 서명 검증 및 디코딩 (검증된 payload는 exp까지 캐시)
+
+    캐시된 payload를 호출자가 수정해도 다른 요청에 영향이 없도록 항상 복사본을 반환합니다.
+
+    Raises:
+        JWTError: 서명 불일치, 만료 등 검증 실패
+    """
+    key = hash_token(token)
+    payload = _token_cache.get(key)
+    if payload is not None:
+        JWT_OPERATIONS.inc("decode", "cache_hit")
+        return dict(payload)
+
     # 메모리에서 SECRET_KEY 로드
     secret_key = get_secret_key()
-
     try:
         payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
+    except JWTError:
+        JWT_OPERATIONS.inc("decode", "error")
+        raise
+    JWT_OPERATIONS.inc("decode", "ok")
+
+    exp = payload.get("exp")
+    if exp is not None:
+        _token_cache.set(key, payload, expires_at=float(exp))
+    return dict(payload)
+
+
+def decode_access_token(token: str) -> TokenData:
+    """JWT 토큰 디코딩 (메모리의 SECRET_KEY 사용)
+
+    type 클레임이 있는 용도 토큰(2차 인증 임시 토큰, 프로파일 토큰 등)은 거부합니다.
+    """
+    try:
+        payload = _decode_token(token)
         email: str = payload.get("sub")
-        if email is None:
+        if email is None or "type" in payload:
             raise UnauthorizedException("유효하지 않은 토큰입니다")
-        return TokenData(email=email)
+        return TokenData(email=email, exp=payload.get("exp"))
     except JWTError:
         raise UnauthorizedException("유효하지 않은 토큰입니다")
 
@@ -96,14 +145,14 @@ def create_temp_token(email: str) -> str:
     }
     secret_key = get_secret_key()
     encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=ALGORITHM)
+    JWT_OPERATIONS.inc("encode", "ok")
     return encoded_jwt
 
 
 def verify_temp_token(token: str) -> str:
     """임시 토큰 검증 및 이메일 추출"""
-    secret_key = get_secret_key()
     try:
-        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
         token_type = payload.get("type")
         email = payload.get("sub")
 
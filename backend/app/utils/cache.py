@@ -0,0 +1,95 @@
+"""인메모리 캐시 유틸리티 (만료 시각 + LRU)"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """항목별 만료 시각을 가지는 스레드 안전 LRU 캐시
+
+    - 만료 시각(epoch 초)이 지난 항목은 조회 시 제거됩니다.
+    - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거됩니다.
+    """
+
+    def __init__(self, maxsize: int, default_ttl: float | None = None):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """항목 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float | None = None):
+        """항목 저장 (expires_at 미지정 시 default_ttl 적용)"""
+        if expires_at is None:
+            if self.default_ttl is None:
+                raise ValueError("expires_at 또는 default_ttl이 필요합니다")
+            expires_at = time.time() + self.default_ttl
+
+        if self.maxsize <= 0 or expires_at <= time.time():
+            return
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable):
+        """항목 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """조건에 맞는 항목 일괄 삭제"""
+        with self._lock:
+            keys = [key for key, (value, _) in self._data.items() if predicate(key, value)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """적중/미적중 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
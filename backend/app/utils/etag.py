@@ -0,0 +1,49 @@
+"""조건부 GET (약한 ETag, If-None-Match → 304)
+
+ETag는 응답 본문이 아니라 행 버전/수정 시각 등 작은 값에서 만들기 때문에
+일치 여부를 확인할 때 응답을 직렬화하지 않습니다. 일치하면 본문 없이 304를
+반환하고, 아니면 build()로 응답을 만들어 ETag/Cache-Control 헤더를 붙입니다.
+"""
+
+import hashlib
+from typing import Callable
+
+from fastapi import Request, Response
+
+# 사용자별 응답: 브라우저만 저장하고 매번 재검증 (If-None-Match 전송)
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """값 목록으로 약한 ETag 생성 (W/"<blake2b 다이제스트>")"""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더와 약한 비교 (쉼표 목록, * 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(
+    request: Request,
+    etag: str,
+    build: Callable[[], Response],
+    cache_control: str = PRIVATE_CACHE_CONTROL
+) -> Response:
+    """ETag가 일치하면 304, 아니면 build() 응답에 캐시 헤더 추가"""
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response = build()
+    response.headers.update(headers)
+    return response
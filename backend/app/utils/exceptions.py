@@ -1,4 +1,9 @@
+import math
+import re
+from typing import NoReturn
+
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 
 
 class BadRequestException(HTTPException):
@@ -23,3 +28,50 @@ class ForbiddenException(HTTPException):
     """403 Forbidden 예외"""
     def __init__(self, detail: str = "접근 권한이 없습니다"):
         super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+class TooManyRequestsException(HTTPException):
+    """429 Too Many Requests 예외 (Retry-After 헤더 포함)"""
+    def __init__(self, detail: str = "요청이 너무 많습니다", retry_after: float = 1):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+
+
+# 유니크 제약 위반 컬럼별 메시지 (users/admins 공통)
+UNIQUE_VIOLATION_MESSAGES = {
+    "email": "이미 등록된 이메일입니다",
+    "username": "이미 사용 중인 사용자명입니다",
+}
+
+# SQLite: "UNIQUE constraint failed: users.email"
+# PostgreSQL: "Key (email)=(...) already exists."
+_UNIQUE_COLUMN_PATTERNS = (
+    re.compile(r"UNIQUE constraint failed: \w+\.(\w+)"),
+    re.compile(r"Key \((\w+)\)=\(.*\) already exists"),
+)
+
+
+def unique_violation_column(exc: IntegrityError) -> str | None:
+    """유니크 제약 위반이면 위반한 컬럼명 반환 (그 외 무결성 오류는 None)"""
+    message = str(exc.orig)
+    for pattern in _UNIQUE_COLUMN_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return match.group(1)
+    return None
+
+
+def raise_for_integrity_error(exc: IntegrityError) -> NoReturn:
+    """유니크 제약 위반을 BadRequestException으로 변환
+
+    중복 여부를 미리 SELECT로 확인하지 않고 INSERT/UPDATE 후 제약 위반을
+    잡아 변환합니다. 세션 롤백은 호출하는 쪽에서 먼저 수행합니다.
+    알 수 없는 제약 위반은 원래 예외를 그대로 다시 발생시킵니다.
+    """
+    message = UNIQUE_VIOLATION_MESSAGES.get(unique_violation_column(exc))
+    if message is None:
+        raise exc
+    raise BadRequestException(message) from exc
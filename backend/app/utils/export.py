@@ -0,0 +1,105 @@
+"""테이블 스트리밍 내보내기 (NDJSON/CSV, 선택적 gzip)
+
+서버 측 커서(yield_per)로 배치 단위로 읽고 배치마다 바로 인코딩해 내보내므로
+테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import io
+import os
+import zlib
+from datetime import datetime
+from typing import AsyncIterator
+
+import orjson
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# 서버 측 커서에서 한 번에 읽는 행 수
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+
+def encode_ndjson(rows, columns: list[str]) -> bytes:
+    """행 배치를 NDJSON 바이트로 변환"""
+    # orjson은 datetime을 isoformat()과 같은 형식으로 직렬화
+    return b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+
+def encode_csv(rows, columns: list[str] | None = None) -> bytes:
+    """행 배치를 CSV 바이트로 변환 (columns를 주면 헤더 행 출력)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if columns is not None:
+        writer.writerow(columns)
+    writer.writerows(
+        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+async def stream_rows(
+    session_factory: async_sessionmaker,
+    query: Select,
+    fmt: str = "ndjson",
+    batch_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """쿼리 결과를 batch_size 행씩 인코딩해 순서대로 반환
+
+    응답 전송 중에도 세션이 필요하므로 의존성 주입 세션이 아니라
+    session_factory로 직접 세션을 엽니다.
+    """
+    columns = [column.name for column in query.selected_columns]
+    async with session_factory() as db:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        first = True
+        async for rows in result.partitions():
+            if fmt == "csv":
+                yield encode_csv(rows, columns if first else None)
+            else:
+                yield encode_ndjson(rows, columns)
+            first = False
+
+        if first and fmt == "csv":
+            # 빈 테이블도 헤더는 출력
+            yield encode_csv([], columns)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """청크 단위 gzip 압축"""
+    compressor = zlib.compressobj(wbits=31)  # 31: gzip 헤더 포함
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_response(
+    session_factory: async_sessionmaker,
+    query: Select,
+    name: str,
+    fmt: str = "ndjson",
+    gzip: bool = False
+) -> StreamingResponse:
+    """쿼리 결과를 파일 다운로드 스트리밍 응답으로 변환 (gzip=true면 .gz 파일)"""
+    chunks = stream_rows(session_factory, query, fmt, batch_size=EXPORT_BATCH_SIZE)
+    filename = f"{name}.{fmt}"
+    media_type = EXPORT_FORMATS[fmt]
+    if gzip:
+        chunks = gzip_stream(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,318 @@
+"""Prometheus 텍스트 형식 메트릭 (카운터, 게이지, 히스토그램)
+
+값은 스레드별 샤드에 기록하므로 기록 시 잠금이 없습니다.
+(잠금은 스레드가 메트릭에 처음 기록할 때 샤드를 등록하는 순간에만 사용)
+/metrics 조회 시 모든 샤드를 합산해 텍스트 형식(version 0.0.4)으로 출력합니다.
+
+- HTTP: 라우트 템플릿별 요청 수/상태 코드, 지연 시간 히스토그램, 처리 중 요청 수
+- 도메인: 비밀번호 해싱, JWT 인코딩/디코딩, 2차 인증, 관리자 세션 조회
+"""
+
+import bisect
+import hmac
+import math
+import os
+import threading
+import time
+
+# 지연 시간 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# /metrics 노출 여부 (기본 비활성: 라우트/트래픽 정보가 드러나므로 명시적으로 켬)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+# 설정하면 /metrics 요청에 "Authorization: Bearer <METRICS_TOKEN>" 필요 (수집기 전용)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# 텍스트 형식 버전 (Response가 text/* 에 charset=utf-8을 덧붙임)
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+class _ThreadShards:
+    """스레드별 값 저장소 (쓰기는 자기 스레드의 dict만 수정)"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: list[dict] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> dict:
+        """현재 스레드의 샤드 (처음이면 등록)"""
+        try:
+            return self._local.values
+        except AttributeError:
+            values = {}
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def snapshots(self) -> list[dict]:
+        """모든 샤드의 복사본 (dict 복사는 GIL 안에서 한 번에 수행)"""
+        with self._lock:
+            shards = list(self._shards)
+        return [dict(shard) for shard in shards]
+
+    def clear(self):
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._shards = _ThreadShards()
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def clear(self):
+        """모든 값 초기화 (테스트용)"""
+        self._shards.clear()
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        """라벨 값 순서대로 지정해 증가"""
+        shard = self._shards.get()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def value(self, *labels) -> float:
+        """라벨 조합의 합계"""
+        return sum(shard.get(labels, 0) for shard in self._shards.snapshots())
+
+    def _totals(self) -> dict:
+        totals: dict = {}
+        for shard in self._shards.snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, value in sorted(self._totals().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """증감 게이지 (처리 중 요청 수 등, 샤드 합계가 현재 값)"""
+
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """누적 구간 히스토그램 (구간별 개수 + 합계 + 전체 개수)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels):
+        """관측값 기록 (값 뒤에 라벨 값 순서대로)"""
+        shard = self._shards.get()
+        entry = shard.get(labels)
+        if entry is None:
+            # 구간별 개수(마지막은 +Inf) + 합계
+            entry = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        entry[bisect.bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+
+    def _totals(self) -> dict:
+        totals: dict = {}
+        for shard in self._shards.snapshots():
+            for labels, entry in shard.items():
+                entry = list(entry)
+                total = totals.get(labels)
+                totals[labels] = entry if total is None else [a + b for a, b in zip(total, entry)]
+        return totals
+
+    def count(self, *labels) -> int:
+        """라벨 조합의 관측 횟수"""
+        entry = self._totals().get(labels)
+        return sum(entry[:-1]) if entry else 0
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, entry in sorted(self._totals().items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), entry[:-1]):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(entry[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 목록 (등록 순서대로 출력)"""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """텍스트 형식 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """모든 값 초기화 (테스트용)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """전역 메트릭 레지스트리 조회"""
+    return _registry
+
+
+def metrics_authorized(authorization: str | None) -> bool:
+    """/metrics 접근 허용 여부 (METRICS_TOKEN 미설정이면 허용, 설정 시 Bearer 토큰 비교)"""
+    if not METRICS_TOKEN:
+        return True
+    scheme, _, token = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(token.encode(), METRICS_TOKEN.encode())
+
+
+# ============================================
+# 메트릭 정의
+# ============================================
+
+HTTP_REQUESTS = _registry.counter(
+    "http_requests_total", "HTTP requests by route template and status code.", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = _registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route")
+)
+HTTP_REQUESTS_IN_PROGRESS = _registry.gauge(
+    "http_requests_in_progress", "HTTP requests currently being processed.", ("method",)
+)
+PASSWORD_HASH_OPERATIONS = _registry.counter(
+    "app_password_hash_operations_total", "Password hash computations.", ("operation",)
+)
+PASSWORD_HASH_DURATION = _registry.histogram(
+    "app_password_hash_duration_seconds", "Password hash computation latency (including pool queueing).",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+JWT_OPERATIONS = _registry.counter(
+    "app_jwt_operations_total", "JWT encodes and decodes.", ("operation", "result")
+)
+TWO_FACTOR_VERIFICATIONS = _registry.counter(
+    "app_two_factor_verifications_total", "Second-factor verifications.", ("result",)
+)
+ADMIN_SESSION_LOOKUPS = _registry.counter(
+    "app_admin_session_lookups_total", "Admin session lookups by source.", ("result",)
+)
+
+
+# ============================================
+# HTTP 미들웨어
+# ============================================
+
+class MetricsMiddleware:
+    """요청 수, 상태 코드, 지연 시간, 처리 중 요청 수 기록 (ASGI 미들웨어)
+
+    라우트 라벨은 실제 경로가 아니라 라우트 템플릿(/api/examples/{example_id})을
+    사용해 라벨 조합 수를 제한합니다. 일치하는 라우트가 없으면 "unmatched"입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_PROGRESS.dec(method)
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            HTTP_REQUESTS.inc(method, route_path, str(status_code))
+            HTTP_REQUEST_DURATION.observe(elapsed, method, route_path)
@@ -0,0 +1,147 @@
+"""키셋(커서) 페이지네이션 유틸리티
+
+(created_at, id) 순서로 정렬된 목록에서 마지막 행 값을 커서로 넘겨
+OFFSET 없이 다음 페이지를 조회합니다 (깊은 페이지도 인덱스 범위 탐색).
+"""
+
+import base64
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, String, and_, literal, or_, tuple_
+from sqlalchemy.types import TypeDecorator
+
+from app.utils.exceptions import BadRequestException
+
+
+def _encode_payload(values: list) -> str:
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """마지막 행의 (created_at, id)를 불투명한 커서 문자열로 변환"""
+    return _encode_payload([created_at.isoformat(), row_id])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 문자열을 (created_at, id)로 복원
+
+    Raises:
+        BadRequestException: 형식이 잘못된 커서
+    """
+    try:
+        created_at, row_id = _decode_payload(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise BadRequestException("잘못된 커서입니다")
+
+
+def encode_rank_cursor(rank: float, row_id: int) -> str:
+    """검색 결과 마지막 행의 (순위 점수, id)를 커서로 변환"""
+    return _encode_payload([rank, row_id])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """검색 커서를 (순위 점수, id)로 복원
+
+    Raises:
+        BadRequestException: 형식이 잘못된 커서
+    """
+    try:
+        rank, row_id = _decode_payload(cursor)
+        return float(rank), int(row_id)
+    except (ValueError, TypeError):
+        raise BadRequestException("잘못된 커서입니다")
+
+
+class CursorDateTime(TypeDecorator):
+    """커서 비교용 datetime 바인딩
+
+    SQLite는 datetime을 문자열로 비교하므로 server_default(CURRENT_TIMESTAMP)가
+    저장한 형식(마이크로초 없음, UTC)과 같은 문자열로 바인딩해야 같은 시각이 같게
+    비교됩니다. 시간대가 있는 값은 UTC로 변환합니다.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and dialect.name == "sqlite":
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            fmt = "%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S"
+            return value.strftime(fmt)
+        return value
+
+
+def keyset_after(created_at_column, id_column, cursor: str):
+    """커서 다음 행 조건 ((created_at, id) > 커서 값)"""
+    created_at, row_id = decode_cursor(cursor)
+    return tuple_(created_at_column, id_column) > tuple_(
+        literal(created_at, type_=CursorDateTime()), row_id
+    )
+
+
+def created_range(created_at_column, start: datetime | None = None, end: datetime | None = None) -> list:
+    """created_at 범위 조건 (start 이상, end 미만)"""
+    filters = []
+    if start is not None:
+        filters.append(created_at_column >= literal(start, type_=CursorDateTime()))
+    if end is not None:
+        filters.append(created_at_column < literal(end, type_=CursorDateTime()))
+    return filters
+
+
+def split_page(rows: list, limit: int) -> tuple[list, str | None]:
+    """limit + 1개 조회 결과를 (현재 페이지, 다음 커서)로 분리
+
+    rows의 각 항목은 created_at, id 속성을 가져야 합니다 (ORM 객체 또는 Row).
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATE_START = 0xD800
+_SURROGATE_END = 0xDFFF
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """접두사로 시작하는 모든 문자열보다 큰 최소 문자열 (없으면 None)
+
+    마지막 문자를 다음 코드 포인트로 바꾸되, 서로게이트 구간(U+D800~U+DFFF)은 건너뛰고
+    U+10FFFF인 문자는 잘라낸 뒤 앞 문자를 올립니다. 모두 U+10FFFF면 상한이 없습니다.
+    """
+    stripped = prefix.rstrip(chr(_MAX_CODE_POINT))
+    if not stripped:
+        return None
+    code_point = ord(stripped[-1]) + 1
+    if _SURROGATE_START <= code_point <= _SURROGATE_END:
+        code_point = _SURROGATE_END + 1
+    return stripped[:-1] + chr(code_point)
+
+
+def prefix_match(column, prefix: str):
+    """접두사 검색 조건 (LIKE 대신 범위 비교로 인덱스 사용, 대소문자 구분)"""
+    upper = prefix_upper_bound(prefix)
+    if upper is None:
+        return column >= prefix
+    return and_(column >= prefix, column < upper)
+
+
+def prefix_match_any(columns, prefix: str):
+    """여러 컬럼 중 하나라도 접두사가 일치"""
+    return or_(*(prefix_match(column, prefix) for column in columns))
@@ -0,0 +1,260 @@
+"""비밀번호 해싱 서비스 (프로세스 풀 + 지연 시간 기반 비용 보정)
+
+PBKDF2-SHA256 해시 계산을 별도 프로세스 풀에서 수행하여
+요청 처리 스레드가 GIL을 점유하지 않도록 합니다.
+
+해시 형식:
+    pbkdf2_sha256$<iterations>$<salt>$<hash>
+레거시 형식 (검증만 지원, 로그인 성공 시 재해싱):
+    <salt>$<sha256>
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.utils.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_OPERATIONS
+
+
+HASH_SCHEME = "pbkdf2_sha256"
+
+# 보정 전 기본 반복 횟수 및 보정 하한값
+DEFAULT_ITERATIONS = 200_000
+MIN_ITERATIONS = 10_000
+
+# 보정 시 측정에 사용할 반복 횟수
+_CALIBRATION_PROBE_ITERATIONS = 20_000
+
+# 보정 결과 반올림 단위 (재시작마다 측정 잡음으로 값이 조금씩 바뀌지 않도록)
+CALIBRATION_STEP = 10_000
+
+# 저장된 반복 횟수가 현재 값의 이 비율 미만일 때만 재해싱
+# (보정 값이 조금 올라갔다고 모든 사용자의 다음 로그인에서 재해싱/커밋하지 않음)
+REHASH_THRESHOLD = 0.8
+
+
+def _pbkdf2(password: str, salt: str, iterations: int) -> str:
+    """PBKDF2-SHA256 해시 계산 (프로세스 풀에서 실행되므로 모듈 레벨 함수)"""
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt.encode(), iterations
+    ).hex()
+
+
+def _legacy_sha256(password: str, salt: str) -> str:
+    """레거시 salt + SHA-256 해시 계산"""
+    return hashlib.sha256((salt + password).encode()).hexdigest()
+
+
+def is_legacy_hash(hashed_password: str) -> bool:
+    """레거시 salt$sha256 형식 여부"""
+    return not hashed_password.startswith(f"{HASH_SCHEME}$")
+
+
+def _format_hash(iterations: int, salt: str, hashed: str) -> str:
+    return f"{HASH_SCHEME}${iterations}${salt}${hashed}"
+
+
+def _parse_hash(hashed_password: str) -> tuple[int | None, str, str] | None:
+    """저장된 해시를 (반복 횟수, salt, 해시)로 분리 (레거시 형식은 반복 횟수 None, 형식 오류는 None)"""
+    try:
+        if is_legacy_hash(hashed_password):
+            salt, stored_hash = hashed_password.split('$')
+            return None, salt, stored_hash
+        _, iterations, salt, stored_hash = hashed_password.split('$')
+        return int(iterations), salt, stored_hash
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _digest_matches(hashed: str, stored_hash: str) -> bool:
+    """상수 시간 비교 (저장된 값에 ASCII 외 문자가 있으면 불일치)"""
+    try:
+        return hmac.compare_digest(hashed, stored_hash)
+    except TypeError:
+        return False
+
+
+class PasswordHasher:
+    """프로세스 풀 기반 비밀번호 해셔
+
+    start() 호출 전에는 현재 프로세스에서 직접 계산합니다 (스크립트, 테스트).
+    """
+
+    def __init__(self, iterations: int = DEFAULT_ITERATIONS):
+        self.iterations = iterations
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queue_depth = 0
+        self._completed = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    # ----------------------------------------
+    # 수명 주기
+    # ----------------------------------------
+
+    def calibrate(self, target_ms: float) -> int:
+        """해시 1회가 target_ms 근처가 되도록 반복 횟수 보정"""
+        start = time.perf_counter()
+        _pbkdf2("calibration", secrets.token_hex(16), _CALIBRATION_PROBE_ITERATIONS)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        per_iteration_ms = elapsed_ms / _CALIBRATION_PROBE_ITERATIONS
+        iterations = round(target_ms / per_iteration_ms / CALIBRATION_STEP) * CALIBRATION_STEP
+        self.iterations = max(MIN_ITERATIONS, iterations)
+        return self.iterations
+
+    def start(self, max_workers: int | None = None):
+        """프로세스 풀 시작"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ----------------------------------------
+    # 해싱 / 검증
+    # ----------------------------------------
+
+    def _begin(self) -> float:
+        """계산 시작 기록 (큐 깊이 증가)"""
+        with self._lock:
+            self._queue_depth += 1
+        return time.perf_counter()
+
+    def _finish(self, start: float):
+        """계산 완료 기록 (큐 깊이 감소, 지연 시간 누적)"""
+        latency = time.perf_counter() - start
+        PASSWORD_HASH_DURATION.observe(latency)
+        with self._lock:
+            self._queue_depth -= 1
+            self._completed += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+
+    def _run(self, password: str, salt: str, iterations: int | None) -> str:
+        """풀(또는 현재 프로세스)에서 해시 계산 후 통계 기록 (iterations가 None이면 레거시 SHA-256)"""
+        if iterations is None:
+            return _legacy_sha256(password, salt)
+        start = self._begin()
+        try:
+            if self._executor is None:
+                return _pbkdf2(password, salt, iterations)
+            return self._executor.submit(_pbkdf2, password, salt, iterations).result()
+        finally:
+            self._finish(start)
+
+    async def _run_async(self, password: str, salt: str, iterations: int | None) -> str:
+        """이벤트 루프를 막지 않고 해시 계산 (async 핸들러용, iterations가 None이면 레거시 SHA-256)"""
+        if iterations is None:
+            return _legacy_sha256(password, salt)
+        start = self._begin()
+        try:
+            if self._executor is None:
+                return await asyncio.to_thread(_pbkdf2, password, salt, iterations)
+            future = self._executor.submit(_pbkdf2, password, salt, iterations)
+            return await asyncio.wrap_future(future)
+        finally:
+            self._finish(start)
+
+    def _new_hash_params(self) -> tuple[str, int]:
+        """새 해시의 (salt, 반복 횟수)"""
+        PASSWORD_HASH_OPERATIONS.inc("hash")
+        return secrets.token_hex(16), self.iterations
+
+    def hash(self, password: str) -> str:
+        """비밀번호 해싱"""
+        salt, iterations = self._new_hash_params()
+        return _format_hash(iterations, salt, self._run(password, salt, iterations))
+
+    async def hash_async(self, password: str) -> str:
+        """비밀번호 해싱 (async)"""
+        salt, iterations = self._new_hash_params()
+        return _format_hash(iterations, salt, await self._run_async(password, salt, iterations))
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (레거시 형식 포함)"""
+        PASSWORD_HASH_OPERATIONS.inc("verify")
+        parsed = _parse_hash(hashed_password)
+        if parsed is None:
+            return False
+        iterations, salt, stored_hash = parsed
+        return _digest_matches(self._run(plain_password, salt, iterations), stored_hash)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (async, 레거시 형식 포함)"""
+        PASSWORD_HASH_OPERATIONS.inc("verify")
+        parsed = _parse_hash(hashed_password)
+        if parsed is None:
+            return False
+        iterations, salt, stored_hash = parsed
+        return _digest_matches(await self._run_async(plain_password, salt, iterations), stored_hash)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """레거시 형식이거나 현재 비용보다 충분히 낮은 해시인지 확인 (REHASH_THRESHOLD)"""
+        parsed = _parse_hash(hashed_password)
+        if parsed is None or parsed[0] is None:
+            return True
+        return parsed[0] < self.iterations * REHASH_THRESHOLD
+
+    # ----------------------------------------
+    # 통계
+    # ----------------------------------------
+
+    def stats(self) -> dict:
+        """큐 깊이 및 지연 시간 통계"""
+        with self._lock:
+            completed = self._completed
+            avg_ms = (self._total_latency / completed * 1000) if completed else 0.0
+            return {
+                "scheme": HASH_SCHEME,
+                "iterations": self.iterations,
+                "pool_running": self._executor is not None,
+                "queue_depth": self._queue_depth,
+                "completed": completed,
+                "avg_latency_ms": round(avg_ms, 3),
+                "max_latency_ms": round(self._max_latency * 1000, 3),
+            }
+
+
+_hasher = PasswordHasher()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """전역 해셔 인스턴스 조회"""
+    return _hasher
+
+
+def start_password_hasher():
+    """서버 시작 시 비용 보정 및 프로세스 풀 시작 (main.py에서 호출)
+
+    환경 변수:
+        PASSWORD_HASH_ITERATIONS: 반복 횟수 고정 (지정 시 보정하지 않음, 여러 서버에서 같은 값 사용)
+        PASSWORD_HASH_TARGET_MS: 해시 1회 목표 지연 시간 (기본 100ms)
+        PASSWORD_HASH_WORKERS: 프로세스 풀 크기 (기본 CPU 코어 수)
+    """
+    pinned = os.getenv("PASSWORD_HASH_ITERATIONS")
+    target_ms = float(os.getenv("PASSWORD_HASH_TARGET_MS", "100"))
+    workers = os.getenv("PASSWORD_HASH_WORKERS")
+
+    if pinned:
+        _hasher.iterations = max(MIN_ITERATIONS, int(pinned))
+        source = "pinned"
+    else:
+        _hasher.calibrate(target_ms)
+        source = f"target={target_ms}ms"
+    _hasher.start(max_workers=int(workers) if workers else None)
+    print(f"[INFO] Password hasher started (iterations={_hasher.iterations}, {source})")
+
+
+def stop_password_hasher():
+    """서버 종료 시 프로세스 풀 종료 (main.py에서 호출)"""
+    _hasher.shutdown()
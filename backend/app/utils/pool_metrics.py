@@ -0,0 +1,119 @@
+"""DB 커넥션 풀 계측 (대출 중 연결 수, 대기 시간, overflow 발생 횟수)"""
+
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """커넥션 풀 누적 통계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.overflow_events = 0
+        self.wait_count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float):
+        """연결 획득 대기 시간 기록"""
+        with self._lock:
+            self.wait_count += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self, pool) -> dict:
+        """누적 통계 + 현재 풀 상태"""
+        with self._lock:
+            avg_wait = self.total_wait / self.wait_count if self.wait_count else 0.0
+            stats = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "overflow_events": self.overflow_events,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return stats
+
+
+class _TimedPoolMixin:
+    """연결 획득(_do_get) 시간을 측정하는 풀 믹스인"""
+
+    _metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self._metrics is not None:
+                self._metrics.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        # engine.dispose() 시 새 풀에도 같은 통계 객체 유지
+        new_pool = super().recreate()
+        new_pool._metrics = self._metrics
+        return new_pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """대기 시간 측정 QueuePool (동기 엔진)"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """대기 시간 측정 AsyncAdaptedQueuePool (async 엔진)"""
+
+
+# 이름 → (엔진, 통계)
+_registry: dict[str, tuple[Engine, PoolMetrics]] = {}
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolMetrics:
+    """엔진 풀에 통계 수집 이벤트 등록 (async 엔진은 sync_engine 전달)"""
+    metrics = PoolMetrics(name)
+    engine.pool._metrics = metrics
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        with metrics._lock:
+            metrics.connects += 1
+        pool = engine.pool
+        if isinstance(pool, QueuePool) and pool.overflow() > 0:
+            with metrics._lock:
+                metrics.overflow_events += 1
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        with metrics._lock:
+            metrics.checkouts += 1
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        with metrics._lock:
+            metrics.checkins += 1
+
+    _registry[name] = (engine, metrics)
+    return metrics
+
+
+def get_pool_stats() -> dict:
+    """등록된 모든 엔진의 풀 통계"""
+    return {
+        name: {"dialect": engine.dialect.name, **metrics.snapshot(engine.pool)}
+        for name, (engine, metrics) in _registry.items()
+    }
@@ -0,0 +1,336 @@
+"""요청 프로파일링 (스택 샘플링 + 링 버퍼)
+
+다음 요청을 샘플링 프로파일러로 실행합니다.
+- X-Profile-Token 헤더에 슈퍼 관리자가 발급받은 서명 토큰이 있는 요청
+  (토큰을 발급한 관리자 세션이 유효하고 발급자가 아직 활성 슈퍼 관리자인 경우만)
+- PROFILE_SAMPLE_RATE 비율로 무작위 선택된 요청
+
+프로파일 중에는 별도 스레드가 PROFILE_INTERVAL_MS 간격으로 모든 스레드의 스택을 수집합니다.
+앱 코드(app 패키지) 프레임이 포함된 스택만 남기므로 대기 중인 스레드는 제외됩니다.
+(같은 시각에 처리 중인 다른 요청의 스택이 섞일 수 있음)
+
+결과는 최근 PROFILE_BUFFER_SIZE개만 메모리에 보관하며, flamegraph.pl/speedscope에서
+읽을 수 있는 collapsed stack 형식("frame;frame;frame 개수")으로 내려받습니다.
+"""
+
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import anyio
+from jose import JWTError, jwt
+from sqlalchemy import select
+
+import app as app_package
+from app.database import get_async_sessionmaker
+from app.models.admin import Admin
+from app.models.admin_session import AdminSession
+from app.utils.auth import ALGORITHM, get_secret_key
+from app.utils.query_stats import begin_query_stats, current_query_stats, end_query_stats, install_query_stats
+
+PROFILE_HEADER = b"x-profile-token"
+PROFILE_TOKEN_TYPE = "profile"
+
+# 무작위 프로파일 비율 (0~1, 기본 0: 헤더 요청만)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+# 스택 수집 간격 (초)
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL_MS", "2")) / 1000
+# 보관할 프로파일 수 / 프로파일당 보관할 상위 스택 수
+PROFILE_BUFFER_SIZE = int(os.getenv("PROFILE_BUFFER_SIZE", "50"))
+PROFILE_MAX_STACKS = int(os.getenv("PROFILE_MAX_STACKS", "200"))
+# 동시에 프로파일할 최대 요청 수 (초과 시 프로파일 없이 처리)
+PROFILE_MAX_CONCURRENT = int(os.getenv("PROFILE_MAX_CONCURRENT", "2"))
+# 프로파일 토큰 유효 시간 (분)
+PROFILE_TOKEN_MINUTES = int(os.getenv("PROFILE_TOKEN_MINUTES", "10"))
+
+_APP_DIR = os.path.dirname(os.path.abspath(app_package.__file__))
+_BASE_DIR = os.path.dirname(_APP_DIR)
+
+
+# ============================================
+# 프로파일 토큰
+# ============================================
+
+def create_profile_token(admin_email: str, session_id: int) -> tuple[str, datetime]:
+    """프로파일 요청용 서명 토큰 발급 (슈퍼 관리자 전용 엔드포인트에서 호출)
+
+    발급자는 sub가 아닌 admin 클레임에 넣으므로 액세스 토큰으로 사용할 수 없습니다.
+    (decode_access_token도 type 클레임이 있는 토큰은 거부)
+    sid는 발급 요청의 관리자 세션 ID로, 로그아웃/만료되면 토큰도 무효가 됩니다.
+
+    Returns:
+        (토큰, 만료 시각)
+    """
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=PROFILE_TOKEN_MINUTES)
+    token = jwt.encode(
+        {"admin": admin_email, "sid": session_id, "type": PROFILE_TOKEN_TYPE, "exp": expires_at},
+        get_secret_key(),
+        algorithm=ALGORITHM
+    )
+    return token, expires_at
+
+
+def verify_profile_token(token: str) -> dict | None:
+    """서명/만료/용도 확인 후 클레임 반환 (DB 조회 없음, 실패 시 None)"""
+    try:
+        payload = jwt.decode(token, get_secret_key(), algorithms=[ALGORITHM])
+    except (JWTError, ValueError):
+        return None
+    if payload.get("type") != PROFILE_TOKEN_TYPE or not isinstance(payload.get("sid"), int):
+        return None
+    return payload
+
+
+async def profile_session_is_active(app, claims: dict) -> bool:
+    """토큰을 발급한 관리자 세션이 남아 있고 발급자가 활성 슈퍼 관리자인지 확인
+
+    서명만으로는 발급 후 강등/비활성화/삭제/로그아웃된 관리자의 토큰도 통과하므로
+    프로파일할 때마다 primary에서 세션과 관리자를 조회합니다.
+    """
+    provider = app.dependency_overrides.get(get_async_sessionmaker, get_async_sessionmaker)
+    async with provider()() as db:
+        session_id = await db.scalar(
+            select(AdminSession.id).join(
+                Admin, Admin.id == AdminSession.admin_id
+            ).where(
+                AdminSession.id == claims["sid"],
+                AdminSession.expires_at > datetime.utcnow(),
+                Admin.email == claims.get("admin"),
+                Admin.is_active.is_(True),
+                Admin.role == "super_admin"
+            )
+        )
+    return session_id is not None
+
+
+# ============================================
+# 스택 샘플링
+# ============================================
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_BASE_DIR):
+        filename = os.path.relpath(filename, _BASE_DIR)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame) -> str | None:
+    """프레임을 바깥→안쪽 순서 "a;b;c" 문자열로 변환 (앱 코드 프레임이 없으면 None)"""
+    labels = []
+    in_app = False
+    while frame is not None:
+        in_app = in_app or frame.f_code.co_filename.startswith(_APP_DIR)
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    if not in_app:
+        return None
+    labels.reverse()
+    return ";".join(labels)
+
+
+class StackSampler:
+    """일정 간격으로 스레드 스택을 수집하는 백그라운드 스레드"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = collapse_stack(frame)
+                if stack is not None:
+                    self.stacks[stack] += 1
+
+
+# ============================================
+# 결과 보관
+# ============================================
+
+@dataclass
+class RequestProfile:
+    """요청 하나의 프로파일 결과"""
+    id: int
+    method: str
+    path: str
+    route: str
+    status: int
+    trigger: str
+    duration_ms: float
+    db_queries: int
+    db_ms: float
+    samples: int
+    interval_ms: float
+    created_at: datetime
+    stacks: dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        """스택을 제외한 요약"""
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "trigger": self.trigger,
+            "duration_ms": self.duration_ms,
+            "db_queries": self.db_queries,
+            "db_ms": self.db_ms,
+            "samples": self.samples,
+            "interval_ms": self.interval_ms,
+            "created_at": self.created_at,
+            "top_stacks": len(self.stacks),
+        }
+
+
+def collapsed_text(profiles: list[RequestProfile]) -> str:
+    """collapsed stack 형식 (같은 스택은 합산)"""
+    totals: Counter[str] = Counter()
+    for profile in profiles:
+        totals.update(profile.stacks)
+    return "".join(f"{stack} {count}\n" for stack, count in totals.most_common())
+
+
+class ProfileStore:
+    """최근 프로파일 링 버퍼 (스레드 안전)"""
+
+    def __init__(self, maxsize: int):
+        self._profiles: deque[RequestProfile] = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get(self, profile_id: int) -> RequestProfile | None:
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def list(self) -> list[RequestProfile]:
+        """최근 순"""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+
+_store = ProfileStore(PROFILE_BUFFER_SIZE)
+
+
+def get_profile_store() -> ProfileStore:
+    """전역 프로파일 보관소 조회"""
+    return _store
+
+
+# ============================================
+# ASGI 미들웨어
+# ============================================
+
+class ProfilingMiddleware:
+    """프로파일 토큰 헤더 또는 무작위 샘플링으로 선택된 요청만 프로파일
+
+    선택되지 않은 요청은 헤더 확인 외에 추가 작업이 없습니다.
+    (서명이 유효한 토큰 헤더가 있으면 발급 세션 확인 쿼리 1회)
+    SQL 통계 이벤트는 처음 프로파일하는 요청에서 등록하므로, 프로파일이 없으면
+    다른 요청의 쿼리 실행 경로에도 비용이 없습니다.
+    프로파일한 요청의 응답에는 X-Profile-Id 헤더가 붙습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._slots = threading.BoundedSemaphore(PROFILE_MAX_CONCURRENT)
+
+    async def _trigger(self, scope) -> str | None:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                claims = verify_profile_token(value.decode("latin-1"))
+                if claims is None or not await profile_session_is_active(scope["app"], claims):
+                    return None
+                return "header"
+        if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+            return "sampled"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trigger = await self._trigger(scope)
+        if trigger is None or not self._slots.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        store = get_profile_store()
+        profile_id = store.next_id()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", str(profile_id).encode())
+                ]
+            await send(message)
+
+        install_query_stats()
+        sampler = StackSampler(PROFILE_INTERVAL)
+        stats_token = begin_query_stats()
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 샘플러 스레드 종료 대기는 스레드에서 (이벤트 루프를 막지 않음)
+            # 요청이 취소돼도 샘플러 종료/슬롯 반환이 끝나도록 취소를 막음
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(sampler.stop)
+            elapsed = time.perf_counter() - start
+            stats = current_query_stats()
+            end_query_stats(stats_token)
+            self._slots.release()
+            store.add(RequestProfile(
+                id=profile_id,
+                method=scope["method"],
+                path=scope["path"],
+                route=getattr(scope.get("route"), "path", "unmatched"),
+                status=status_code,
+                trigger=trigger,
+                duration_ms=round(elapsed * 1000, 3),
+                db_queries=stats.count,
+                db_ms=round(stats.duration * 1000, 3),
+                samples=sampler.samples,
+                interval_ms=PROFILE_INTERVAL * 1000,
+                created_at=datetime.now(timezone.utc),
+                stacks=dict(sampler.stacks.most_common(PROFILE_MAX_STACKS))
+            ))
@@ -0,0 +1,72 @@
+"""요청별 SQL 실행 통계 (문 수, DB 시간)
+
+모든 Engine(async 엔진의 sync_engine 포함)의 cursor 실행 이벤트에서
+현재 요청의 통계 객체에 누적합니다. 요청 밖(통계 미시작)의 실행은 기록하지 않습니다.
+
+main.py가 DEBUG 모드에서 요청마다 통계를 시작하고 Server-Timing 헤더로 내보냅니다.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    """요청 하나의 SQL 실행 통계 (중첩 시작 시 바깥 통계에도 함께 누적)"""
+    count: int = 0
+    duration: float = 0.0
+    parent: "QueryStats | None" = None
+
+    def server_timing(self, total: float | None = None) -> str:
+        """Server-Timing 헤더 값 (ms)"""
+        metrics = [f'db;desc="{self.count} queries";dur={self.duration * 1000:.2f}']
+        if total is not None:
+            metrics.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_request_stats: ContextVar[QueryStats | None] = ContextVar("sql_query_stats", default=None)
+
+
+def begin_query_stats():
+    """요청 시작 시 통계 초기화 (main.py 미들웨어에서 호출)"""
+    return _request_stats.set(QueryStats(parent=_request_stats.get()))
+
+
+def end_query_stats(token):
+    """요청 종료 시 상태 복원"""
+    _request_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    """현재 요청의 통계 (통계 미시작이면 None)"""
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        # 연결 하나는 한 번에 한 문만 실행하므로 시작 시각 하나만 보관
+        conn.info["query_started_at"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    started_at = conn.info.pop("query_started_at", None)
+    if stats is None or started_at is None:
+        return
+    elapsed = time.perf_counter() - started_at
+    while stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+        stats = stats.parent
+
+
+def install_query_stats():
+    """모든 Engine에 실행 이벤트 등록 (중복 호출 시 무시)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
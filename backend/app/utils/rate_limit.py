@@ -0,0 +1,195 @@
+"""로그인 시도 제한 (인메모리 토큰 버킷 + LRU)
+
+로그인 엔드포인트는 매 요청마다 DB 조회와 비밀번호 해시 검증(수십~수백 ms CPU)을
+수행하므로, 크리덴셜 스터핑 요청은 검증 전에 거부합니다.
+
+- IP별: 모든 로그인 시도를 LOGIN_RATE_LIMIT_PER_IP회 / LOGIN_RATE_LIMIT_WINDOW초로 제한
+- 계정별: 실패 LOGIN_MAX_FAILURES회 / LOGIN_LOCKOUT_SECONDS초를 넘으면 일시 잠금
+  (존재하지 않는 이메일도 같은 방식으로 잠기므로 계정 존재 여부가 드러나지 않음)
+
+프로세스 단위 상태이므로 워커가 여러 개면 워커마다 따로 계산됩니다.
+프록시 뒤에서는 uvicorn --proxy-headers로 request.client가 실제 클라이언트 IP가 되도록 합니다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from fastapi import Request
+
+from app.utils.exceptions import TooManyRequestsException
+
+
+class RateLimiter:
+    """키별 토큰 버킷 (스레드 안전, LRU로 키 개수 제한)
+
+    - 키마다 최대 capacity개 토큰, period초에 capacity개 비율로 연속 충전
+    - 토큰이 1개 미만이면 거부하고 다음 토큰까지 남은 초(Retry-After)를 반환
+    - maxsize를 넘으면 가장 오래 사용되지 않은 키부터 제거 (다시 가득 찬 버킷으로 시작)
+    - capacity가 0 이하면 제한하지 않음
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        period: float,
+        maxsize: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.capacity = capacity
+        self.period = period
+        self.maxsize = maxsize
+        self.rate = capacity / period if capacity > 0 else 0.0
+        self._clock = clock
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.limited = 0
+        self.evictions = 0
+
+    def _tokens(self, key: Hashable, now: float) -> float:
+        """현재 남은 토큰 수 (잠금 안에서 호출)"""
+        entry = self._buckets.get(key)
+        if entry is None:
+            return float(self.capacity)
+        tokens, updated_at = entry
+        return min(float(self.capacity), tokens + (now - updated_at) * self.rate)
+
+    def acquire(self, key: Hashable) -> float:
+        """토큰 1개 사용
+
+        Returns:
+            0.0이면 허용, 그 외에는 다음 시도까지 기다려야 하는 초 (토큰은 사용하지 않음)
+        """
+        if self.capacity <= 0:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            tokens = self._tokens(key, now)
+            if tokens < 1:
+                self._buckets.move_to_end(key)
+                self.limited += 1
+                return (1 - tokens) / self.rate
+
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+            self.allowed += 1
+            return 0.0
+
+    def retry_after(self, key: Hashable) -> float:
+        """토큰을 사용하지 않고 남은 대기 시간만 확인 (0.0이면 허용)"""
+        if self.capacity <= 0:
+            return 0.0
+
+        with self._lock:
+            tokens = self._tokens(key, self._clock())
+            return 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+
+    def reset(self, key: Hashable):
+        """키의 버킷 초기화"""
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def clear(self):
+        """전체 초기화"""
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def stats(self) -> dict:
+        """허용/거부 통계"""
+        with self._lock:
+            return {
+                "size": len(self._buckets),
+                "maxsize": self.maxsize,
+                "capacity": self.capacity,
+                "period_seconds": self.period,
+                "allowed": self.allowed,
+                "limited": self.limited,
+                "evictions": self.evictions,
+            }
+
+
+class LoginThrottle:
+    """로그인 시도 제한 (IP별 시도 횟수 + 계정별 실패 잠금)
+
+    사용 순서:
+        throttle.check(ip, account)   # DB 조회/비밀번호 검증 전, 초과 시 429
+        throttle.record_failure(account)  # 인증 실패 시
+        throttle.record_success(account)  # 인증 성공 시 실패 횟수 초기화
+    """
+
+    def __init__(self, ip_limiter: RateLimiter, account_limiter: RateLimiter):
+        self.ip_limiter = ip_limiter
+        self.account_limiter = account_limiter
+
+    def check(self, client_ip: str, account: Hashable):
+        """시도 허용 여부 확인 (IP 시도 횟수는 이때 차감)
+
+        Raises:
+            TooManyRequestsException: IP 시도 초과 또는 계정 잠금 (Retry-After 포함)
+        """
+        retry_after = self.ip_limiter.acquire(client_ip)
+        if retry_after:
+            raise TooManyRequestsException("로그인 시도가 너무 많습니다. 잠시 후 다시 시도하세요", retry_after)
+
+        retry_after = self.account_limiter.retry_after(account)
+        if retry_after:
+            raise TooManyRequestsException(
+                "로그인 실패가 반복되어 계정이 일시적으로 잠겼습니다. 잠시 후 다시 시도하세요", retry_after
+            )
+
+    def record_failure(self, account: Hashable):
+        """인증 실패 기록"""
+        self.account_limiter.acquire(account)
+
+    def record_success(self, account: Hashable):
+        """인증 성공 시 실패 기록 초기화"""
+        self.account_limiter.reset(account)
+
+    def clear(self):
+        """전체 초기화"""
+        self.ip_limiter.clear()
+        self.account_limiter.clear()
+
+    def stats(self) -> dict:
+        """IP/계정별 제한 통계"""
+        return {"ip": self.ip_limiter.stats(), "account": self.account_limiter.stats()}
+
+
+def client_ip(request: Request) -> str:
+    """요청 클라이언트 IP (알 수 없으면 "unknown")"""
+    return request.client.host if request.client else "unknown"
+
+
+def login_account_key(scope: str, email: str) -> tuple[str, str]:
+    """계정별 잠금 키 (사용자/관리자/2차 인증 구분, 이메일 대소문자 무시)"""
+    return scope, email.strip().lower()
+
+
+_maxsize = int(os.getenv("LOGIN_RATE_LIMIT_MAXSIZE", "10000"))
+_login_throttle = LoginThrottle(
+    ip_limiter=RateLimiter(
+        capacity=int(os.getenv("LOGIN_RATE_LIMIT_PER_IP", "30")),
+        period=float(os.getenv("LOGIN_RATE_LIMIT_WINDOW", "60")),
+        maxsize=_maxsize
+    ),
+    account_limiter=RateLimiter(
+        capacity=int(os.getenv("LOGIN_MAX_FAILURES", "5")),
+        period=float(os.getenv("LOGIN_LOCKOUT_SECONDS", "900")),
+        maxsize=_maxsize
+    )
+)
+
+
+def get_login_throttle() -> LoginThrottle:
+    """전역 로그인 시도 제한기 조회"""
+    return _login_throttle
@@ -0,0 +1,196 @@
+"""읽기 전용 복제본(replica) 관리 및 클라이언트 단위 read-your-writes 추적"""
+
+import asyncio
+import itertools
+import math
+import threading
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+# 복제 지연(초) 측정 쿼리 (없는 DB는 연결 확인만 하고 지연 0으로 간주)
+# PostgreSQL: 받은 WAL을 모두 재생했으면 0 (primary에 쓰기가 없는 동안 지연이 늘어나지 않게),
+# 재생할 WAL이 남았을 때만 마지막 재생 트랜잭션 시각과의 차이
+LAG_QUERIES = {
+    "postgresql": (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    ),
+}
+
+
+# ============================================
+# 클라이언트 단위 쓰기 추적 (read-your-writes)
+# ============================================
+
+# primary에 커밋한 클라이언트에 내려주는 쿠키 (값: primary에서 읽을 기한, epoch 초)
+PRIMARY_READ_COOKIE = "db_primary_until"
+
+# 요청마다 미들웨어가 새 dict를 넣음. 스레드풀로 컨텍스트가 복사되어도 같은 객체를 공유
+_request_state: ContextVar[dict | None] = ContextVar("db_request_state", default=None)
+
+
+def begin_request_state(recent_write: bool = False):
+    """요청 시작 시 쓰기 추적 상태 초기화 (PrimaryWriteTrackingMiddleware에서 호출)
+
+    recent_write: 이 클라이언트가 최근(max_lag 이내) primary에 커밋했는지 여부
+    """
+    return _request_state.set({"primary_committed": False, "recent_write": recent_write})
+
+
+def end_request_state(token):
+    """요청 종료 시 상태 복원"""
+    _request_state.reset(token)
+
+
+def mark_primary_committed():
+    """primary 커밋 기록 (이후 같은 요청과 이 클라이언트의 다음 요청들의 읽기는 primary로)"""
+    state = _request_state.get()
+    if state is not None:
+        state["primary_committed"] = True
+
+
+def reads_need_primary() -> bool:
+    """현재 요청 또는 최근 요청에서 이 클라이언트가 primary에 커밋했는지 여부"""
+    state = _request_state.get()
+    return bool(state and (state["primary_committed"] or state["recent_write"]))
+
+
+def _cookie_deadline(headers) -> float:
+    """요청 Cookie 헤더의 PRIMARY_READ_COOKIE 값 (없거나 잘못되면 0)"""
+    prefix = PRIMARY_READ_COOKIE + "="
+    for name, value in headers:
+        if name != b"cookie":
+            continue
+        for part in value.decode("latin-1").split(";"):
+            part = part.strip()
+            if part.startswith(prefix):
+                try:
+                    return float(part[len(prefix):])
+                except ValueError:
+                    return 0.0
+    return 0.0
+
+
+class PrimaryWriteTrackingMiddleware:
+    """클라이언트별 primary 커밋 추적 (커밋 후 max_lag초 동안 그 클라이언트의 읽기는 primary로)
+
+    요청에서 primary에 커밋하면 응답에 기한(현재 + max_lag)을 담은 쿠키를 붙이고,
+    기한이 남은 쿠키를 보낸 요청의 읽기는 복제본 대신 primary에서 처리합니다.
+    복제본이 설정된 경우에만 등록합니다 (main.py). 응답 본문을 감싸지 않는 ASGI 미들웨어입니다.
+    """
+
+    def __init__(self, app, max_lag: float = 5.0):
+        self.app = app
+        self.max_lag = max_lag
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_request_state(recent_write=_cookie_deadline(scope["headers"]) > time.time())
+        state = _request_state.get()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and state["primary_committed"]:
+                deadline = time.time() + self.max_lag
+                cookie = (
+                    f"{PRIMARY_READ_COOKIE}={deadline:.3f}; Max-Age={math.ceil(self.max_lag)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request_state(token)
+
+
+# ============================================
+# 복제본 상태 관리
+# ============================================
+
+class Replica:
+    """복제본 하나의 엔진과 상태"""
+
+    def __init__(self, name: str, engine: Engine, async_engine: AsyncEngine | None = None):
+        self.name = name
+        self.engine = engine
+        self.async_engine = async_engine
+        self.lag: float | None = None
+        self.healthy = False
+        self.last_checked: float | None = None
+        self.last_error: str | None = None
+
+
+class ReplicaSet:
+    """복제본 목록, 지연 측정, 라운드로빈 선택
+
+    지연이 max_lag를 넘거나 측정에 실패한 복제본은 선택하지 않습니다.
+    한 번도 측정하지 않은 복제본도 사용하지 않습니다 (refresh 후 사용).
+    """
+
+    def __init__(self, replicas: list[Replica], max_lag: float = 5.0, check_interval: float = 5.0):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._cycle = itertools.cycle(range(len(replicas))) if replicas else None
+        self._lock = threading.Lock()
+        self.primary_fallbacks = 0
+
+    def refresh(self):
+        """모든 복제본의 지연 시간 측정"""
+        for replica in self.replicas:
+            query = LAG_QUERIES.get(replica.engine.dialect.name, "SELECT 0")
+            try:
+                with replica.engine.connect() as connection:
+                    lag = float(connection.execute(text(query)).scalar() or 0)
+                replica.lag = lag
+                replica.healthy = lag <= self.max_lag
+                replica.last_error = None
+            except Exception as exc:
+                replica.lag = None
+                replica.healthy = False
+                replica.last_error = str(exc)
+            replica.last_checked = time.time()
+
+    async def run_forever(self):
+        """check_interval마다 지연 측정 (서버 시작 시 백그라운드 태스크로 실행)"""
+        while True:
+            await asyncio.to_thread(self.refresh)
+            await asyncio.sleep(self.check_interval)
+
+    def choose(self) -> Replica | None:
+        """정상 복제본 하나 선택 (없으면 None → primary 사용)"""
+        if self._cycle is None:
+            return None
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                replica = self.replicas[next(self._cycle)]
+                if replica.healthy:
+                    return replica
+            self.primary_fallbacks += 1
+        return None
+
+    def stats(self) -> dict:
+        """복제본 상태"""
+        return {
+            "max_lag_seconds": self.max_lag,
+            "primary_fallbacks": self.primary_fallbacks,
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "lag_seconds": replica.lag,
+                    "last_checked": replica.last_checked,
+                    "last_error": replica.last_error,
+                }
+                for replica in self.replicas
+            ],
+        }
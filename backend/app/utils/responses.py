@@ -0,0 +1,101 @@
+"""JSON 응답 클래스와 빠른 직렬화 경로
+
+- JSON_RESPONSE=orjson (기본): 모든 응답을 orjson으로 직렬화 (FastJSONResponse)
+- JSON_RESPONSE=default: FastAPI 기본 JSONResponse (json.dumps)
+
+response_model이 있는 엔드포인트가 ORM 객체를 반환하면 FastAPI는
+검증 → 파이썬 객체로 직렬화 → JSON 인코딩 순서로 처리하고, Pydantic 모델을
+반환하면 dict로 바꾼 뒤 다시 검증합니다. 아래 함수들은 Response를 직접
+반환해 이 과정을 건너뜁니다 (response_model은 OpenAPI 문서용으로 유지).
+- orm_response/page_response: DB에서 읽은 값을 그대로 신뢰하고 스키마 필드만
+  꺼내 orjson으로 직렬화 (검증 없음)
+- model_response: 스키마로 한 번만 검증 후 pydantic-core로 직렬화
+  (exclude_unset 등 검증이 필요한 응답용)
+"""
+
+import os
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 직렬화 응답 (UTC datetime은 Pydantic과 같은 "Z" 표기)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+def get_json_response_class(name: str | None = None) -> type[JSONResponse]:
+    """JSON_RESPONSE 설정에 맞는 기본 응답 클래스"""
+    if name is None:
+        name = os.getenv("JSON_RESPONSE", "orjson")
+    if name == "orjson":
+        return FastJSONResponse
+    if name == "default":
+        return JSONResponse
+    raise ValueError(f"알 수 없는 JSON_RESPONSE 설정입니다: {name}")
+
+
+@lru_cache(maxsize=None)
+def _get_row_builder(schema: type[BaseModel]) -> Callable[[Any], dict]:
+    """스키마 필드 값을 한 번에 꺼내 dict로 만드는 함수 (스키마별 캐시)"""
+    fields = tuple(schema.model_fields)
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda obj: {fields[0]: getter(obj)}
+    return lambda obj: dict(zip(fields, getter(obj)))
+
+
+def orm_rows(schema: type[BaseModel], objects) -> list[dict]:
+    """ORM 객체(또는 Pydantic 모델) 목록에서 스키마 필드만 추출 (검증 없음)"""
+    build = _get_row_builder(schema)
+    return [build(obj) for obj in objects]
+
+
+def orm_response(schema: type[BaseModel], content: Any, status_code: int = 200) -> Response:
+    """from_attributes 스키마 응답 (content는 객체 하나 또는 목록)"""
+    if isinstance(content, (list, tuple)):
+        body = orm_rows(schema, content)
+    else:
+        body = _get_row_builder(schema)(content)
+    return FastJSONResponse(body, status_code=status_code)
+
+
+def page_response(schema: type[BaseModel], items, total: int, next_cursor: str | None) -> Response:
+    """CursorPage 형식 응답 (items는 schema 필드만 추출)"""
+    return FastJSONResponse({
+        "items": orm_rows(schema, items),
+        "total": total,
+        "next_cursor": next_cursor,
+    })
+
+
+@lru_cache(maxsize=None)
+def _get_adapter(schema: Any) -> TypeAdapter:
+    """스키마별 TypeAdapter (생성 비용이 커서 재사용)"""
+    return TypeAdapter(schema)
+
+
+def model_response(
+    schema: Any,
+    content: Any,
+    status_code: int = 200,
+    exclude_unset: bool = False
+) -> Response:
+    """content를 schema로 한 번 검증해 JSON 응답 생성
+
+    schema는 스키마 또는 list[스키마] 등 타입이며, content는 ORM 객체, dict,
+    스키마 인스턴스 또는 그 목록입니다.
+    """
+    adapter = _get_adapter(schema)
+    value = adapter.validate_python(content, from_attributes=True)
+    return Response(
+        adapter.dump_json(value, exclude_unset=exclude_unset),
+        status_code=status_code,
+        media_type="application/json"
+    )
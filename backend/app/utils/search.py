@@ -0,0 +1,67 @@
+"""예제 전문 검색
+
+SQLite는 examples_fts(FTS5) 인덱스에서 bm25 점수 순으로 찾고,
+그 외 DB는 name/description 부분 일치(ILIKE) 검색으로 대체합니다 (점수 0).
+결과는 (rank, id) 순서이며 키셋 커서로 다음 페이지를 조회합니다.
+"""
+
+from sqlalchemy import Select, Subquery, func, literal, literal_column, or_, select, table, tuple_
+
+from app.models.example import Example
+from app.utils.exceptions import BadRequestException
+from app.utils.pagination import decode_rank_cursor, encode_rank_cursor
+
+# bm25 컬럼 가중치 (이름 일치를 설명 일치보다 우선)
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+
+def fts_query(q: str) -> str:
+    """검색어를 FTS5 MATCH 식으로 변환 (단어마다 접두사 검색, 모든 단어 포함)
+
+    단어를 따옴표로 감싸 FTS5 연산자(AND, OR, NEAR, * 등)로 해석되지 않게 합니다.
+    """
+    terms = q.split()
+    if not terms:
+        raise BadRequestException("검색어를 입력해야 합니다")
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
+def example_matches(dialect_name: str, q: str) -> Subquery:
+    """검색어와 일치하는 예제의 (id, rank) 서브쿼리 (rank가 작을수록 관련도 높음)"""
+    if dialect_name == "sqlite":
+        fts = literal_column("examples_fts")
+        return select(
+            literal_column("examples_fts.rowid").label("id"),
+            func.bm25(fts, NAME_WEIGHT, DESCRIPTION_WEIGHT).label("rank")
+        ).select_from(
+            table("examples_fts")
+        ).where(
+            fts.op("MATCH")(fts_query(q))
+        ).subquery()
+
+    if not q.strip():
+        raise BadRequestException("검색어를 입력해야 합니다")
+    return select(
+        Example.id.label("id"),
+        literal(0.0).label("rank")
+    ).where(
+        or_(Example.name.icontains(q, autoescape=True), Example.description.icontains(q, autoescape=True))
+    ).subquery()
+
+
+def search_page_query(matches: Subquery, cursor: str | None, limit: int) -> Select:
+    """(rank, id) 순 한 페이지 조회 (limit + 1개로 다음 페이지 확인)"""
+    query = select(matches.c.id, matches.c.rank)
+    if cursor:
+        rank, row_id = decode_rank_cursor(cursor)
+        query = query.where(tuple_(matches.c.rank, matches.c.id) > tuple_(literal(rank), literal(row_id)))
+    return query.order_by(matches.c.rank, matches.c.id).limit(limit + 1)
+
+
+def split_search_page(rows: list, limit: int) -> tuple[list, str | None]:
+    """limit + 1개 조회 결과를 (현재 페이지, 다음 커서)로 분리"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_rank_cursor(rows[-1].rank, rows[-1].id)
@@ -0,0 +1,209 @@
+"""사용자 일괄 가져오기 (NDJSON/CSV 스트리밍 본문)
+
+행을 배치 단위로 처리합니다.
+1. 행 검증 (UserCreate) 및 파일 내 중복 확인
+2. 이메일/사용자명 기존 중복을 IN 쿼리 2번으로 확인
+3. 비밀번호를 병렬 해싱 (프로세스 풀)
+4. 배치 INSERT 후 커밋
+
+실패한 행은 결과 보고서에 기록하고 다음 행을 계속 처리합니다.
+"""
+
+import asyncio
+import csv
+import json
+import os
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.schemas.user import UserCreate
+from app.utils.auth import hash_password_async
+from app.utils.exceptions import UNIQUE_VIOLATION_MESSAGES, unique_violation_column
+
+# 한 줄(행)의 최대 바이트 수 (초과한 줄은 invalid로 보고하고 건너뜀)
+IMPORT_MAX_LINE_BYTES = int(os.getenv("IMPORT_MAX_LINE_BYTES", "65536"))
+LINE_TOO_LONG = "행이 너무 깁니다"
+
+
+def _decode_line(line: bytes) -> tuple[str | None, str | None]:
+    if len(line) > IMPORT_MAX_LINE_BYTES:
+        return None, LINE_TOO_LONG
+    try:
+        return line.decode("utf-8-sig").rstrip("\r"), None
+    except UnicodeDecodeError:
+        return None, "UTF-8 인코딩이 올바르지 않습니다"
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[str | None, str | None]]:
+    """바이트 청크 스트림을 줄 단위로 분리 (빈 줄 제외)
+
+    (줄, 오류)를 반환합니다. UTF-8이 아니거나 IMPORT_MAX_LINE_BYTES를 넘는 줄은
+    오류만 반환하며, 너무 긴 줄은 다음 줄바꿈까지 버퍼에 쌓지 않고 버립니다.
+    """
+    buffer = b""
+    skipping = False  # 너무 긴 줄의 나머지를 버리는 중
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            if line.strip():
+                yield _decode_line(line)
+        if len(buffer) > IMPORT_MAX_LINE_BYTES:
+            if not skipping:
+                yield None, LINE_TOO_LONG
+            skipping = True
+            buffer = b""
+    if buffer.strip() and not skipping:
+        yield _decode_line(buffer)
+
+
+async def iter_records(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """(행 번호, 레코드, 파싱 오류) 반환
+
+    CSV는 첫 줄을 헤더로 사용하며 따옴표 안의 줄바꿈은 지원하지 않습니다.
+    """
+    header = None
+    row_number = 0
+    async for line, error in iter_lines(chunks):
+        if error is not None:
+            row_number += 1
+            yield row_number, None, error
+            continue
+        if fmt == "csv":
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            row_number += 1
+            if len(values) != len(header):
+                yield row_number, None, "컬럼 수가 헤더와 다릅니다"
+                continue
+            yield row_number, dict(zip(header, values)), None
+        else:
+            row_number += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield row_number, None, "JSON 형식이 올바르지 않습니다"
+                continue
+            if not isinstance(record, dict):
+                yield row_number, None, "JSON 객체가 아닙니다"
+                continue
+            yield row_number, record, None
+
+
+class UserImporter:
+    """배치 단위 사용자 가져오기 및 행별 결과 보고서"""
+
+    def __init__(self, db: AsyncSession, batch_size: int = 500):
+        self.db = db
+        self.batch_size = batch_size
+        self.results: list[dict] = []
+        self._seen_emails: set[str] = set()
+        self._seen_usernames: set[str] = set()
+
+    def _report(self, row: int, status: str, message: str | None = None, user_id: int | None = None):
+        result = {"row": row, "status": status}
+        if user_id is not None:
+            result["id"] = user_id
+        if message is not None:
+            result["message"] = message
+        self.results.append(result)
+
+    async def run(self, records: AsyncIterator[tuple[int, dict | None, str | None]]) -> dict:
+        """모든 레코드를 가져오고 보고서 반환"""
+        batch: list[tuple[int, UserCreate]] = []
+        async for row, record, error in records:
+            if error is not None:
+                self._report(row, "invalid", error)
+                continue
+            try:
+                user = UserCreate.model_validate(record)
+            except ValidationError as exc:
+                fields = ", ".join(".".join(str(x) for x in e["loc"]) for e in exc.errors())
+                self._report(row, "invalid", f"입력값 검증에 실패했습니다: {fields}")
+                continue
+
+            # 같은 파일 안의 중복 (먼저 나온 행 우선)
+            if user.email in self._seen_emails:
+                self._report(row, "duplicate", "이미 등록된 이메일입니다")
+                continue
+            if user.username in self._seen_usernames:
+                self._report(row, "duplicate", "이미 사용 중인 사용자명입니다")
+                continue
+            self._seen_emails.add(user.email)
+            self._seen_usernames.add(user.username)
+
+            batch.append((row, user))
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+
+        if batch:
+            await self._flush(batch)
+
+        self.results.sort(key=lambda result: result["row"])
+        summary = {"created": 0, "duplicate": 0, "invalid": 0}
+        for result in self.results:
+            summary[result["status"]] += 1
+        return {"total": len(self.results), **summary, "results": self.results}
+
+    async def _flush(self, batch: list[tuple[int, UserCreate]]):
+        """배치 하나 처리: 기존 중복 확인 → 병렬 해싱 → INSERT"""
+        emails = [user.email for _, user in batch]
+        usernames = [user.username for _, user in batch]
+        existing_emails = set(await self.db.scalars(select(User.email).where(User.email.in_(emails))))
+        existing_usernames = set(await self.db.scalars(select(User.username).where(User.username.in_(usernames))))
+
+        pending = []
+        for row, user in batch:
+            if user.email in existing_emails:
+                self._report(row, "duplicate", "이미 등록된 이메일입니다")
+            elif user.username in existing_usernames:
+                self._report(row, "duplicate", "이미 사용 중인 사용자명입니다")
+            else:
+                pending.append((row, user))
+        if not pending:
+            return
+
+        hashes = await asyncio.gather(*(hash_password_async(user.password) for _, user in pending))
+        values = [
+            {"email": user.email, "username": user.username, "hashed_password": hashed, "is_active": True}
+            for (_, user), hashed in zip(pending, hashes)
+        ]
+
+        try:
+            # RETURNING 순서는 보장되지 않으므로 이메일로 ID 매칭
+            result = await self.db.execute(insert(User).returning(User.email, User.id), values)
+            ids = dict(result.all())
+            await self.db.commit()
+        except IntegrityError:
+            # 중복 확인 이후 다른 요청이 같은 값을 등록한 경우: 행 단위로 재시도
+            await self.db.rollback()
+            await self._insert_one_by_one(pending, values)
+            return
+
+        for row, user in pending:
+            self._report(row, "created", user_id=ids[user.email])
+
+    async def _insert_one_by_one(self, pending: list[tuple[int, UserCreate]], values: list[dict]):
+        for (row, _), value in zip(pending, values):
+            try:
+                user_id = await self.db.scalar(insert(User).returning(User.id).values(**value))
+                await self.db.commit()
+            except IntegrityError as exc:
+                await self.db.rollback()
+                message = UNIQUE_VIOLATION_MESSAGES.get(unique_violation_column(exc))
+                if message is None:
+                    raise
+                self._report(row, "duplicate", message)
+                continue
+            self._report(row, "created", user_id=user_id)
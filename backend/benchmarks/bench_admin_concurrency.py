@@ -0,0 +1,123 @@
+"""관리자 트래픽이 다른 엔드포인트 지연 시간에 미치는 영향 벤치마크
+
+/api/health 요청의 p50/p99 지연 시간을
+(1) 단독 실행, (2) 관리자 API 부하와 동시 실행 두 경우로 측정합니다.
+관리자 인증 체인이 이벤트 루프를 막지 않으면 두 결과의 차이가 작아야 합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_admin_concurrency.py --requests 500 --admin-workers 8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+# 세션 캐시를 끄고 매 요청마다 DB 조회가 일어나도록 설정
+os.environ["ADMIN_SESSION_CACHE_TTL"] = "0"
+
+import httpx
+
+from common import app, configure_app, percentile, use_database
+from app.models.admin import Admin
+from app.utils.auth import hash_password
+
+
+def create_bench_admin(SessionLocal):
+    """벤치마크용 슈퍼 관리자 생성"""
+    db = SessionLocal()
+    db.add(Admin(
+        email="bench@admin.com",
+        username="benchadmin",
+        hashed_password=hash_password("benchpass"),
+        role="super_admin",
+        is_active=True
+    ))
+    db.commit()
+    db.close()
+
+
+async def measure_health(client: httpx.AsyncClient, total: int, concurrency: int) -> list[float]:
+    """/api/health 지연 시간 측정"""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get("/api/health")
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+async def admin_load(client: httpx.AsyncClient, token: str, stop: asyncio.Event, counter: list[int]):
+    """중지 신호까지 관리자 API 반복 호출"""
+    headers = {"Authorization": f"Bearer {token}"}
+    while not stop.is_set():
+        response = await client.get("/api/admin/users", headers=headers)
+        assert response.status_code == 200
+        counter[0] += 1
+
+
+async def run(args):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        login = await client.post("/api/admin/auth/login", json={
+            "email": "bench@admin.com",
+            "password": "benchpass"
+        })
+        token = login.json()["access_token"]
+
+        # 워밍업
+        await measure_health(client, 50, args.concurrency)
+
+        baseline = await measure_health(client, args.requests, args.concurrency)
+
+        stop = asyncio.Event()
+        counter = [0]
+        workers = [
+            asyncio.create_task(admin_load(client, token, stop, counter))
+            for _ in range(args.admin_workers)
+        ]
+        start = time.perf_counter()
+        loaded = await measure_health(client, args.requests, args.concurrency)
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await asyncio.gather(*workers)
+
+    print("=" * 60)
+    print(f"{'scenario':<28}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}")
+    print("-" * 60)
+    for name, values in (("health only", baseline), ("health + admin load", loaded)):
+        print(f"{name:<28}{percentile(values, 50):>10.2f}{percentile(values, 99):>10.2f}"
+              f"{max(values) * 1000:>10.2f}")
+    print("-" * 60)
+    print(f"admin requests completed during load: {counter[0]} ({counter[0] / elapsed:.0f} req/s)")
+    print(f"p99 ratio (loaded / baseline): "
+          f"{percentile(loaded, 99) / percentile(baseline, 99):.2f}x")
+    print(f"mean health latency: {statistics.mean(baseline) * 1000:.2f}ms -> "
+          f"{statistics.mean(loaded) * 1000:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="측정할 /api/health 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="/api/health 동시 요청 수")
+    parser.add_argument("--admin-workers", type=int, default=8, help="동시 관리자 요청 루프 수")
+    args = parser.parse_args()
+
+    configure_app()
+    with tempfile.TemporaryDirectory() as tmp:
+        SessionLocal, _ = use_database(os.path.join(tmp, "bench.db"))
+        create_bench_admin(SessionLocal)
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
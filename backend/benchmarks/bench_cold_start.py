@@ -0,0 +1,82 @@
+"""워커 콜드 스타트 벤치마크 (create_all vs 스키마 버전 확인)
+
+새 프로세스에서 app.main import 시간과 시작 시 스키마 단계를 측정합니다.
+- create_all: 기존 방식 (import 시 Base.metadata.create_all, 테이블마다 스키마 조회)
+- check_schema: schema_version 쿼리 1회
+
+실행:
+    cd backend
+    python benchmarks/bench_cold_start.py --runs 10
+    DATABASE_URL=postgresql://... python benchmarks/bench_cold_start.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CHILD = """
+import json, time
+start = time.perf_counter()
+import app.main
+import_ms = (time.perf_counter() - start) * 1000
+
+from sqlalchemy import event
+from app.database import Base, engine
+from app.migrations import check_schema
+
+queries = 0
+def count(*args):
+    global queries
+    queries += 1
+event.listen(engine, "before_cursor_execute", count)
+
+start = time.perf_counter()
+if {mode!r} == "create_all":
+    Base.metadata.create_all(bind=engine)
+else:
+    check_schema(engine)
+schema_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"import_ms": import_ms, "schema_ms": schema_ms, "queries": queries}}))
+"""
+
+
+def run_child(mode: str, env: dict) -> dict:
+    """새 프로세스에서 한 번 측정"""
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(mode=mode)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="방식별 프로세스 실행 횟수")
+    args = parser.parse_args()
+
+    env = dict(os.environ, SECRET_KEY="benchmark-secret-key")
+    if "DATABASE_URL" not in env:
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'cold_start.db')}"
+
+    # 마이그레이션된 DB 준비 (두 방식 모두 테이블이 이미 있는 상태에서 측정)
+    subprocess.run([sys.executable, "migrate.py"], cwd=BACKEND_DIR, env=env, check=True, capture_output=True)
+
+    print(f"{'mode':<14}{'import p50':>12}{'schema p50':>12}{'schema max':>12}{'queries':>9}")
+    for mode in ("create_all", "check_schema"):
+        results = [run_child(mode, env) for _ in range(args.runs)]
+        import_ms = statistics.median(result["import_ms"] for result in results)
+        schema = [result["schema_ms"] for result in results]
+        print(
+            f"{mode:<14}{import_ms:>10.1f}ms{statistics.median(schema):>10.2f}ms"
+            f"{max(schema):>10.2f}ms{results[0]['queries']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""예제 일괄 생성/삭제 처리량 벤치마크 (행/초)
+
+단건 엔드포인트(POST /api/examples/, DELETE /api/examples/{id})를 동시 요청으로
+호출한 경우와 일괄 엔드포인트(POST/DELETE /api/examples/bulk)를 비교합니다.
+단건은 행마다 요청 1회 + 커밋 1회, 일괄은 배치마다 executemany/집합 삭제 + 커밋 1회입니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_examples_bulk.py --single-rows 2000 --bulk-rows 100000
+    EXAMPLES_BULK_BATCH_SIZE=5000 python benchmarks/bench_examples_bulk.py
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from common import app, configure_app, login_bench_admin, use_database
+from app.routers import examples
+
+
+async def bench_single(client: httpx.AsyncClient, rows: int, concurrency: int) -> tuple[float, float]:
+    """단건 생성 후 단건 삭제 (행/초)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    ids = []
+
+    async def create(i: int):
+        async with semaphore:
+            response = await client.post("/api/examples/", json={"name": f"single {i}", "description": "bench"})
+            ids.append(response.json()["id"])
+
+    async def remove(example_id: int):
+        async with semaphore:
+            await client.delete(f"/api/examples/{example_id}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(create(i) for i in range(rows)))
+    create_rate = rows / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(remove(example_id) for example_id in ids))
+    delete_rate = rows / (time.perf_counter() - start)
+    return create_rate, delete_rate
+
+
+async def bench_bulk(client: httpx.AsyncClient, rows: int, request_rows: int) -> tuple[float, float]:
+    """일괄 생성(요청당 request_rows행) 후 절반은 id 목록, 나머지는 범위로 삭제 (행/초)"""
+    ids = []
+    start = time.perf_counter()
+    for offset in range(0, rows, request_rows):
+        items = [
+            {"name": f"bulk {i}", "description": "bench"}
+            for i in range(offset, min(offset + request_rows, rows))
+        ]
+        response = await client.post("/api/examples/bulk", json={"items": items})
+        ids.extend(response.json()["ids"])
+    create_rate = rows / (time.perf_counter() - start)
+
+    half = len(ids) // 2
+    start = time.perf_counter()
+    deleted = 0
+    for offset in range(0, half, request_rows):
+        response = await client.request("DELETE", "/api/examples/bulk", json={"ids": ids[offset:offset + request_rows]})
+        deleted += response.json()["deleted"]
+    response = await client.request("DELETE", "/api/examples/bulk", json={"created_after": "2000-01-01T00:00:00"})
+    deleted += response.json()["deleted"]
+    delete_rate = deleted / (time.perf_counter() - start)
+    assert deleted == rows, f"삭제 개수 불일치: {deleted} != {rows}"
+    return create_rate, delete_rate
+
+
+async def run(args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        SessionLocal, _ = use_database(os.path.join(tmp, "examples_bulk.db"), profile=args.profile)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            single = await bench_single(client, args.single_rows, args.concurrency)
+            # 일괄 엔드포인트는 관리자 전용
+            client.headers.update(await login_bench_admin(client, SessionLocal))
+            bulk = await bench_bulk(client, args.bulk_rows, args.request_rows)
+        app.dependency_overrides.clear()
+    return {"single": single, "bulk": bulk}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--single-rows", type=int, default=2000, help="단건 엔드포인트로 처리할 행 수")
+    parser.add_argument("--bulk-rows", type=int, default=100_000, help="일괄 엔드포인트로 처리할 행 수")
+    parser.add_argument("--request-rows", type=int, default=10_000, help="일괄 요청 하나에 담을 행 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="단건 요청 동시 실행 수")
+    parser.add_argument("--profile", default="production", help="SQLite 프로필")
+    args = parser.parse_args()
+
+    configure_app()
+    results = asyncio.run(run(args))
+
+    print(f"batch size: {examples.EXAMPLES_BULK_BATCH_SIZE}, profile: {args.profile}")
+    print(f"{'mode':<10}{'create rows/s':>16}{'delete rows/s':>16}")
+    for mode, (create_rate, delete_rate) in results.items():
+        print(f"{mode:<10}{create_rate:>16.0f}{delete_rate:>16.0f}")
+    single_create, single_delete = results["single"]
+    bulk_create, bulk_delete = results["bulk"]
+    print(f"{'speedup':<10}{bulk_create / single_create:>15.1f}x{bulk_delete / single_delete:>15.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""예제 검색 지연 시간 벤치마크 (FTS5 bm25 vs LIKE '%q%')
+
+rows개의 예제를 만든 뒤 같은 검색어로 한 페이지 + 전체 개수를 조회합니다.
+fts는 SQLite 검색 경로(examples_fts MATCH, bm25 순),
+like는 FTS가 없는 DB용 대체 경로(name/description 부분 일치, 전체 스캔)입니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_examples_search.py               # 1,000,000행
+    python benchmarks/bench_examples_search.py --rows 100000 --repeat 50
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import func, insert, select
+
+from common import percentile, use_database
+from app.models import Example
+from app.utils.search import example_matches, search_page_query
+
+WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel", "india", "juliet",
+    "kilo", "lima", "mike", "november", "oscar", "papa", "quebec", "romeo", "sierra", "tango",
+    "uniform", "victor", "whiskey", "xray", "yankee", "zulu", "검색", "예제", "데이터", "성능",
+]
+QUERIES = ["alpha", "zulu tango", "검색", "nov", "rare0042"]
+
+
+def seed(SessionLocal, rows: int, batch: int = 50_000):
+    """임의 단어로 이름/설명 생성 (rare로 시작하는 희귀 단어 포함)"""
+    rng = random.Random(42)
+    with SessionLocal() as db:
+        for start in range(0, rows, batch):
+            items = [
+                {
+                    "name": " ".join(rng.choices(WORDS, k=3)) + (f" rare{i % 10_000:04d}" if i % 997 == 0 else ""),
+                    "description": " ".join(rng.choices(WORDS, k=12)),
+                }
+                for i in range(start, min(start + batch, rows))
+            ]
+            db.execute(insert(Example), items)
+            db.commit()
+
+
+def bench(SessionLocal, dialect_name: str, q: str, limit: int, repeat: int) -> list[float]:
+    """첫 페이지 + 전체 개수 조회 시간 (초)"""
+    timings = []
+    with SessionLocal() as db:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            matches = example_matches(dialect_name, q)
+            db.execute(search_page_query(matches, None, limit)).all()
+            db.scalar(select(func.count()).select_from(matches))
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="예제 행 수")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--repeat", type=int, default=20, help="검색어별 반복 횟수")
+    parser.add_argument("--profile", default="production", help="SQLite 프로필")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        SessionLocal, _ = use_database(os.path.join(tmp, "examples_search.db"), profile=args.profile)
+        start = time.perf_counter()
+        seed(SessionLocal, args.rows)
+        print(f"seeded {args.rows} rows in {time.perf_counter() - start:.1f}s (FTS 트리거 포함)")
+
+        print(f"{'query':<14}{'fts p50 ms':>12}{'fts p95 ms':>12}{'like p50 ms':>13}{'like p95 ms':>13}{'speedup':>9}")
+        for q in QUERIES:
+            fts = bench(SessionLocal, "sqlite", q, args.limit, args.repeat)
+            like = bench(SessionLocal, "like", q, args.limit, max(1, args.repeat // 4))
+            print(
+                f"{q:<14}{percentile(fts, 50):>12.2f}{percentile(fts, 95):>12.2f}"
+                f"{percentile(like, 50):>13.2f}{percentile(like, 95):>13.2f}"
+                f"{percentile(like, 50) / percentile(fts, 50):>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""메트릭 수집 비용 벤치마크
+
+1. 기록 연산 호출당 ns (Counter.inc, Histogram.observe, 단일/다중 스레드)
+2. /api/health 요청 지연 시간: MetricsMiddleware 사용 vs 미사용 (같은 프로세스, 번갈아 측정)
+3. /metrics 렌더링 시간 (라우트 수만큼 라벨 조합을 채운 상태)
+
+실행:
+    cd backend
+    python benchmarks/bench_metrics.py --ops 1000000 --requests 5000
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+import httpx
+
+import common  # noqa: F401 (backend 경로 설정)
+
+import app.main as main
+from app.utils.metrics import MetricsRegistry, get_metrics_registry
+
+
+def bench_ops(ops: int, threads: int) -> dict:
+    """기록 연산 호출당 ns"""
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "bench", ("method", "route", "status"))
+    histogram = registry.histogram("bench_seconds", "bench", ("method", "route"))
+    results = {}
+
+    def run(fn, per_thread: int):
+        def worker():
+            for i in range(per_thread):
+                fn(i)
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return (time.perf_counter() - start) / (per_thread * threads) * 1e9
+
+    per_thread = ops // threads
+    results["counter.inc"] = run(lambda i: counter.inc("GET", "/api/examples/", "200"), per_thread)
+    results["histogram.observe"] = run(lambda i: histogram.observe(i * 1e-6, "GET", "/api/examples/"), per_thread)
+    results["baseline (empty call)"] = run(lambda i: None, per_thread)
+    assert counter.value("GET", "/api/examples/", "200") == per_thread * threads
+    return results
+
+
+async def bench_requests(requests: int, rounds: int) -> dict:
+    """미들웨어 유무별 요청당 µs (라운드마다 번갈아 측정 후 최솟값, 잡음 영향 최소화)"""
+    apps = {}
+    for enabled in (False, True):
+        main.METRICS_ENABLED = enabled
+        apps["with metrics" if enabled else "without metrics"] = main.create_app()
+
+    timings = {name: [] for name in apps}
+    for _ in range(rounds):
+        for name, app in apps.items():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                await client.get("/api/health")
+                start = time.perf_counter()
+                for _ in range(requests):
+                    await client.get("/api/health")
+                timings[name].append((time.perf_counter() - start) / requests * 1e6)
+    return {name: min(values) for name, values in timings.items()}
+
+
+def bench_render(repeat: int) -> float:
+    """/metrics 본문 생성 ms"""
+    registry = get_metrics_registry()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = registry.render()
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    print(f"/metrics body: {len(body.splitlines())} lines, {len(body)} bytes")
+    return elapsed
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=1_000_000, help="기록 연산 수")
+    parser.add_argument("--threads", type=int, default=4, help="다중 스레드 측정 스레드 수")
+    parser.add_argument("--requests", type=int, default=5000, help="라운드당 요청 수")
+    parser.add_argument("--rounds", type=int, default=10, help="미들웨어 유무 번갈아 측정 횟수")
+    args = parser.parse_args()
+
+    for threads in (1, args.threads):
+        print(f"-- record ops, {threads} thread(s)")
+        for name, ns in bench_ops(args.ops, threads).items():
+            print(f"{name:<24}{ns:>10.1f} ns/op")
+
+    print("-- GET /api/health")
+    results = asyncio.run(bench_requests(args.requests, args.rounds))
+    for name, us in results.items():
+        print(f"{name:<24}{us:>10.1f} us/request")
+    overhead = results["with metrics"] - results["without metrics"]
+    print(f"{'overhead':<24}{overhead:>10.1f} us/request ({overhead / results['without metrics'] * 100:.1f}%)")
+
+    print("-- render")
+    print(f"{'registry.render()':<24}{bench_render(100):>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,99 @@
+"""로그인 시도 제한 비용 벤치마크 (요청당 µs)
+
+LoginThrottle.check()를 여러 상황에서 반복 호출해 호출당 시간을 측정하고,
+제한이 막아 주는 비밀번호 검증(verify_password, 기본 반복 횟수) 1회와 비교합니다.
+- allowed: 서로 다른 IP/계정, 모두 허용
+- rejected: 한 IP가 한도를 넘어 429 예외 발생
+- churn: 매번 새 IP (maxsize 초과로 LRU 제거 발생)
+- threads: 여러 스레드가 동시에 check() (잠금 경합)
+
+실행:
+    cd backend
+    python benchmarks/bench_rate_limit.py --calls 200000 --threads 8
+"""
+
+import argparse
+import threading
+import time
+
+import common  # noqa: F401 (backend 경로 설정)
+
+from app.utils.auth import hash_password, verify_password
+from app.utils.exceptions import TooManyRequestsException
+from app.utils.rate_limit import LoginThrottle, RateLimiter, login_account_key
+
+
+def make_throttle(maxsize: int) -> LoginThrottle:
+    return LoginThrottle(
+        ip_limiter=RateLimiter(capacity=30, period=60, maxsize=maxsize),
+        account_limiter=RateLimiter(capacity=5, period=900, maxsize=maxsize)
+    )
+
+
+def run_checks(throttle: LoginThrottle, ips: list[str], accounts: list) -> int:
+    """check() 반복 (거부 횟수 반환)"""
+    rejected = 0
+    for ip, account in zip(ips, accounts):
+        try:
+            throttle.check(ip, account)
+        except TooManyRequestsException:
+            rejected += 1
+    return rejected
+
+
+def bench(name: str, throttle: LoginThrottle, ips: list[str], accounts: list, threads: int = 1) -> dict:
+    """호출당 µs"""
+    chunk = len(ips) // threads
+    results = []
+
+    def worker(index: int):
+        part = slice(index * chunk, (index + 1) * chunk)
+        results.append(run_checks(throttle, ips[part], accounts[part]))
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    calls = chunk * threads
+    return {"name": name, "us": elapsed / calls * 1e6, "rejected": sum(results), "calls": calls}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000, help="상황별 check() 호출 수")
+    parser.add_argument("--maxsize", type=int, default=10_000, help="추적할 최대 키 수")
+    parser.add_argument("--threads", type=int, default=8, help="threads 상황의 스레드 수")
+    args = parser.parse_args()
+
+    calls = args.calls
+    keys = args.maxsize // 2
+    accounts = [login_account_key("user", f"user{i % keys}@example.com") for i in range(calls)]
+    results = [
+        bench("allowed", make_throttle(calls), [f"ip-{i}" for i in range(calls)], accounts),
+        bench("rejected", make_throttle(args.maxsize), ["203.0.113.7"] * calls, accounts),
+        bench("churn", make_throttle(args.maxsize), [f"ip-{i}" for i in range(calls)], accounts),
+        bench(
+            f"threads({args.threads})", make_throttle(args.maxsize),
+            [f"ip-{i % keys}" for i in range(calls)], accounts, threads=args.threads
+        ),
+    ]
+
+    hashed = hash_password("password123")
+    start = time.perf_counter()
+    for _ in range(5):
+        verify_password("wrong-password", hashed)
+    verify_us = (time.perf_counter() - start) / 5 * 1e6
+
+    print(f"{'case':<14}{'us/call':>10}{'rejected':>12}{'calls':>10}")
+    for result in results:
+        print(f"{result['name']:<14}{result['us']:>10.2f}{result['rejected']:>12}{result['calls']:>10}")
+    print(f"{'verify_password':<14}{verify_us:>10.0f}  (비밀번호 검증 1회, 비교용)")
+    worst = max(result["us"] for result in results)
+    print(f"limiter worst case = {worst / verify_us * 100:.3f}% of one password check")
+
+
+if __name__ == "__main__":
+    main()
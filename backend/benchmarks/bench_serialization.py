@@ -0,0 +1,122 @@
+"""응답 직렬화 벤치마크 (1,000행당 시간)
+
+DB 없이 ORM 객체 목록을 JSON 응답 본문으로 만드는 시간만 측정합니다.
+- fastapi: response_model 처리 (serialize_response) + 기본 JSONResponse
+- fastapi+orjson: response_model 처리 + ORJSONResponse
+- model_response: 스키마 한 번 검증 후 pydantic-core로 바로 JSON 바이트
+- orm_response: 검증 없이 스키마 필드만 꺼내 orjson으로 직렬화
+
+실행:
+    cd backend
+    python benchmarks/bench_serialization.py --rows 1000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import common  # noqa: F401 (backend 경로 설정)
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models import Admin, Example, User
+from app.schemas import AdminResponse, ExampleResponse, UserResponse
+from app.utils.responses import FastJSONResponse, model_response, orm_response
+
+
+def make_rows(kind: str, count: int) -> list:
+    """세션에 붙지 않은 ORM 객체 (모든 컬럼 값이 채워진 상태)"""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        created_at = base + timedelta(seconds=i, microseconds=i)
+        if kind == "examples":
+            rows.append(Example(
+                id=i + 1, name=f"example {i}", description="설명 " * 8,
+                created_at=created_at, updated_at=None
+            ))
+        elif kind == "users":
+            rows.append(User(
+                id=i + 1, email=f"user{i}@example.com", username=f"user{i}",
+                is_active=True, created_at=created_at
+            ))
+        else:
+            rows.append(Admin(
+                id=i + 1, email=f"admin{i}@example.com", username=f"admin{i}",
+                role="admin", is_active=True, created_at=created_at
+            ))
+    return rows
+
+
+SCHEMAS = {"examples": ExampleResponse, "users": UserResponse, "admins": AdminResponse}
+
+
+# asyncio.run 생성 비용이 측정에 섞이지 않도록 루프 재사용
+loop = asyncio.new_event_loop()
+
+
+# FastAPI가 라우트 등록 시 한 번 만드는 응답 필드
+FIELDS = {
+    schema: create_response_field(name="response", type_=list[schema], mode="serialization")
+    for schema in SCHEMAS.values()
+}
+
+
+def bench_fastapi(schema, rows, response_class) -> bytes:
+    field = FIELDS[schema]
+
+    async def render():
+        content = await serialize_response(field=field, response_content=rows)
+        return response_class(content).body
+
+    return loop.run_until_complete(render())
+
+
+def bench_model_response(schema, rows) -> bytes:
+    return model_response(list[schema], rows).body
+
+
+def bench_orm_response(schema, rows) -> bytes:
+    return orm_response(schema, rows).body
+
+
+def measure(func, repeat: int) -> float:
+    """중앙값 (ms)"""
+    func()  # 워밍업 (TypeAdapter/ModelField 생성)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="응답 한 번의 행 수")
+    parser.add_argument("--repeat", type=int, default=50, help="측정 반복 횟수")
+    args = parser.parse_args()
+    per_1k = 1000 / args.rows
+
+    print(
+        f"{'schema':<10}{'fastapi':>10}{'+orjson':>10}{'model_response':>16}{'orm_response':>14}{'speedup':>9}"
+        "   (ms / 1k rows)"
+    )
+    for kind, schema in SCHEMAS.items():
+        rows = make_rows(kind, args.rows)
+        default = measure(lambda: bench_fastapi(schema, rows, JSONResponse), args.repeat) * per_1k
+        orjson = measure(lambda: bench_fastapi(schema, rows, FastJSONResponse), args.repeat) * per_1k
+        validated = measure(lambda: bench_model_response(schema, rows), args.repeat) * per_1k
+        fast = measure(lambda: bench_orm_response(schema, rows), args.repeat) * per_1k
+        print(
+            f"{kind:<10}{default:>10.2f}{orjson:>10.2f}{validated:>16.2f}{fast:>14.2f}"
+            f"{default / fast:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
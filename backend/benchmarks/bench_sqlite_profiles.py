@@ -0,0 +1,92 @@
+"""SQLite 프로필별 회원가입/로그인 처리량 벤치마크
+
+프로필마다 새 DB 파일을 만들고 동시 요청으로 회원가입과 로그인을 실행하여
+초당 처리량과 실패(예: database is locked) 개수를 비교합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_sqlite_profiles.py --users 500 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from common import app, configure_app, percentile, use_database
+from app.database import SQLITE_PROFILES
+
+
+async def run_requests(client: httpx.AsyncClient, requests: list[tuple[str, dict]], concurrency: int):
+    """요청 목록을 동시 실행하고 (처리량, 실패 수, p99) 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(path: str, body: dict):
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(path, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(path, body) for path, body in requests))
+    elapsed = time.perf_counter() - start
+    return len(requests) / elapsed, failures, percentile(latencies, 99)
+
+
+async def bench_profile(profile: str, users: int, concurrency: int) -> dict:
+    """한 프로필에 대해 회원가입/로그인 측정"""
+    with tempfile.TemporaryDirectory() as tmp:
+        use_database(os.path.join(tmp, f"{profile}.db"), profile=profile)
+
+        registrations = [
+            ("/api/auth/register", {
+                "email": f"user{i}@bench.com",
+                "username": f"user{i}",
+                "password": "password123"
+            })
+            for i in range(users)
+        ]
+        logins = [
+            ("/api/auth/login", {"email": f"user{i}@bench.com", "password": "password123"})
+            for i in range(users)
+        ]
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            register = await run_requests(client, registrations, concurrency)
+            login = await run_requests(client, logins, concurrency)
+
+        app.dependency_overrides.clear()
+
+    return {"register": register, "login": login}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=500, help="생성할 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--profiles", nargs="+", default=list(SQLITE_PROFILES), help="비교할 프로필")
+    args = parser.parse_args()
+
+    configure_app()
+
+    print("=" * 72)
+    print(f"{'profile':<12}{'operation':<12}{'req/s':>10}{'p99 (ms)':>12}{'failures':>10}")
+    print("-" * 72)
+    for profile in args.profiles:
+        results = asyncio.run(bench_profile(profile, args.users, args.concurrency))
+        for operation, (throughput, failures, p99) in results.items():
+            print(f"{profile:<12}{operation:<12}{throughput:>10.0f}{p99:>12.2f}{failures:>10}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
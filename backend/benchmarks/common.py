@@ -0,0 +1,86 @@
+"""벤치마크 공통 유틸리티"""
+
+import os
+import sys
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.database import (
+    Base,
+    get_db,
+    get_async_db,
+    get_read_db,
+    get_async_read_db,
+    get_async_sessionmaker,
+    get_async_read_sessionmaker,
+    create_db_engine,
+    create_async_db_engine
+)
+from app.models.admin import Admin
+from app.utils.auth import hash_password, set_secret_key
+from app.utils.password_hashing import get_password_hasher, MIN_ITERATIONS
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """백분위수 (초 → ms)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+    return ordered[index] * 1000
+
+
+def configure_app():
+    """벤치마크용 SECRET_KEY 설정, 해싱 비용 최소화 (DB 비용만 측정)"""
+    set_secret_key("benchmark-secret-key")
+    get_password_hasher().iterations = MIN_ITERATIONS
+
+
+async def login_bench_admin(client, SessionLocal) -> dict:
+    """벤치마크용 관리자 생성 후 로그인 헤더 반환 (관리자 전용 엔드포인트용)"""
+    with SessionLocal() as db:
+        db.add(Admin(
+            email="bench-admin@example.com", username="bench-admin",
+            hashed_password=hash_password("benchpass"), role="admin", is_active=True
+        ))
+        db.commit()
+    response = await client.post("/api/admin/auth/login", json={
+        "email": "bench-admin@example.com", "password": "benchpass"
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def use_database(db_path: str, profile: str = "production"):
+    """벤치마크용 DB 파일 생성 후 앱 의존성 교체
+
+    Returns:
+        (동기 sessionmaker, async sessionmaker)
+    """
+    engine = create_db_engine(f"sqlite:///{db_path}", profile=profile)
+    async_engine = create_async_db_engine(f"sqlite+aiosqlite:///{db_path}", profile=profile)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    app.dependency_overrides[get_async_sessionmaker] = lambda: AsyncSessionLocal
+    app.dependency_overrides[get_async_read_sessionmaker] = lambda: AsyncSessionLocal
+    return SessionLocal, AsyncSessionLocal
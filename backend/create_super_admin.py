@@ -7,7 +7,8 @@ import secrets
 # backend 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(__file__))
 
-from app.database import SessionLocal, Base, engine
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
 from app.models.admin import Admin
 from app.models.admin_session import AdminSession
 from app.utils.auth import hash_password, set_secret_key
@@ -21,9 +22,9 @@ def create_super_admin():
         SECRET_KEY = secrets.token_urlsafe(48)
     set_secret_key(SECRET_KEY)
 
-    # 테이블 생성
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    # 테이블 생성 (마이그레이션 적용)
+    print("Applying database migrations...")
+    run_migrations(engine)
 
     db = SessionLocal()
 
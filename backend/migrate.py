@@ -0,0 +1,42 @@
+"""DB 마이그레이션 실행 스크립트
+
+배포 시 서버(워커)를 시작하기 전에 한 번 실행합니다.
+
+    python migrate.py           # 적용되지 않은 마이그레이션 실행
+    python migrate.py --status  # 현재/필요 스키마 버전 출력
+"""
+
+import argparse
+import os
+import sys
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import engine
+from app.migrations import SCHEMA_VERSION, get_schema_version, run_migrations
+
+
+def main():
+    """마이그레이션 실행"""
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="버전만 확인하고 종료")
+    args = parser.parse_args()
+
+    if args.status:
+        with engine.connect() as connection:
+            version = get_schema_version(connection)
+        print(f"[INFO] Schema version: {version} (required: {SCHEMA_VERSION})")
+        return
+
+    applied = run_migrations(engine)
+    if not applied:
+        print(f"[INFO] Schema is up to date (version {SCHEMA_VERSION}).")
+        return
+
+    for migration in applied:
+        print(f"[SUCCESS] Applied migration {migration.version}: {migration.description}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,53 @@
 import os
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.main import app
-from app.database import Base, get_db
-from app.utils.auth import set_secret_key
+from app.database import (
+    Base,
+    get_db,
+    get_async_db,
+    get_read_db,
+    get_async_read_db,
+    get_async_sessionmaker,
+    get_async_read_sessionmaker,
+    create_db_engine,
+    create_async_db_engine,
+    to_async_url
+)
+from app.dependencies.auth import get_principal_cache
+from app.models.admin import Admin
+from app.dependencies.admin_auth import get_admin_session_cache
+from app.routers.admin import get_admin_count_cache, get_app_user_count_cache
+from app.routers.examples import get_example_count_cache
+from app.utils.auth import hash_password, set_secret_key
+from app.utils.password_hashing import get_password_hasher, MIN_ITERATIONS
+from app.utils.rate_limit import get_login_throttle
 
 # 테스트용 SECRET_KEY 설정
 TEST_SECRET_KEY = "test-secret-key-for-pytest-testing-only"
 set_secret_key(TEST_SECRET_KEY)
 
-# 테스트용 인메모리 DB
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# 테스트 속도를 위해 해싱 비용을 최소값으로 설정 (프로세스 풀 미사용)
+get_password_hasher().iterations = MIN_ITERATIONS
+
+# 테스트용 DB (기본: SQLite 파일, TEST_DATABASE_URL로 PostgreSQL 등 지정 가능)
+SQLALCHEMY_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///./test.db")
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL, profile="default")
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async 엔드포인트용 (TestClient는 요청마다 이벤트 루프가 달라질 수 있으므로 풀링하지 않음)
+async_engine = create_async_db_engine(
+    to_async_url(SQLALCHEMY_DATABASE_URL), profile="default", poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -39,9 +70,69 @@ def client(db_session):
         finally:
             pass
 
+    # 테스트마다 DB가 새로 생성되므로 이전 테스트의 캐시 제거
+    get_principal_cache().clear()
+    get_admin_session_cache().clear()
+    get_admin_count_cache().clear()
+    get_app_user_count_cache().clear()
+    get_example_count_cache().clear()
+    get_login_throttle().clear()
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # 테스트에는 복제본이 없으므로 조회 세션도 같은 DB 사용
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    app.dependency_overrides[get_async_sessionmaker] = lambda: TestingAsyncSessionLocal
+    app.dependency_overrides[get_async_read_sessionmaker] = lambda: TestingAsyncSessionLocal
     yield TestClient(app)
     app.dependency_overrides.clear()
+    get_principal_cache().clear()
+    get_admin_session_cache().clear()
+    get_admin_count_cache().clear()
+    get_app_user_count_cache().clear()
+    get_example_count_cache().clear()
+    get_login_throttle().clear()
+
+
+@pytest.fixture
+def query_counter(db_session):
+    """실행된 SQL 문 기록 픽스처"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engines = [engine, async_engine.sync_engine]
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    for target in engines:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def query_budget(query_counter):
+    """블록 안에서 실행된 SQL 문 수가 예산 이하인지 확인
+
+    사용법:
+        with query_budget(1):
+            client.get("/api/users/me")
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        start = len(query_counter)
+        yield
+        executed = query_counter[start:]
+        assert len(executed) <= max_queries, (
+            f"SQL {len(executed)}개 실행 (예산 {max_queries}개):\n" + "\n".join(executed)
+        )
+
+    return budget
 
 
 @pytest.fixture
@@ -72,6 +163,38 @@ def authenticated_client(client, test_user_data):
     return client
 
 
+ADMIN_PASSWORD = "AdminPass123!"
+
+
+def login_admin(client, db_session, email: str, role: str) -> dict:
+    """관리자 생성 후 로그인 헤더 반환"""
+    db_session.add(Admin(
+        email=email, username=email.split("@")[0], hashed_password=hash_password(ADMIN_PASSWORD),
+        role=role, is_active=True
+    ))
+    db_session.commit()
+    response = client.post("/api/admin/auth/login", json={"email": email, "password": ADMIN_PASSWORD})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def admin_login(client, db_session):
+    """추가 관리자 로그인 헬퍼 (email, role → 로그인 헤더)"""
+    return lambda email, role: login_admin(client, db_session, email, role)
+
+
+@pytest.fixture
+def admin_headers(client, db_session):
+    """일반 관리자(admin@example.com) 로그인 헤더"""
+    return login_admin(client, db_session, "admin@example.com", "admin")
+
+
+@pytest.fixture
+def super_admin_headers(client, db_session):
+    """슈퍼 관리자(super@example.com) 로그인 헤더"""
+    return login_admin(client, db_session, "super@example.com", "super_admin")
+
+
 def pytest_configure(config):
     """pytest 설정"""
     # 환경 변수 설정
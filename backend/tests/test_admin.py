@@ -3,7 +3,7 @@ import pytest
 from datetime import datetime, timedelta
 from app.models.admin import Admin
 from app.models.admin_session import AdminSession
-from app.utils.auth import hash_password
+from app.utils.auth import hash_password, hash_token
 
 
 # ============================================
@@ -157,7 +157,7 @@ def test_admin_login_creates_session(client, db_session, super_admin_data, creat
     token = response.json()["access_token"]
 
     # 세션 확인
-    session = db_session.query(AdminSession).filter(AdminSession.token == token).first()
+    session = db_session.query(AdminSession).filter(AdminSession.token_hash == hash_token(token)).first()
     assert session is not None
     assert session.admin_id == create_super_admin.id
     assert session.expires_at > datetime.utcnow()
@@ -171,7 +171,7 @@ def test_admin_logout_success(client, db_session, super_admin_token):
     """로그아웃 성공 및 세션 삭제 확인"""
     # 로그아웃 전 세션 확인
     session_before = db_session.query(AdminSession).filter(
-        AdminSession.token == super_admin_token
+        AdminSession.token_hash == hash_token(super_admin_token)
     ).first()
     assert session_before is not None
 
@@ -187,7 +187,7 @@ def test_admin_logout_success(client, db_session, super_admin_token):
 
     # 세션 삭제 확인
     session_after = db_session.query(AdminSession).filter(
-        AdminSession.token == super_admin_token
+        AdminSession.token_hash == hash_token(super_admin_token)
     ).first()
     assert session_after is None
 
@@ -281,21 +281,23 @@ def test_list_admins_success(client, super_admin_token, create_normal_admin):
 
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
-    assert len(data) >= 2  # 슈퍼 관리자 + 일반 관리자
+    assert isinstance(data["items"], list)
+    assert len(data["items"]) >= 2  # 슈퍼 관리자 + 일반 관리자
+    assert data["total"] == len(data["items"])
+    assert data["next_cursor"] is None
 
 
 def test_list_admins_with_pagination(client, super_admin_token):
     """페이지네이션을 사용한 관리자 목록 조회"""
     response = client.get(
-        "/api/admin/users?skip=0&limit=1",
+        "/api/admin/users?limit=1",
         headers={"Authorization": f"Bearer {super_admin_token}"}
     )
 
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
-    assert len(data) <= 1
+    assert isinstance(data["items"], list)
+    assert len(data["items"]) <= 1
 
 
 def test_get_admin_success(client, super_admin_token, create_normal_admin):
@@ -486,7 +488,7 @@ def test_expired_session_denies_access(client, db_session, super_admin_token):
     """만료된 세션은 접근 거부"""
     # 세션 만료 시간을 과거로 변경
     session = db_session.query(AdminSession).filter(
-        AdminSession.token == super_admin_token
+        AdminSession.token_hash == hash_token(super_admin_token)
     ).first()
     session.expires_at = datetime.utcnow() - timedelta(hours=1)
     db_session.commit()
@@ -505,7 +507,7 @@ def test_deleted_session_denies_access(client, db_session, super_admin_token):
     """삭제된 세션은 접근 거부"""
     # 세션 삭제
     db_session.query(AdminSession).filter(
-        AdminSession.token == super_admin_token
+        AdminSession.token_hash == hash_token(super_admin_token)
     ).delete()
     db_session.commit()
 
@@ -0,0 +1,107 @@
+"""관리자용 사용자 디렉터리 (/api/admin/app-users) 테스트"""
+import pytest
+
+from app.models.user import User
+from app.utils.auth import hash_password
+from app.utils.pagination import prefix_upper_bound
+
+
+@pytest.fixture
+def users(db_session):
+    """사용자 30명 (일부 비활성, 일부 2FA 사용)"""
+    hashed = hash_password("password123")
+    for i in range(30):
+        db_session.add(User(
+            email=f"{'kim' if i < 10 else 'lee'}{i:02d}@example.com",
+            username=f"member{i:02d}",
+            hashed_password=hashed,
+            is_active=i % 4 != 0,
+            enable_2fa=i % 5 == 0,
+            auth_profile_id=7 if i % 5 == 0 else None
+        ))
+    db_session.commit()
+    return db_session.query(User).order_by(User.created_at, User.id).all()
+
+
+def fetch_all(client, headers, params: str = ""):
+    """next_cursor를 따라 모든 페이지의 항목 조회"""
+    items, cursor = [], None
+    while True:
+        url = f"/api/admin/app-users?limit=7{params}"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url, headers=headers).json()
+        items.extend(data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return items, data["total"]
+
+
+def test_cursor_walks_every_user_once(client, admin_headers, users):
+    """커서를 따라가면 모든 사용자를 순서대로 한 번씩 조회"""
+    items, total = fetch_all(client, admin_headers)
+
+    assert [item["id"] for item in items] == [user.id for user in users]
+    assert total == 30
+
+
+def test_default_fields(client, admin_headers, users):
+    """기본 컬럼만 응답에 포함"""
+    item = client.get("/api/admin/app-users", headers=admin_headers).json()["items"][0]
+
+    assert set(item) == {"id", "email", "username", "is_active", "enable_2fa", "created_at"}
+
+
+def test_sparse_fields_only_load_requested_columns(client, admin_headers, users, query_counter):
+    """fields로 지정한 컬럼만 조회/응답"""
+    response = client.get("/api/admin/app-users?fields=email", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert set(response.json()["items"][0]) == {"id", "email"}
+    page_query = next(s for s in query_counter if "FROM users" in s and "count" not in s.lower())
+    assert "username" not in page_query
+    assert "hashed_password" not in page_query
+
+
+def test_filters_and_prefix_search(client, admin_headers, users):
+    """is_active/enable_2fa/auth_profile_id 필터와 접두사 검색"""
+    items, total = fetch_all(client, admin_headers, "&enable_2fa=true&auth_profile_id=7")
+    expected = [u.id for u in users if u.enable_2fa]
+    assert [item["id"] for item in items] == expected
+    assert total == len(expected)
+
+    items, _ = fetch_all(client, admin_headers, "&is_active=false")
+    assert [item["id"] for item in items] == [u.id for u in users if not u.is_active]
+
+    items, _ = fetch_all(client, admin_headers, "&q=kim")
+    assert [item["id"] for item in items] == [u.id for u in users if u.email.startswith("kim")]
+
+
+def test_prefix_upper_bound_edge_code_points():
+    """최대 코드 포인트는 상한 없음/앞 문자 올림, 서로게이트 구간은 건너뜀"""
+    assert prefix_upper_bound("kim") == "kin"
+    assert prefix_upper_bound("a\U0010ffff") == "b"
+    assert prefix_upper_bound("\U0010ffff\U0010ffff") is None
+    assert prefix_upper_bound("a\ud7ff") == "a\ue000"
+
+
+def test_prefix_search_with_edge_code_points(client, admin_headers, users):
+    """U+10FFFF/U+D7FF로 끝나는 검색어도 500 없이 빈 결과"""
+    for q in ("%F4%8F%BF%BF", "kim%ED%9F%BF"):
+        response = client.get(f"/api/admin/app-users?q={q}", headers=admin_headers)
+
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+
+
+def test_unknown_field_rejected(client, admin_headers):
+    """정의되지 않은 컬럼 요청은 400"""
+    response = client.get("/api/admin/app-users?fields=email,hashed_password", headers=admin_headers)
+
+    assert response.status_code == 400
+    assert "hashed_password" in response.json()["message"]
+
+
+def test_requires_admin(client, users):
+    """관리자 인증 필요"""
+    assert client.get("/api/admin/app-users").status_code == 401
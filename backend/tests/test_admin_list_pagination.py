@@ -0,0 +1,108 @@
+"""관리자 목록 커서 페이지네이션/필터/검색 테스트"""
+import pytest
+
+from app.models.admin import Admin
+from app.utils.auth import hash_password
+
+
+PASSWORD = "AdminPass123!"
+
+
+@pytest.fixture
+def admins(db_session):
+    """슈퍼 관리자 1명 + 관리자 24명 (대부분 같은 created_at → id로 순서 결정)"""
+    hashed = hash_password(PASSWORD)
+    db_session.add(Admin(
+        email="root@example.com", username="root", hashed_password=hashed,
+        role="super_admin", is_active=True
+    ))
+    for i in range(24):
+        db_session.add(Admin(
+            email=f"{'ops' if i % 2 else 'dev'}{i:02d}@example.com",
+            username=f"user{i:02d}",
+            hashed_password=hashed,
+            role="admin",
+            is_active=i % 3 != 0
+        ))
+    db_session.commit()
+    return db_session.query(Admin).order_by(Admin.created_at, Admin.id).all()
+
+
+@pytest.fixture
+def headers(client, admins):
+    response = client.post("/api/admin/auth/login", json={"email": "root@example.com", "password": PASSWORD})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def fetch_all(client, headers, params: str = "", limit: int = 5):
+    """next_cursor를 따라 모든 페이지 조회"""
+    ids, cursor, totals = [], None, set()
+    while True:
+        url = f"/api/admin/users?limit={limit}{params}"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url, headers=headers).json()
+        ids.extend(item["id"] for item in data["items"])
+        totals.add(data["total"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids, totals
+
+
+def test_cursor_walks_every_admin_once(client, headers, admins):
+    """커서를 따라가면 (created_at, id) 순서로 모든 관리자를 한 번씩 조회"""
+    ids, totals = fetch_all(client, headers)
+
+    assert ids == [admin.id for admin in admins]
+    assert totals == {25}
+
+
+def test_filter_by_role_and_active(client, headers, admins):
+    """role/is_active 필터와 해당 조건의 total"""
+    ids, totals = fetch_all(client, headers, "&role=admin&is_active=false")
+
+    expected = [a.id for a in admins if a.role == "admin" and not a.is_active]
+    assert ids == expected
+    assert totals == {len(expected)}
+
+
+def test_prefix_search_on_email_and_username(client, headers, admins):
+    """이메일 또는 사용자명 접두사 검색"""
+    ids, _ = fetch_all(client, headers, "&q=ops")
+    assert ids == [a.id for a in admins if a.email.startswith("ops")]
+
+    ids, _ = fetch_all(client, headers, "&q=user1")
+    assert ids == [a.id for a in admins if a.username.startswith("user1")]
+
+
+def test_total_is_cached_until_admin_changes(client, headers, db_session, admins):
+    """total은 캐시되며 API로 관리자를 생성하면 갱신"""
+    assert client.get("/api/admin/users", headers=headers).json()["total"] == 25
+
+    # API를 거치지 않은 변경은 캐시 만료 전까지 반영되지 않음
+    db_session.add(Admin(
+        email="direct@example.com", username="direct", hashed_password="x", role="admin", is_active=True
+    ))
+    db_session.commit()
+    assert client.get("/api/admin/users", headers=headers).json()["total"] == 25
+
+    response = client.post("/api/admin/users", json={
+        "email": "new@example.com", "username": "newadmin", "password": PASSWORD, "role": "admin"
+    }, headers=headers)
+    assert response.status_code == 201
+    assert client.get("/api/admin/users", headers=headers).json()["total"] == 27
+
+
+def test_invalid_cursor_rejected(client, headers):
+    """형식이 잘못된 커서는 400"""
+    response = client.get("/api/admin/users?cursor=not-a-cursor", headers=headers)
+
+    assert response.status_code == 400
+    assert "커서" in response.json()["message"]
+
+
+def test_limit_is_capped(client, headers):
+    """limit 상한 초과는 422"""
+    response = client.get("/api/admin/users?limit=1000", headers=headers)
+
+    assert response.status_code == 422
@@ -0,0 +1,72 @@
+"""관리자 세션 검증 캐시 테스트"""
+import pytest
+
+from app.models.admin import Admin
+from app.dependencies.admin_auth import get_admin_session_cache
+
+
+@pytest.fixture
+def normal_admin(db_session, admin_headers):
+    """로그인한 일반 관리자 (admin_headers의 주체)"""
+    return db_session.query(Admin).filter(Admin.email == "admin@example.com").one()
+
+
+def test_session_lookup_is_single_query(client, super_admin_headers, query_counter):
+    """캐시 미적중 시 세션+관리자 조회는 1회, 적중 시 0회"""
+    get_admin_session_cache().clear()
+
+    query_counter.clear()
+    assert client.get("/api/admin/users/me", headers=super_admin_headers).status_code == 200
+    assert len(query_counter) == 1
+
+    query_counter.clear()
+    assert client.get("/api/admin/users/me", headers=super_admin_headers).status_code == 200
+    assert query_counter == []
+
+
+def test_logout_invalidates_cache(client, super_admin_headers):
+    """로그아웃 후 같은 토큰은 거부"""
+    assert client.get("/api/admin/users/me", headers=super_admin_headers).status_code == 200
+    assert client.post("/api/admin/auth/logout", headers=super_admin_headers).status_code == 200
+
+    response = client.get("/api/admin/users/me", headers=super_admin_headers)
+    assert response.status_code == 401
+
+
+def test_deactivation_invalidates_cache(client, super_admin_headers, admin_headers, normal_admin):
+    """비활성화 후 해당 관리자의 캐시된 세션 무효화"""
+    assert client.get("/api/admin/users/me", headers=admin_headers).status_code == 200
+
+    response = client.put(
+        f"/api/admin/users/{normal_admin.id}",
+        json={"is_active": False},
+        headers=super_admin_headers
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/admin/users/me", headers=admin_headers)
+    assert response.status_code == 403
+
+
+def test_role_change_invalidates_cache(client, super_admin_headers, admin_headers, normal_admin):
+    """권한 변경 즉시 반영"""
+    assert client.get("/api/admin/users", headers=admin_headers).status_code == 403
+
+    client.put(
+        f"/api/admin/users/{normal_admin.id}",
+        json={"role": "super_admin"},
+        headers=super_admin_headers
+    )
+
+    assert client.get("/api/admin/users", headers=admin_headers).status_code == 200
+
+
+def test_delete_invalidates_cache(client, super_admin_headers, admin_headers, normal_admin):
+    """삭제된 관리자의 세션은 거부"""
+    assert client.get("/api/admin/users/me", headers=admin_headers).status_code == 200
+
+    response = client.delete(f"/api/admin/users/{normal_admin.id}", headers=super_admin_headers)
+    assert response.status_code == 204
+
+    response = client.get("/api/admin/users/me", headers=admin_headers)
+    assert response.status_code == 401
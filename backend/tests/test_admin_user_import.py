@@ -0,0 +1,128 @@
+"""사용자 일괄 가져오기 (/api/admin/app-users/import) 테스트"""
+import asyncio
+import json
+
+from app.models.user import User
+from app.routers import admin as admin_router
+from app.utils import user_import
+from app.utils.auth import hash_password, verify_password
+
+
+def ndjson(records) -> str:
+    return "\n".join(r if isinstance(r, str) else json.dumps(r) for r in records) + "\n"
+
+
+def test_import_ndjson_reports_each_row(client, db_session, super_admin_headers):
+    """유효/검증 실패/기존 중복/파일 내 중복 행을 행별로 보고하고 나머지는 계속 처리"""
+    db_session.add(User(email="taken@example.com", username="taken", hashed_password=hash_password("x")))
+    db_session.commit()
+
+    body = ndjson([
+        {"email": "a@example.com", "username": "alice", "password": "secret-a"},
+        {"email": "not-an-email", "username": "bad", "password": "x"},
+        {"email": "taken@example.com", "username": "newname", "password": "x"},
+        "{broken json",
+        {"email": "b@example.com", "username": "bob", "password": "secret-b"},
+        {"email": "a@example.com", "username": "alice2", "password": "x"},
+        {"email": "c@example.com", "username": "taken", "password": "x"},
+    ])
+    response = client.post("/api/admin/app-users/import", content=body, headers=super_admin_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["total"], data["created"], data["duplicate"], data["invalid"]) == (7, 2, 3, 2)
+    assert [r["status"] for r in data["results"]] == [
+        "created", "invalid", "duplicate", "invalid", "created", "duplicate", "duplicate"
+    ]
+    assert "email" in data["results"][1]["message"]
+
+    alice = db_session.query(User).filter(User.email == "a@example.com").one()
+    assert data["results"][0]["id"] == alice.id
+    assert verify_password("secret-a", alice.hashed_password)
+    assert db_session.query(User).count() == 3
+
+
+def test_import_csv(client, db_session, super_admin_headers):
+    """CSV는 첫 줄을 헤더로 사용"""
+    body = (
+        "email,username,password\r\n"
+        "csv1@example.com,csv1,pw-1\r\n"
+        "csv2@example.com,csv2\r\n"
+        "csv3@example.com,csv3,pw-3\r\n"
+    )
+    response = client.post("/api/admin/app-users/import?format=csv", content=body, headers=super_admin_headers)
+
+    data = response.json()
+    assert [r["status"] for r in data["results"]] == ["created", "invalid", "created"]
+    assert {u.username for u in db_session.query(User).all()} == {"csv1", "csv3"}
+
+
+def test_import_non_utf8_line_is_invalid_row(client, db_session, super_admin_headers):
+    """UTF-8이 아닌 줄은 500 대신 invalid 행으로 보고"""
+    body = (
+        ndjson([{"email": "a@example.com", "username": "alice", "password": "pw"}]).encode()
+        + b'{"email": "\xff\xfe"}\n'
+        + ndjson([{"email": "b@example.com", "username": "bob", "password": "pw"}]).encode()
+    )
+    response = client.post("/api/admin/app-users/import", content=body, headers=super_admin_headers)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == ["created", "invalid", "created"]
+    assert "UTF-8" in results[1]["message"]
+
+
+def test_oversized_line_is_skipped_without_buffering(monkeypatch):
+    """줄바꿈 없이 한도를 넘는 줄은 한 번만 보고하고 다음 줄바꿈까지 버림"""
+    monkeypatch.setattr(user_import, "IMPORT_MAX_LINE_BYTES", 16)
+
+    async def chunks():
+        yield b'{"a": 1}\n'
+        for _ in range(100):
+            yield b"x" * 10
+        yield b'tail\n{"b": 2}\n' + b"y" * 20
+
+    async def collect():
+        return [record async for record in user_import.iter_records(chunks(), "ndjson")]
+
+    assert asyncio.run(collect()) == [
+        (1, {"a": 1}, None),
+        (2, None, user_import.LINE_TOO_LONG),
+        (3, {"b": 2}, None),
+        (4, None, user_import.LINE_TOO_LONG),
+    ]
+
+
+def test_import_batches_keep_query_count_constant(client, db_session, super_admin_headers, monkeypatch, query_counter):
+    """배치마다 중복 확인 2회 + INSERT 1회 (행 수에 비례하지 않음)"""
+    monkeypatch.setattr(admin_router, "IMPORT_BATCH_SIZE", 4)
+    body = ndjson(
+        {"email": f"bulk{i}@example.com", "username": f"bulk{i}", "password": "pw"} for i in range(10)
+    )
+    query_counter.clear()
+    response = client.post("/api/admin/app-users/import", content=body, headers=super_admin_headers)
+
+    assert response.json()["created"] == 10
+    user_statements = [s for s in query_counter if "users" in s]
+    assert len([s for s in user_statements if s.startswith("INSERT")]) == 3
+    assert len([s for s in user_statements if s.startswith("SELECT")]) == 6
+    ids = [r["id"] for r in response.json()["results"]]
+    assert ids == sorted(ids)
+
+
+def test_import_updates_user_count(client, db_session, super_admin_headers):
+    """가져오기 후 사용자 디렉터리 total 캐시 무효화"""
+    assert client.get("/api/admin/app-users", headers=super_admin_headers).json()["total"] == 0
+
+    body = ndjson([{"email": "n@example.com", "username": "n", "password": "pw"}])
+    client.post("/api/admin/app-users/import", content=body, headers=super_admin_headers)
+
+    assert client.get("/api/admin/app-users", headers=super_admin_headers).json()["total"] == 1
+
+
+def test_import_requires_super_admin(client, admin_headers):
+    """일반 관리자는 가져오기 불가"""
+    body = ndjson([{"email": "n@example.com", "username": "n", "password": "pw"}])
+
+    assert client.post("/api/admin/app-users/import", content=body, headers=admin_headers).status_code == 403
+    assert client.post("/api/admin/app-users/import?format=xml", content=body).status_code in (401, 422)
@@ -39,6 +39,18 @@ def test_register_duplicate_username(client, test_user_data):
     assert "사용자명" in data["message"]
 
 
+def test_register_single_round_trip(client, test_user_data, query_counter):
+    """중복 확인 SELECT와 커밋 후 refresh 없이 INSERT 한 번으로 가입"""
+    query_counter.clear()
+    response = client.post("/api/auth/register", json=test_user_data)
+
+    assert response.status_code == 201
+    assert response.json()["created_at"]
+    user_statements = [s for s in query_counter if "users" in s]
+    assert len(user_statements) == 1
+    assert user_statements[0].startswith("INSERT INTO users")
+
+
 def test_register_invalid_email(client):
     """잘못된 이메일 형식으로 회원가입 실패"""
     response = client.post("/api/auth/register", json={
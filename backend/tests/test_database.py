@@ -0,0 +1,102 @@
+"""DB 엔진 팩토리 및 SQLite 프로필 테스트"""
+import asyncio
+import pytest
+from sqlalchemy import text
+
+from app.database import create_db_engine, create_async_db_engine, get_sqlite_pragmas, to_async_url
+from app.utils.pool_metrics import get_pool_stats
+
+
+def read_pragmas(connection):
+    """주요 PRAGMA 현재 값 조회"""
+    return {
+        name: connection.execute(text(f"PRAGMA {name}")).scalar()
+        for name in ("journal_mode", "synchronous", "busy_timeout", "temp_store", "cache_size")
+    }
+
+
+def test_production_profile_applied(tmp_path):
+    """production 프로필은 WAL, synchronous=NORMAL 등을 적용"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'prod.db'}", profile="production")
+    with engine.connect() as connection:
+        pragmas = read_pragmas(connection)
+    engine.dispose()
+
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["synchronous"] == 1  # NORMAL
+    assert pragmas["busy_timeout"] == 5000
+    assert pragmas["temp_store"] == 2  # MEMORY
+    assert pragmas["cache_size"] == -65536
+
+
+def test_default_profile_keeps_sqlite_defaults(tmp_path):
+    """default 프로필은 PRAGMA를 변경하지 않음"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'default.db'}", profile="default")
+    with engine.connect() as connection:
+        pragmas = read_pragmas(connection)
+    engine.dispose()
+
+    assert pragmas["journal_mode"] == "delete"
+    assert pragmas["synchronous"] == 2  # FULL
+
+
+def test_async_engine_applies_profile(tmp_path):
+    """async 엔진 연결에도 프로필 적용"""
+    engine = create_async_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", profile="production")
+
+    async def read_journal_mode():
+        async with engine.connect() as connection:
+            result = await connection.execute(text("PRAGMA journal_mode"))
+            value = result.scalar()
+        await engine.dispose()
+        return value
+
+    assert asyncio.run(read_journal_mode()) == "wal"
+
+
+def test_unknown_profile_rejected():
+    """정의되지 않은 프로필은 오류"""
+    with pytest.raises(ValueError):
+        get_sqlite_pragmas("turbo")
+
+
+def test_async_url_derived_from_database_url():
+    """DATABASE_URL에서 async 드라이버 URL 유도"""
+    assert to_async_url("sqlite:///./app.db").drivername == "sqlite+aiosqlite"
+    url = to_async_url("postgresql://app:secret@db:5432/app")
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.password == "secret"
+    assert url.host == "db"
+
+
+def test_pool_metrics_track_checkouts_and_waits(tmp_path):
+    """커넥션 대출/반납 및 대기 시간 통계 수집"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", name="test_pool")
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        stats = get_pool_stats()["test_pool"]
+        assert stats["checked_out"] == 1
+
+    stats = get_pool_stats()["test_pool"]
+    engine.dispose()
+
+    assert stats["dialect"] == "sqlite"
+    assert stats["checkouts"] == 1
+    assert stats["checkins"] == 1
+    assert stats["connects"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["max_wait_ms"] >= 0
+
+
+def test_pool_metrics_count_overflow(tmp_path):
+    """pool_size를 넘는 연결은 overflow 이벤트로 기록"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'overflow.db'}", name="test_overflow")
+    pool_size = engine.pool.size()
+    connections = [engine.connect() for _ in range(pool_size + 2)]
+    stats = get_pool_stats()["test_overflow"]
+    for connection in connections:
+        connection.close()
+    engine.dispose()
+
+    assert stats["overflow_events"] == 2
+    assert stats["overflow"] == 2
@@ -1,5 +1,8 @@
 """전역 예외 핸들러 테스트"""
 import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.utils.exceptions import BadRequestException, raise_for_integrity_error, unique_violation_column
 
 
 def test_404_not_found(client):
@@ -158,3 +161,25 @@ def test_error_response_structure(client):
     assert "error" in data_401
     assert "message" in data_401
     assert "status_code" in data_401
+
+
+@pytest.mark.parametrize("message, column", [
+    ("UNIQUE constraint failed: users.email", "email"),
+    ("UNIQUE constraint failed: admins.username", "username"),
+    ('duplicate key value violates unique constraint "ix_users_email"\n'
+     "DETAIL:  Key (email)=(a@example.com) already exists.", "email"),
+    ("NOT NULL constraint failed: users.email", None),
+])
+def test_unique_violation_column(message, column):
+    """SQLite/PostgreSQL 유니크 제약 위반 메시지에서 컬럼명 추출"""
+    assert unique_violation_column(IntegrityError("INSERT", {}, Exception(message))) == column
+
+
+def test_raise_for_integrity_error():
+    """유니크 위반은 한국어 메시지의 400으로, 그 외 무결성 오류는 그대로 전달"""
+    with pytest.raises(BadRequestException) as exc_info:
+        raise_for_integrity_error(IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: users.username")))
+    assert exc_info.value.detail == "이미 사용 중인 사용자명입니다"
+
+    with pytest.raises(IntegrityError):
+        raise_for_integrity_error(IntegrityError("INSERT", {}, Exception("FOREIGN KEY constraint failed")))
@@ -0,0 +1,105 @@
+"""ETag / 조건부 GET 테스트"""
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.utils.etag import etag_matches, make_etag
+
+
+PASSWORD = "AdminPass123!"
+
+
+def revalidate(client, url: str, headers: dict | None = None):
+    """첫 응답의 ETag로 다시 요청"""
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    second = client.get(url, headers={**(headers or {}), "If-None-Match": first.headers["etag"]})
+    return first, second
+
+
+def test_user_profile_not_modified(authenticated_client):
+    """같은 ETag면 본문 없이 304"""
+    first, second = revalidate(authenticated_client, "/api/users/me")
+
+    assert first.headers["etag"].startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_user_profile_etag_changes_after_update(authenticated_client, db_session):
+    """프로필 수정 시 행 버전이 올라가 ETag 변경"""
+    etag = authenticated_client.get("/api/users/me").headers["etag"]
+
+    authenticated_client.put("/api/users/me", json={"username": "renamed"})
+
+    response = authenticated_client.get("/api/users/me", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["username"] == "renamed"
+    assert response.headers["etag"] != etag
+    assert db_session.query(User.version).scalar() == 2
+
+
+def test_concurrent_updates_both_bump_version(db_session):
+    """같은 행을 읽은 두 세션이 모두 수정해도 StaleDataError 없이 버전이 2번 증가"""
+    db_session.add(User(email="race@example.com", username="race", hashed_password="x"))
+    db_session.commit()
+
+    first, second = Session(db_session.get_bind()), Session(db_session.get_bind())
+    try:
+        a = first.query(User).filter(User.email == "race@example.com").one()
+        b = second.query(User).filter(User.email == "race@example.com").one()
+        a.username = "race-a"
+        first.commit()
+        b.is_active = False
+        second.commit()
+    finally:
+        first.close()
+        second.close()
+
+    db_session.expire_all()
+    user = db_session.query(User).filter(User.email == "race@example.com").one()
+    assert (user.version, user.username, user.is_active) == (3, "race-a", False)
+
+
+def test_admin_profile_not_modified(client, super_admin_headers):
+    _, second = revalidate(client, "/api/admin/users/me", super_admin_headers)
+
+    assert second.status_code == 304
+
+
+def test_admin_list_etag_tracks_rows(client, super_admin_headers):
+    """관리자 목록은 304, 관리자 추가 후에는 새 본문"""
+    first, second = revalidate(client, "/api/admin/users", super_admin_headers)
+    assert second.status_code == 304
+
+    client.post("/api/admin/users", headers=super_admin_headers, json={
+        "email": "new@example.com", "username": "new", "password": PASSWORD, "role": "admin"
+    })
+    third = client.get("/api/admin/users", headers={**super_admin_headers, "If-None-Match": first.headers["etag"]})
+    assert third.status_code == 200
+    assert third.json()["total"] == 2
+
+
+def test_examples_etag(client):
+    """예제 목록은 항목이 추가되면 ETag 변경"""
+    client.post("/api/examples/", json={"name": "첫 번째"})
+    first, second = revalidate(client, "/api/examples/")
+    assert second.status_code == 304
+
+    client.post("/api/examples/", json={"name": "두 번째"})
+    third = client.get("/api/examples/", headers={"If-None-Match": first.headers["etag"]})
+    assert third.status_code == 200
+    assert third.json()["total"] == 2
+
+
+def test_etag_matches():
+    """약한 비교, 쉼표 목록, * 처리"""
+    etag = make_etag("user", 1, 3)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag("user", 1, 4), etag)
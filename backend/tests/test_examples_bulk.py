@@ -0,0 +1,89 @@
+"""예제 일괄 생성/삭제 테스트"""
+from datetime import datetime
+
+import pytest
+
+from app.models import Example
+from app.routers import examples
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    monkeypatch.setattr(examples, "EXAMPLES_BULK_BATCH_SIZE", 10)
+
+
+def test_bulk_create_in_batches(client, db_session, small_batches, query_counter, admin_headers):
+    """배치마다 INSERT 1회 + 커밋, 생성된 id 반환"""
+    items = [{"name": f"bulk {i}", "description": "설명"} for i in range(25)]
+    query_counter.clear()
+
+    response = client.post("/api/examples/bulk", json={"items": items}, headers=admin_headers)
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["created"] == 25
+    assert data["ids"] == sorted(row.id for row in db_session.query(Example.id))
+    inserts = [s for s in query_counter if s.startswith("INSERT INTO examples")]
+    assert len(inserts) == 3
+    assert client.get("/api/examples/").json()["total"] == 25
+
+
+def test_bulk_create_validation(client, admin_headers):
+    for items in ([], [{"description": "이름 없음"}]):
+        assert client.post("/api/examples/bulk", json={"items": items}, headers=admin_headers).status_code == 422
+
+
+BULK_ITEMS = {"items": [{"name": "x"}]}
+WIDE_RANGE = {"created_after": "2000-01-01T00:00:00"}
+
+
+def test_bulk_endpoints_require_login(client, db_session):
+    """익명 요청은 일괄 생성/삭제 불가"""
+    db_session.add(Example(name="kept"))
+    db_session.commit()
+
+    assert client.post("/api/examples/bulk", json=BULK_ITEMS).status_code == 401
+    assert client.request("DELETE", "/api/examples/bulk", json=WIDE_RANGE).status_code == 401
+    assert db_session.query(Example).count() == 1
+
+
+def test_bulk_endpoints_reject_app_users(authenticated_client):
+    """일반 사용자 토큰으로도 불가 (관리자 전용)"""
+    assert authenticated_client.post("/api/examples/bulk", json=BULK_ITEMS).status_code == 401
+    assert authenticated_client.request("DELETE", "/api/examples/bulk", json=WIDE_RANGE).status_code == 401
+
+
+def test_bulk_delete_by_ids(client, db_session, small_batches, admin_headers):
+    """존재하는 id만 삭제하고 개수 반환"""
+    items = [{"name": f"e{i}"} for i in range(30)]
+    ids = client.post("/api/examples/bulk", json={"items": items}, headers=admin_headers).json()["ids"]
+
+    response = client.request(
+        "DELETE", "/api/examples/bulk", json={"ids": ids[:15] + [999999]}, headers=admin_headers
+    )
+
+    assert response.json() == {"deleted": 15}
+    assert sorted(row.id for row in db_session.query(Example.id)) == ids[15:]
+
+
+def test_bulk_delete_by_created_range(client, db_session, small_batches, admin_headers):
+    """created_at 범위 삭제는 배치가 빌 때까지 반복"""
+    for day in range(1, 4):
+        for i in range(12):
+            db_session.add(Example(name=f"{day}-{i}", created_at=datetime(2024, 1, day, 0, 0, i, 1)))
+    db_session.commit()
+
+    response = client.request("DELETE", "/api/examples/bulk", json={
+        "created_after": "2024-01-01T00:00:00", "created_before": "2024-01-03T00:00:00"
+    }, headers=admin_headers)
+
+    assert response.json() == {"deleted": 24}
+    assert {row.name[0] for row in db_session.query(Example.name)} == {"3"}
+
+
+def test_bulk_delete_requires_criteria(client, admin_headers):
+    """조건 없는 전체 삭제는 거부"""
+    response = client.request("DELETE", "/api/examples/bulk", json={}, headers=admin_headers)
+
+    assert response.status_code == 400
+    assert "id 목록" in response.json()["message"]
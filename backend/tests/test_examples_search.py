@@ -0,0 +1,70 @@
+"""예제 전문 검색 (FTS5) 테스트"""
+import pytest
+
+from app.models import Example
+
+
+@pytest.fixture(autouse=True)
+def sqlite_only(db_session):
+    if db_session.bind.dialect.name != "sqlite":
+        pytest.skip("SQLite FTS5 전용")
+
+
+def search(client, q: str, **params):
+    return client.get("/api/examples/search", params={"q": q, **params})
+
+
+def test_name_match_ranks_above_description_match(client):
+    """이름 일치가 설명 일치보다 앞 (bm25 가중치)"""
+    client.post("/api/examples/", json={"name": "기타", "description": "파이썬 예제"})
+    client.post("/api/examples/", json={"name": "파이썬 입문", "description": "기초"})
+    client.post("/api/examples/", json={"name": "자바", "description": "관련 없음"})
+
+    data = search(client, "파이썬").json()
+
+    assert [item["name"] for item in data["items"]] == ["파이썬 입문", "기타"]
+    assert data["total"] == 2
+
+
+def test_prefix_and_all_terms(client):
+    """단어마다 접두사 일치, 모든 단어 포함 (FTS5 연산자는 일반 글자로 취급)"""
+    client.post("/api/examples/", json={"name": "search engine", "description": "full text"})
+    client.post("/api/examples/", json={"name": "search box"})
+
+    assert search(client, "sea").json()["total"] == 2
+    assert [item["name"] for item in search(client, "sear ful").json()["items"]] == ["search engine"]
+    assert search(client, 'search" OR "x').json()["total"] == 0
+    assert search(client, "   ").status_code == 400
+
+
+def test_cursor_walks_results_once(client, admin_headers):
+    """(rank, id) 커서로 모든 결과를 한 번씩 조회"""
+    items = [{"name": f"item {i}"} for i in range(7)]
+    ids = client.post("/api/examples/bulk", json={"items": items}, headers=admin_headers).json()["ids"]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        data = search(client, "item", **params).json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == ids
+    assert len(seen) == len(set(seen))
+    assert search(client, "item", cursor="not-a-cursor").status_code == 400
+
+
+def test_index_follows_updates_and_deletes(client, db_session):
+    """트리거로 수정/삭제가 색인에 반영"""
+    example_id = client.post("/api/examples/", json={"name": "old title"}).json()["id"]
+
+    example = db_session.get(Example, example_id)
+    example.name = "new title"
+    db_session.commit()
+    assert search(client, "old").json()["total"] == 0
+    assert search(client, "new").json()["total"] == 1
+
+    client.delete(f"/api/examples/{example_id}")
+    assert search(client, "title").json()["items"] == []
@@ -0,0 +1,142 @@
+"""사용자/관리자 스트리밍 내보내기 테스트"""
+import asyncio
+import csv
+import gzip
+import io
+import json
+import os
+import sqlite3
+import zlib
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import Base, create_async_db_engine, create_db_engine
+from app.models.user import User
+from app.routers.admin import USER_EXPORT_COLUMNS
+from app.utils.auth import hash_password
+from app.utils.export import gzip_stream, stream_rows
+
+
+# 피크 RSS 테스트 행 수 (기본 100만, 로컬에서 빠르게 돌릴 때 줄일 수 있음)
+RSS_TEST_ROWS = int(os.getenv("EXPORT_RSS_TEST_ROWS", "1000000"))
+
+
+@pytest.fixture
+def users(db_session):
+    hashed = hash_password("password123")
+    for i in range(12):
+        db_session.add(User(email=f"user{i}@example.com", username=f"user{i}", hashed_password=hashed))
+    db_session.commit()
+
+
+def test_export_users_ndjson(client, admin_headers, users):
+    """NDJSON은 한 줄에 사용자 하나 (비밀번호 해시 제외)"""
+    response = client.get("/api/admin/export/users", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="users.ndjson"' in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["email"] for row in rows] == [f"user{i}@example.com" for i in range(12)]
+    assert "hashed_password" not in rows[0]
+
+
+def test_export_users_csv(client, admin_headers, users):
+    """CSV는 헤더 한 줄 + 사용자 행"""
+    response = client.get("/api/admin/export/users?format=csv", headers=admin_headers)
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 12
+    assert rows[0]["username"] == "user0"
+
+
+def test_export_gzip(client, admin_headers, users):
+    """gzip=true면 .gz 파일로 압축해 전송"""
+    response = client.get("/api/admin/export/users?format=csv&gzip=true", headers=admin_headers)
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="users.csv.gz"' in response.headers["content-disposition"]
+    lines = gzip.decompress(response.content).decode().splitlines()
+    assert lines[0].startswith("id,email,username")
+    assert len(lines) == 13
+
+
+def test_export_empty_csv_has_header(client, admin_headers):
+    """빈 테이블도 CSV 헤더는 출력"""
+    response = client.get("/api/admin/export/users?format=csv", headers=admin_headers)
+
+    assert response.text.splitlines() == ["id,email,username,is_active,enable_2fa,auth_profile_id,created_at,updated_at"]
+
+
+def test_export_admins_requires_super_admin(client, admin_headers, super_admin_headers):
+    """관리자 내보내기는 슈퍼 관리자 전용"""
+    assert client.get("/api/admin/export/admins", headers=admin_headers).status_code == 403
+
+    response = client.get("/api/admin/export/admins", headers=super_admin_headers)
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 2
+
+
+def test_invalid_format_rejected(client, admin_headers):
+    assert client.get("/api/admin/export/users?format=xml", headers=admin_headers).status_code == 422
+
+
+# ============================================
+# 피크 메모리 테스트
+# ============================================
+
+def current_rss() -> int:
+    """현재 프로세스 RSS (바이트, Linux /proc 기준)"""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.fixture(scope="module")
+def million_user_db(tmp_path_factory):
+    """사용자 RSS_TEST_ROWS명이 들어 있는 SQLite 파일"""
+    path = tmp_path_factory.mktemp("export") / "users.db"
+    engine = create_db_engine(f"sqlite:///{path}", profile="default")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    connection = sqlite3.connect(path)
+    connection.executemany(
+        "INSERT INTO users (email, username, hashed_password, is_active, enable_2fa, created_at) "
+        "VALUES (?, ?, 'x', 1, 0, '2024-01-01 00:00:00')",
+        ((f"user{i}@example.com", f"user{i}") for i in range(RSS_TEST_ROWS))
+    )
+    connection.commit()
+    connection.close()
+    return path
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="/proc 기반 RSS 측정 (Linux 전용)")
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_memory_stays_flat(million_user_db, compress):
+    """100만 행을 내보내도 피크 RSS 증가가 배치 몇 개 수준으로 유지"""
+    engine = create_async_db_engine(f"sqlite+aiosqlite:///{million_user_db}", profile="default")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    query = select(*USER_EXPORT_COLUMNS).order_by(User.id)
+
+    async def consume():
+        chunks = stream_rows(session_factory, query, "ndjson", batch_size=1000)
+        if compress:
+            chunks = gzip_stream(chunks)
+
+        decompressor = zlib.decompressobj(wbits=31)
+        lines = 0
+        baseline = peak = current_rss()
+        async for chunk in chunks:
+            lines += (decompressor.decompress(chunk) if compress else chunk).count(b"\n")
+            peak = max(peak, current_rss())
+        await engine.dispose()
+        return lines, peak - baseline
+
+    lines, growth = asyncio.run(consume())
+
+    assert lines == RSS_TEST_ROWS
+    # 전체를 메모리에 올리면 수백 MB (100만 행 NDJSON 약 150MB)
+    assert growth < 32 * 1024 * 1024
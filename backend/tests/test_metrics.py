@@ -0,0 +1,103 @@
+"""Prometheus 메트릭 테스트"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.utils import metrics
+from app.utils.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    JWT_OPERATIONS,
+    PASSWORD_HASH_OPERATIONS,
+    MetricsRegistry,
+)
+
+
+@pytest.fixture
+def metrics_client(client, monkeypatch):
+    """METRICS_ENABLED=true로 만든 앱 (DB 의존성 오버라이드는 기본 앱과 공유)"""
+    monkeypatch.setattr(main, "METRICS_ENABLED", True)
+    metrics_app = main.create_app()
+    metrics_app.dependency_overrides = main.app.dependency_overrides
+    return TestClient(metrics_app)
+
+
+def test_text_exposition_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+    histogram = registry.histogram("job_seconds", "Job latency.", buckets=(0.1, 1.0))
+    counter.inc('say "hi"')
+    counter.inc('say "hi"', amount=2)
+    for value in (0.05, 0.1, 3.0):
+        histogram.observe(value)
+
+    assert registry.render().splitlines() == [
+        "# HELP jobs_total Jobs.",
+        "# TYPE jobs_total counter",
+        'jobs_total{kind="say \\"hi\\""} 3',
+        "# HELP job_seconds Job latency.",
+        "# TYPE job_seconds histogram",
+        'job_seconds_bucket{le="0.1"} 2',
+        'job_seconds_bucket{le="1"} 2',
+        'job_seconds_bucket{le="+Inf"} 3',
+        "job_seconds_sum 3.15",
+        "job_seconds_count 3",
+    ]
+
+
+def test_values_summed_across_threads():
+    """스레드별 샤드의 값을 합산"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits.")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: [counter.inc() for _ in range(1000)], range(8)))
+
+    assert counter.value() == 8000
+
+
+def test_requests_recorded_by_route_template(metrics_client):
+    """실제 경로가 아닌 라우트 템플릿으로 집계, 일치 라우트 없으면 unmatched"""
+    route = "/api/examples/{example_id}"
+    before = HTTP_REQUESTS.value("GET", route, "404")
+
+    metrics_client.get("/api/examples/12345")
+    metrics_client.get("/api/examples/67890")
+    metrics_client.get("/no/such/path")
+
+    assert HTTP_REQUESTS.value("GET", route, "404") == before + 2
+    assert HTTP_REQUEST_DURATION.count("GET", route) >= 2
+    assert HTTP_REQUESTS.value("GET", "unmatched", "404") >= 1
+    assert HTTP_REQUESTS_IN_PROGRESS.value("GET") == 0
+
+
+def test_domain_counters_and_endpoint(metrics_client, test_user_data):
+    hashes = PASSWORD_HASH_OPERATIONS.value("verify")
+    encodes = JWT_OPERATIONS.value("encode", "ok")
+    metrics_client.post("/api/auth/register", json=test_user_data)
+
+    metrics_client.post("/api/auth/login", json=test_user_data)
+
+    assert PASSWORD_HASH_OPERATIONS.value("verify") == hashes + 1
+    assert JWT_OPERATIONS.value("encode", "ok") == encodes + 1
+
+    response = metrics_client.get("/metrics")
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert 'http_requests_total{method="POST",route="/api/auth/login",status="200"}' in response.text
+    assert "# TYPE app_admin_session_lookups_total counter" in response.text
+
+
+def test_endpoint_disabled_by_default(client):
+    """기본 설정(METRICS_ENABLED 미설정)에서는 /metrics 미등록"""
+    assert client.get("/metrics").status_code == 404
+
+
+def test_endpoint_requires_token_when_configured(metrics_client, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "scrape-secret")
+
+    assert metrics_client.get("/metrics").status_code == 401
+    assert metrics_client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert metrics_client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
@@ -0,0 +1,131 @@
+"""스키마 버전 및 마이그레이션 테스트"""
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, text
+
+import app.main as main
+from app.database import create_db_engine
+from app.migrations import (
+    SCHEMA_VERSION,
+    SchemaVersionError,
+    check_schema,
+    get_schema_version,
+    run_migrations,
+)
+from app.utils.auth import hash_token
+
+
+@pytest.fixture
+def empty_engine(tmp_path):
+    """빈 SQLite DB 엔진"""
+    db_engine = create_db_engine(f"sqlite:///{tmp_path / 'migrate.db'}", profile="default")
+    yield db_engine
+    db_engine.dispose()
+
+
+def test_run_migrations_on_empty_database(empty_engine):
+    """빈 DB에 모든 마이그레이션 적용 후 버전 확인 통과"""
+    applied = run_migrations(empty_engine)
+
+    assert [migration.version for migration in applied] == list(range(1, SCHEMA_VERSION + 1))
+    assert check_schema(empty_engine) == SCHEMA_VERSION
+    assert "admin_sessions" in inspect(empty_engine).get_table_names()
+
+
+def test_run_migrations_is_idempotent(empty_engine):
+    """두 번째 실행은 적용할 마이그레이션 없음"""
+    run_migrations(empty_engine)
+
+    assert run_migrations(empty_engine) == []
+    with empty_engine.connect() as connection:
+        assert get_schema_version(connection) == SCHEMA_VERSION
+
+
+def test_check_schema_rejects_unmigrated_database(empty_engine):
+    """schema_version 테이블이 없으면 시작 거부"""
+    with pytest.raises(SchemaVersionError):
+        check_schema(empty_engine)
+
+
+def test_check_schema_rejects_newer_database(empty_engine):
+    """코드보다 최신 스키마면 시작 거부"""
+    run_migrations(empty_engine)
+    with empty_engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO schema_version (version, description, applied_at) VALUES (:v, 'future', :at)"),
+            {"v": SCHEMA_VERSION + 1, "at": datetime.utcnow()}
+        )
+
+    with pytest.raises(SchemaVersionError):
+        check_schema(empty_engine)
+
+
+def test_legacy_admin_sessions_converted_to_digests(empty_engine):
+    """JWT 원문을 저장하던 기존 admin_sessions를 다이제스트로 변환"""
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    with empty_engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE admins (id INTEGER PRIMARY KEY, email VARCHAR, username VARCHAR, "
+            "hashed_password VARCHAR, role VARCHAR, is_active BOOLEAN, created_at DATETIME, updated_at DATETIME)"
+        ))
+        connection.execute(text(
+            "CREATE TABLE admin_sessions (id INTEGER PRIMARY KEY, admin_id INTEGER, "
+            "token VARCHAR UNIQUE, created_at DATETIME, expires_at DATETIME)"
+        ))
+        connection.execute(text("CREATE UNIQUE INDEX ix_admin_sessions_token ON admin_sessions (token)"))
+        connection.execute(
+            text("INSERT INTO admin_sessions VALUES (1, 1, 'legacy.jwt.token', :now, :expires_at)"),
+            {"now": datetime.utcnow(), "expires_at": expires_at}
+        )
+
+    run_migrations(empty_engine)
+
+    columns = {column["name"] for column in inspect(empty_engine).get_columns("admin_sessions")}
+    assert "token" not in columns
+    with empty_engine.connect() as connection:
+        token_hash = connection.execute(text("SELECT token_hash FROM admin_sessions WHERE id = 1")).scalar()
+    assert token_hash == hash_token("legacy.jwt.token")
+
+
+def test_row_version_added_to_existing_users(empty_engine):
+    """version 컬럼이 없던 users 테이블의 기존 행은 버전 1"""
+    with empty_engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR, username VARCHAR, "
+            "hashed_password VARCHAR, is_active BOOLEAN, enable_2fa BOOLEAN, auth_profile_id INTEGER, "
+            "created_at DATETIME, updated_at DATETIME)"
+        ))
+        connection.execute(text("INSERT INTO users (id, email, username, hashed_password) VALUES (1, 'a@example.com', 'a', 'x')"))
+
+    run_migrations(empty_engine)
+
+    with empty_engine.connect() as connection:
+        assert connection.execute(text("SELECT version FROM users WHERE id = 1")).scalar() == 1
+
+
+def test_startup_fails_without_migrations(empty_engine, monkeypatch):
+    """마이그레이션하지 않은 DB로는 서버가 시작되지 않음"""
+    monkeypatch.setattr(main, "engine", empty_engine)
+    monkeypatch.setattr(main, "AUTO_MIGRATE", False)
+
+    with pytest.raises(SchemaVersionError):
+        with TestClient(main.create_app()):
+            pass
+
+
+def test_search_index_built_for_existing_examples(empty_engine):
+    """FTS 색인이 없던 examples 테이블의 기존 행도 검색 가능"""
+    with empty_engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE examples (id INTEGER PRIMARY KEY, name VARCHAR(100), description VARCHAR(500), "
+            "created_at DATETIME, updated_at DATETIME)"
+        ))
+        connection.execute(text("INSERT INTO examples (id, name) VALUES (1, 'legacy example')"))
+
+    run_migrations(empty_engine)
+
+    with empty_engine.connect() as connection:
+        assert connection.execute(text(
+            "SELECT rowid FROM examples_fts WHERE examples_fts MATCH 'legacy'"
+        )).scalars().all() == [1]
@@ -0,0 +1,126 @@
+"""비밀번호 해싱 서비스 테스트"""
+import asyncio
+import hashlib
+import pytest
+
+from app.models import User
+from app.utils.auth import hash_password, verify_password, password_needs_rehash
+from app.utils.password_hashing import PasswordHasher, CALIBRATION_STEP, HASH_SCHEME, MIN_ITERATIONS
+
+
+def make_legacy_hash(password: str, salt: str = "a" * 32) -> str:
+    """기존 salt$sha256 형식 해시 생성"""
+    return f"{salt}${hashlib.sha256((salt + password).encode()).hexdigest()}"
+
+
+def test_hash_password_format():
+    """새 해시 형식 확인"""
+    hashed = hash_password("password123")
+    scheme, iterations, salt, digest = hashed.split("$")
+    assert scheme == HASH_SCHEME
+    assert int(iterations) >= MIN_ITERATIONS
+    assert len(salt) == 32
+    assert verify_password("password123", hashed)
+    assert not verify_password("wrong", hashed)
+
+
+def test_verify_legacy_hash():
+    """레거시 해시 검증 및 재해싱 필요 여부"""
+    legacy = make_legacy_hash("password123")
+    assert verify_password("password123", legacy)
+    assert not verify_password("wrong", legacy)
+    assert password_needs_rehash(legacy)
+    assert not password_needs_rehash(hash_password("password123"))
+
+
+def test_verify_malformed_hash():
+    """잘못된 형식의 해시는 검증 실패"""
+    assert not verify_password("password123", "garbage")
+    assert not verify_password("password123", f"{HASH_SCHEME}$abc$salt$hash")
+
+
+def test_async_matches_sync():
+    """async 해싱/검증은 동기 경로와 같은 형식과 결과 (레거시/잘못된 형식 포함)"""
+    hasher = PasswordHasher(iterations=MIN_ITERATIONS)
+    legacy = make_legacy_hash("password123")
+
+    async def check():
+        hashed = await hasher.hash_async("password123")
+        return [
+            hasher.verify("password123", hashed),
+            await hasher.verify_async("password123", hasher.hash("password123")),
+            await hasher.verify_async("password123", legacy),
+            await hasher.verify_async("wrong", legacy),
+            await hasher.verify_async("password123", "garbage"),
+            await hasher.verify_async("password123", f"{HASH_SCHEME}$abc$salt$hash"),
+        ]
+
+    assert asyncio.run(check()) == [True, True, True, False, False, False]
+
+
+def test_needs_rehash_after_cost_increase():
+    """비용이 높아지면 기존 해시는 재해싱 대상"""
+    hasher = PasswordHasher(iterations=MIN_ITERATIONS)
+    hashed = hasher.hash("password123")
+    hasher.iterations = MIN_ITERATIONS * 2
+    assert hasher.needs_rehash(hashed)
+    assert hasher.verify("password123", hashed)
+
+
+def test_small_cost_change_does_not_rehash():
+    """보정 잡음 수준의 비용 증가로는 재해싱하지 않음"""
+    hasher = PasswordHasher(iterations=MIN_ITERATIONS * 10)
+    hashed = hasher.hash("password123")
+    hasher.iterations = MIN_ITERATIONS * 11
+    assert not hasher.needs_rehash(hashed)
+
+
+def test_calibrate_rounds_to_step():
+    """보정 결과는 CALIBRATION_STEP 단위"""
+    hasher = PasswordHasher()
+    assert hasher.calibrate(target_ms=50) % CALIBRATION_STEP == 0
+
+
+def test_calibrate_respects_minimum():
+    """보정 결과는 하한값 이상"""
+    hasher = PasswordHasher()
+    assert hasher.calibrate(target_ms=0.001) == MIN_ITERATIONS
+
+
+def test_process_pool_hashing_and_stats():
+    """프로세스 풀에서 해싱 후 통계 기록"""
+    hasher = PasswordHasher(iterations=MIN_ITERATIONS)
+    hasher.start(max_workers=1)
+    try:
+        hashed = hasher.hash("password123")
+        assert hasher.verify("password123", hashed)
+        stats = hasher.stats()
+        assert stats["pool_running"] is True
+        assert stats["completed"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["avg_latency_ms"] > 0
+    finally:
+        hasher.shutdown()
+    assert hasher.stats()["pool_running"] is False
+
+
+def test_login_rehashes_legacy_password(client, db_session, test_user_data):
+    """레거시 해시 사용자는 로그인 성공 시 새 형식으로 재해싱"""
+    user = User(
+        email=test_user_data["email"],
+        username=test_user_data["username"],
+        hashed_password=make_legacy_hash(test_user_data["password"]),
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post("/api/auth/login", json={
+        "email": test_user_data["email"],
+        "password": test_user_data["password"]
+    })
+    assert response.status_code == 200
+
+    db_session.refresh(user)
+    assert user.hashed_password.startswith(f"{HASH_SCHEME}$")
+    assert verify_password(test_user_data["password"], user.hashed_password)
@@ -0,0 +1,94 @@
+"""사용자 스냅샷(Principal) 캐시 테스트"""
+import pytest
+
+from app.models import User
+from app.models.admin import Admin
+from app.dependencies.auth import get_principal_cache
+from app.utils.auth import hash_password
+
+
+def get_cached_principal(email):
+    """캐시에 저장된 스냅샷 조회"""
+    return get_principal_cache().get(email)
+
+
+def test_profile_cache_hit_skips_db(authenticated_client, test_user_data, query_counter):
+    """캐시 적중 시 /me 조회는 DB 쿼리 없음"""
+    first = authenticated_client.get("/api/users/me")
+    assert first.status_code == 200
+
+    query_counter.clear()
+    second = authenticated_client.get("/api/users/me")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert query_counter == []
+
+
+def test_profile_update_invalidates_cache(authenticated_client, test_user_data):
+    """프로필 수정 커밋 후 스냅샷 무효화"""
+    authenticated_client.get("/api/users/me")
+    assert get_cached_principal(test_user_data["email"]) is not None
+
+    response = authenticated_client.put("/api/users/me", json={"username": "renamed"})
+    assert response.status_code == 200
+    assert get_cached_principal(test_user_data["email"]) is None
+
+    response = authenticated_client.get("/api/users/me")
+    assert response.json()["username"] == "renamed"
+
+
+def test_failed_profile_update_keeps_cache(client, authenticated_client, test_user_data):
+    """수정 실패(중복 사용자명) 시 캐시 유지"""
+    client.post("/api/auth/register", json={
+        "email": "other@example.com",
+        "username": "otheruser",
+        "password": "password123"
+    })
+    authenticated_client.get("/api/users/me")
+
+    response = authenticated_client.put("/api/users/me", json={"username": "otheruser"})
+    assert response.status_code == 400
+    assert get_cached_principal(test_user_data["email"]) is not None
+
+
+def test_2fa_update_invalidates_cache(authenticated_client, test_user_data):
+    """2차 인증 설정 변경 커밋 후 스냅샷 무효화"""
+    authenticated_client.get("/api/users/me")
+
+    response = authenticated_client.put("/api/users/me/2fa", json={"enable_2fa": False})
+    assert response.status_code == 200
+    assert get_cached_principal(test_user_data["email"]) is None
+
+
+def test_admin_2fa_update_invalidates_cache(authenticated_client, db_session, test_user_data):
+    """관리자의 사용자 2차 인증 변경 후 스냅샷 무효화"""
+    authenticated_client.get("/api/users/me")
+    user_token_headers = dict(authenticated_client.headers)
+
+    admin = Admin(
+        email="super@admin.com",
+        username="superadmin",
+        hashed_password=hash_password("SuperSecret123!"),
+        role="super_admin",
+        is_active=True
+    )
+    db_session.add(admin)
+    db_session.commit()
+
+    login = authenticated_client.post("/api/admin/auth/login", json={
+        "email": "super@admin.com",
+        "password": "SuperSecret123!"
+    })
+    admin_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    user = db_session.query(User).filter(User.email == test_user_data["email"]).first()
+    response = authenticated_client.put(
+        f"/api/admin/users/{user.id}/2fa",
+        json={"enable_2fa": False},
+        headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert get_cached_principal(test_user_data["email"]) is None
+
+    response = authenticated_client.get("/api/users/me", headers=user_token_headers)
+    assert response.status_code == 200
@@ -0,0 +1,151 @@
+"""요청 프로파일링 테스트"""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.models.admin import Admin
+from app.utils import profiling, query_stats
+from app.utils.auth import decode_access_token
+from app.utils.exceptions import UnauthorizedException
+from app.utils.profiling import ProfileStore, ProfilingMiddleware, RequestProfile, collapsed_text, get_profile_store
+
+
+@pytest.fixture(autouse=True)
+def profile_store(monkeypatch):
+    """짧은 수집 간격, 테스트마다 빈 보관소"""
+    monkeypatch.setattr(profiling, "PROFILE_INTERVAL", 0.0005)
+    get_profile_store().clear()
+    yield get_profile_store()
+    get_profile_store().clear()
+
+
+@pytest.fixture
+def profile_token(client, super_admin_headers) -> str:
+    return client.post("/api/admin/system/profiles/token", headers=super_admin_headers).json()["token"]
+
+
+def test_signed_header_profiles_request(client, super_admin_headers, profile_token):
+    """토큰 헤더가 있는 요청만 프로파일, collapsed stack 다운로드"""
+    items = [{"name": f"profiled {i}", "description": "x" * 100} for i in range(5000)]
+    response = client.post("/api/examples/bulk", json={"items": items[:10]}, headers=super_admin_headers)
+    assert "X-Profile-Id" not in response.headers
+
+    headers = {**super_admin_headers, "X-Profile-Token": profile_token}
+    response = client.post("/api/examples/bulk", json={"items": items}, headers=headers)
+
+    profile_id = int(response.headers["X-Profile-Id"])
+    summaries = client.get("/api/admin/system/profiles", headers=super_admin_headers).json()["items"]
+    summary = next(item for item in summaries if item["id"] == profile_id)
+    assert summary["route"] == "/api/examples/bulk"
+    assert summary["status"] == 201
+    assert summary["trigger"] == "header"
+    assert summary["db_queries"] >= 5
+    assert summary["samples"] > 0
+
+    collapsed = client.get(f"/api/admin/system/profiles/{profile_id}/collapsed", headers=super_admin_headers)
+    assert "attachment" in collapsed.headers["content-disposition"]
+    lines = collapsed.text.splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert "app/" in stack
+
+
+def test_invalid_token_is_ignored(client, super_admin_headers):
+    response = client.get("/api/examples/", headers={"X-Profile-Token": "forged"})
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+
+
+def _revoke_by_logout(client, issuer_headers, super_admin_headers, issuer_id):
+    client.post("/api/admin/auth/logout", headers=issuer_headers)
+
+
+def _revoke_by_demotion(client, issuer_headers, super_admin_headers, issuer_id):
+    client.put(f"/api/admin/users/{issuer_id}", json={"role": "admin"}, headers=super_admin_headers)
+
+
+def _revoke_by_deactivation(client, issuer_headers, super_admin_headers, issuer_id):
+    client.put(f"/api/admin/users/{issuer_id}", json={"is_active": False}, headers=super_admin_headers)
+
+
+def _revoke_by_deletion(client, issuer_headers, super_admin_headers, issuer_id):
+    client.delete(f"/api/admin/users/{issuer_id}", headers=super_admin_headers)
+
+
+@pytest.mark.parametrize("revoke", [
+    _revoke_by_logout, _revoke_by_demotion, _revoke_by_deactivation, _revoke_by_deletion
+])
+def test_token_revoked_with_issuer(client, db_session, super_admin_headers, admin_login, revoke):
+    """발급자가 로그아웃/강등/비활성화/삭제되면 만료 전이라도 토큰으로 프로파일하지 않음"""
+    issuer_headers = admin_login("issuer@example.com", "super_admin")
+    token = client.post("/api/admin/system/profiles/token", headers=issuer_headers).json()["token"]
+    issuer_id = db_session.query(Admin.id).filter(Admin.email == "issuer@example.com").scalar()
+
+    response = client.get("/api/examples/", headers={"X-Profile-Token": token})
+    assert "X-Profile-Id" in response.headers
+
+    revoke(client, issuer_headers, super_admin_headers, issuer_id)
+
+    response = client.get("/api/examples/", headers={"X-Profile-Token": token})
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+
+
+def test_profile_token_is_not_an_access_token(client, super_admin_headers, profile_token):
+    """프로파일 토큰으로는 API 인증 불가"""
+    with pytest.raises(UnauthorizedException):
+        decode_access_token(profile_token)
+
+    bearer = {"Authorization": f"Bearer {profile_token}"}
+    assert client.get("/api/users/me", headers=bearer).status_code == 401
+    assert client.get("/api/admin/system/profiles", headers=bearer).status_code == 401
+
+
+def test_query_stats_installed_on_first_profile(client, super_admin_headers, monkeypatch):
+    """미들웨어 생성만으로는 SQL 이벤트를 등록하지 않고, 프로파일하는 요청에서 등록"""
+    def installed():
+        return event.contains(Engine, "before_cursor_execute", query_stats._before_cursor_execute)
+
+    if installed():
+        event.remove(Engine, "before_cursor_execute", query_stats._before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", query_stats._after_cursor_execute)
+
+    ProfilingMiddleware(app=None)
+    client.get("/api/examples/")
+    assert not installed()
+
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 1.0)
+    client.get("/api/examples/")
+    assert installed()
+
+
+def test_sampled_fraction(client, super_admin_headers, monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 1.0)
+
+    response = client.get("/api/examples/")
+
+    monkeypatch.setattr(profiling, "PROFILE_SAMPLE_RATE", 0.0)
+    profile = get_profile_store().get(int(response.headers["X-Profile-Id"]))
+    assert profile.trigger == "sampled"
+    assert profile.route == "/api/examples/"
+
+
+def test_super_admin_only(client, super_admin_headers, admin_headers):
+    assert client.post("/api/admin/system/profiles/token", headers=admin_headers).status_code == 403
+    assert client.get("/api/admin/system/profiles/collapsed", headers=admin_headers).status_code == 403
+    assert client.get("/api/admin/system/profiles/999/collapsed", headers=super_admin_headers).status_code == 404
+
+
+def test_ring_buffer_keeps_latest():
+    store = ProfileStore(maxsize=2)
+    for stacks in ({"a;b": 1}, {"a;b": 2}, {"a;c": 3}):
+        store.add(RequestProfile(
+            id=store.next_id(), method="GET", path="/", route="/", status=200, trigger="sampled",
+            duration_ms=1.0, db_queries=0, db_ms=0.0, samples=1, interval_ms=1.0, created_at=None, stacks=stacks
+        ))
+
+    assert [profile.id for profile in store.list()] == [3, 2]
+    assert collapsed_text(store.list()) == "a;c 3\na;b 2\n"
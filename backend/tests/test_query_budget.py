@@ -0,0 +1,57 @@
+"""엔드포인트별 SQL 문 수 예산 및 Server-Timing 테스트
+
+예산을 넘으면 실행된 SQL 목록과 함께 실패합니다 (N+1 회귀 방지).
+"""
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+
+def test_user_profile_budget(authenticated_client, query_budget):
+    """/api/users/me: 주체 조회 1회 이하 (캐시 적중 시 0회)"""
+    with query_budget(1):
+        assert authenticated_client.get("/api/users/me").status_code == 200
+    with query_budget(0):
+        authenticated_client.get("/api/users/me")
+
+
+def test_admin_endpoints_budget(client, super_admin_headers, query_budget):
+    """관리자 인증은 세션+관리자 조인 1회, 목록은 행 조회 + 개수 1회씩"""
+    with query_budget(1):
+        assert client.get("/api/admin/users/me", headers=super_admin_headers).status_code == 200
+    for i in range(5):
+        client.post("/api/admin/users", headers=super_admin_headers, json={
+            "email": f"a{i}@admin.com", "username": f"admin{i}", "password": "password123", "role": "admin"
+        })
+    with query_budget(2):
+        assert len(client.get("/api/admin/users", headers=super_admin_headers).json()["items"]) == 6
+    with query_budget(2):
+        client.get("/api/admin/app-users", headers=super_admin_headers)
+
+
+def test_examples_list_budget(client, query_budget, super_admin_headers):
+    """행 수와 무관하게 목록 1회 + 개수 1회"""
+    items = [{"name": f"e{i}"} for i in range(30)]
+    client.post("/api/examples/bulk", json={"items": items}, headers=super_admin_headers)
+    with query_budget(2):
+        assert len(client.get("/api/examples/?limit=20").json()["items"]) == 20
+
+
+def test_server_timing_in_debug_mode(client, super_admin_headers, monkeypatch):
+    """DEBUG 모드에서 SQL 문 수/DB 시간 Server-Timing 헤더 (sync/async 엔드포인트)"""
+    assert "Server-Timing" not in client.get("/api/examples/").headers
+
+    monkeypatch.setattr(main, "DEBUG", True)
+    debug_app = main.create_app()
+    debug_app.dependency_overrides.update(main.app.dependency_overrides)
+    client.post("/api/examples/", json={"name": "timed"})
+    debug_client = TestClient(debug_app)
+
+    response = debug_client.get("/api/examples/")
+
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith('db;desc="2 queries";dur=')
+    assert "total;dur=" in timing
+
+    response = debug_client.get("/api/admin/users/me", headers=super_admin_headers)
+    assert response.headers["Server-Timing"].startswith('db;desc="1 queries";dur=')
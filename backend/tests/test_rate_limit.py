@@ -0,0 +1,128 @@
+"""로그인 시도 제한 테스트"""
+import pytest
+
+from app.models.admin import Admin
+from app.routers import auth as auth_router
+from app.utils.auth import hash_password
+from app.utils.rate_limit import LoginThrottle, RateLimiter, get_login_throttle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_refills_and_reports_retry_after():
+    """capacity회 허용 후 거부, 충전 비율에 맞춰 다시 허용"""
+    clock = FakeClock()
+    limiter = RateLimiter(capacity=3, period=60, maxsize=10, clock=clock)
+
+    assert [limiter.acquire("ip") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("ip") == pytest.approx(20)
+    assert limiter.acquire("other") == 0.0
+
+    clock.now += 20
+    assert limiter.retry_after("ip") == 0.0
+    assert limiter.acquire("ip") == 0.0
+    assert limiter.acquire("ip") > 0
+    assert limiter.stats()["limited"] == 2
+
+
+def test_lru_eviction_bounds_memory():
+    limiter = RateLimiter(capacity=1, period=60, maxsize=2)
+
+    for key in ("a", "b", "c"):
+        limiter.acquire(key)
+
+    assert len(limiter) == 2
+    assert limiter.acquire("a") == 0.0  # 제거된 키는 가득 찬 버킷으로 다시 시작
+    assert limiter.stats()["evictions"] == 2
+
+
+def test_zero_capacity_disables_limit():
+    limiter = RateLimiter(capacity=0, period=60, maxsize=10)
+    assert all(limiter.acquire("ip") == 0.0 for _ in range(100))
+
+
+@pytest.fixture
+def count_password_checks(monkeypatch):
+    """사용자 로그인의 비밀번호 검증 호출 횟수"""
+    calls = []
+    original = auth_router.verify_password
+
+    def counting(plain, hashed):
+        calls.append(plain)
+        return original(plain, hashed)
+
+    monkeypatch.setattr(auth_router, "verify_password", counting)
+    return calls
+
+
+def test_account_locked_after_failures(client, test_user_data, count_password_checks):
+    """실패가 반복되면 비밀번호 검증 없이 429 + Retry-After"""
+    client.post("/api/auth/register", json=test_user_data)
+    wrong = {"email": test_user_data["email"], "password": "wrong-password"}
+    max_failures = get_login_throttle().account_limiter.capacity
+
+    for _ in range(max_failures):
+        assert client.post("/api/auth/login", json=wrong).status_code == 401
+    checks = len(count_password_checks)
+
+    response = client.post("/api/auth/login", json={**wrong, "password": test_user_data["password"]})
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.json()["status_code"] == 429
+    assert len(count_password_checks) == checks
+
+
+def test_success_resets_failures(client, test_user_data):
+    client.post("/api/auth/register", json=test_user_data)
+    wrong = {"email": test_user_data["email"], "password": "wrong-password"}
+    max_failures = get_login_throttle().account_limiter.capacity
+
+    for _ in range(max_failures - 1):
+        client.post("/api/auth/login", json=wrong)
+    assert client.post("/api/auth/login", json=test_user_data).status_code == 200
+    assert client.post("/api/auth/login", json=wrong).status_code == 401
+
+
+def test_ip_limit_rejects_before_lookup(client, monkeypatch, query_counter):
+    """IP별 시도 초과 시 DB 조회 없이 거부 (다른 계정이어도)"""
+    throttle = LoginThrottle(
+        ip_limiter=RateLimiter(capacity=2, period=60, maxsize=100),
+        account_limiter=RateLimiter(capacity=100, period=60, maxsize=100)
+    )
+    monkeypatch.setattr(auth_router, "get_login_throttle", lambda: throttle)
+
+    for i in range(2):
+        client.post("/api/auth/login", json={"email": f"user{i}@example.com", "password": "x"})
+    query_counter.clear()
+
+    response = client.post("/api/auth/login", json={"email": "user9@example.com", "password": "x"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "30"
+    assert query_counter == []
+
+
+def test_admin_login_lockout(client, db_session):
+    admin = Admin(
+        email="locked@admin.com", username="locked", hashed_password=hash_password("password123"),
+        role="admin", is_active=True
+    )
+    db_session.add(admin)
+    db_session.commit()
+    wrong = {"email": "LOCKED@admin.com", "password": "wrong-password"}
+
+    statuses = [
+        client.post("/api/admin/auth/login", json=wrong).status_code
+        for _ in range(get_login_throttle().account_limiter.capacity + 1)
+    ]
+
+    assert statuses[-2:] == [401, 429]
+    response = client.post("/api/admin/auth/login", json={"email": "locked@admin.com", "password": "password123"})
+    assert response.status_code == 429
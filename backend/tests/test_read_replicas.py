@@ -0,0 +1,185 @@
+"""읽기 복제본 라우팅 테스트 (지연 시 primary 대체, read-your-writes)"""
+import asyncio
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import column, event, select, table, text
+
+import app.database as database
+from app.database import (
+    AsyncReadSessionLocal,
+    Base,
+    ReadSessionLocal,
+    create_async_db_engine,
+    create_db_engine,
+    create_replica_set,
+    to_async_url,
+)
+from app.models import Example
+from app.utils import replicas
+from app.utils.replicas import PrimaryWriteTrackingMiddleware, begin_request_state, end_request_state
+
+
+marker = select(column("source")).select_from(table("marker"))
+
+
+def create_marked_db(url: str, source: str):
+    """어느 DB에서 읽었는지 구분할 marker 테이블 생성"""
+    db_engine = create_db_engine(url, profile="default")
+    Base.metadata.create_all(bind=db_engine)
+    with db_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE marker (source TEXT)"))
+        connection.execute(text("INSERT INTO marker VALUES (:source)"), {"source": source})
+    return db_engine
+
+
+@pytest.fixture
+def routing(tmp_path, monkeypatch):
+    """primary/replica SQLite 파일로 라우팅 대상 교체"""
+    primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    primary = create_marked_db(primary_url, "primary")
+    create_marked_db(replica_url, "replica").dispose()
+    async_primary = create_async_db_engine(to_async_url(primary_url), profile="default")
+
+    replica_set = create_replica_set([replica_url], max_lag=1.0, profile="default")
+    monkeypatch.setattr(database, "engine", primary)
+    monkeypatch.setattr(database, "async_engine", async_primary)
+    monkeypatch.setattr(database, "replica_set", replica_set)
+    event.listen(primary, "commit", database._on_primary_commit)
+    yield replica_set
+
+    primary.dispose()
+    for replica in replica_set.replicas:
+        replica.engine.dispose()
+
+
+def read_source() -> str:
+    with ReadSessionLocal() as db:
+        return db.execute(marker).scalar()
+
+
+def test_unchecked_replica_not_used(routing):
+    """지연을 측정하기 전에는 primary에서 읽음"""
+    assert read_source() == "primary"
+    assert routing.stats()["primary_fallbacks"] == 1
+
+
+def test_healthy_replica_serves_reads(routing):
+    """지연 측정 후 정상 복제본에서 읽음"""
+    routing.refresh()
+
+    assert read_source() == "replica"
+    assert routing.stats()["replicas"][0]["lag_seconds"] == 0
+
+
+def test_lagging_replica_falls_back_to_primary(routing, monkeypatch):
+    """지연이 max_lag를 넘으면 primary로 대체"""
+    monkeypatch.setitem(replicas.LAG_QUERIES, "sqlite", "SELECT 10")
+    routing.refresh()
+
+    assert routing.stats()["replicas"][0]["healthy"] is False
+    assert read_source() == "primary"
+
+
+def test_unreachable_replica_marked_unhealthy(tmp_path, monkeypatch):
+    """연결할 수 없는 복제본은 오류 기록 후 제외"""
+    replica_set = create_replica_set(
+        [f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"], profile="default"
+    )
+    replica_set.refresh()
+
+    status = replica_set.stats()["replicas"][0]
+    assert status["healthy"] is False
+    assert status["last_error"]
+    assert replica_set.choose() is None
+
+
+def test_reads_after_commit_in_request_use_primary(routing):
+    """같은 요청에서 primary에 커밋한 뒤의 읽기는 primary로"""
+    routing.refresh()
+    token = begin_request_state()
+    try:
+        assert read_source() == "replica"
+        with ReadSessionLocal() as db:
+            db.add(Example(name="written", description="primary"))
+            db.commit()
+        assert read_source() == "primary"
+    finally:
+        end_request_state(token)
+
+    # 다음 요청은 다시 복제본 사용
+    assert read_source() == "replica"
+
+
+def test_next_request_after_write_reads_primary(routing):
+    """커밋한 클라이언트의 다음 요청은 max_lag 동안 primary에서 읽음 (복제본은 아직 미반영)"""
+    routing.refresh()
+    api = FastAPI()
+    api.add_middleware(PrimaryWriteTrackingMiddleware, max_lag=routing.max_lag)
+
+    @api.post("/write")
+    def write():
+        with ReadSessionLocal() as db:
+            db.add(Example(name="written", description="primary"))
+            db.commit()
+
+    @api.get("/read")
+    def read():
+        return read_source()
+
+    writer, other = TestClient(api), TestClient(api)
+    assert writer.get("/read").json() == "replica"
+    assert "set-cookie" not in writer.get("/read").headers
+
+    writer.post("/write")
+    assert writer.get("/read").json() == "primary"
+    assert other.get("/read").json() == "replica"
+
+    # 기한이 지난 쿠키는 무시하고 다시 복제본
+    writer.cookies.clear()
+    writer.cookies.set(replicas.PRIMARY_READ_COOKIE, str(time.time() - 1))
+    assert writer.get("/read").json() == "replica"
+
+
+def test_writes_go_to_primary(routing):
+    """조회 세션으로 쓰더라도 flush는 primary로"""
+    routing.refresh()
+    with ReadSessionLocal() as db:
+        db.add(Example(name="written", description="primary"))
+        db.commit()
+
+    with database.engine.connect() as connection:
+        assert connection.execute(select(Example.name)).scalar() == "written"
+    with routing.replicas[0].engine.connect() as connection:
+        assert connection.execute(select(Example.name)).scalar() is None
+
+
+def test_async_read_session_uses_replica(routing):
+    """async 조회 세션도 복제본의 async 엔진으로 라우팅"""
+    routing.refresh()
+
+    async def read_async_source():
+        async with AsyncReadSessionLocal() as db:
+            value = (await db.execute(marker)).scalar()
+        await routing.replicas[0].async_engine.dispose()
+        await database.async_engine.dispose()
+        return value
+
+    assert asyncio.run(read_async_source()) == "replica"
+
+
+
+def test_write_tracking_middleware_only_with_replicas(routing, monkeypatch):
+    """복제본이 없으면 쓰기 추적 미들웨어를 등록하지 않음"""
+    import app.main as main
+
+    def middleware_classes():
+        return [middleware.cls for middleware in main.create_app().user_middleware]
+
+    monkeypatch.setattr(main, "replica_set", routing)
+    assert PrimaryWriteTrackingMiddleware in middleware_classes()
+
+    monkeypatch.setattr(main, "replica_set", database.create_replica_set([]))
+    assert PrimaryWriteTrackingMiddleware not in middleware_classes()
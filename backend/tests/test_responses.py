@@ -0,0 +1,79 @@
+"""JSON 응답 클래스와 빠른 직렬화 경로 테스트"""
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from app.models import Admin, Example
+from app.schemas import AdminResponse, ExampleResponse
+from app.utils.responses import (
+    FastJSONResponse,
+    get_json_response_class,
+    model_response,
+    orm_response,
+    page_response,
+)
+
+
+def make_example(**overrides) -> Example:
+    values = {
+        "id": 1, "name": "예제", "description": None,
+        "created_at": datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc), "updated_at": None,
+    }
+    values.update(overrides)
+    return Example(**values)
+
+
+@pytest.mark.parametrize("created_at", [
+    datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    datetime(2024, 1, 2, 3, 4, 5),
+])
+def test_orm_response_matches_pydantic_serialization(created_at):
+    """검증을 건너뛰어도 Pydantic 직렬화와 같은 JSON (UTC는 "Z" 표기)"""
+    example = make_example(created_at=created_at)
+
+    expected = ExampleResponse.model_validate(example).model_dump_json()
+    assert json.loads(orm_response(ExampleResponse, example).body) == json.loads(expected)
+    assert json.loads(model_response(ExampleResponse, example).body) == json.loads(expected)
+
+
+def test_orm_response_only_includes_schema_fields():
+    """스키마에 없는 컬럼(비밀번호 해시)은 응답에 포함하지 않음"""
+    admin = Admin(
+        id=1, email="a@example.com", username="a", hashed_password="secret", role="admin",
+        is_active=True, created_at=datetime(2024, 1, 1)
+    )
+
+    body = json.loads(orm_response(AdminResponse, [admin], status_code=201).body)
+    assert body == [{
+        "id": 1, "email": "a@example.com", "username": "a", "role": "admin",
+        "is_active": True, "created_at": "2024-01-01T00:00:00",
+    }]
+    page = json.loads(page_response(AdminResponse, [admin], 1, None).body)
+    assert page["items"] == body
+    assert (page["total"], page["next_cursor"]) == (1, None)
+
+
+def test_get_json_response_class(monkeypatch):
+    """JSON_RESPONSE 설정으로 응답 클래스 선택"""
+    assert get_json_response_class("orjson") is FastJSONResponse
+    assert get_json_response_class("default") is JSONResponse
+    monkeypatch.setenv("JSON_RESPONSE", "default")
+    assert get_json_response_class() is JSONResponse
+    with pytest.raises(ValueError):
+        get_json_response_class("ujson")
+
+
+def test_endpoint_and_error_responses_are_json(client):
+    """빠른 경로와 전역 예외 핸들러 응답 형식 유지"""
+    created = client.post("/api/examples/", json={"name": "예제"})
+    assert created.headers["content-type"] == "application/json"
+    assert created.json()["name"] == "예제"
+
+    listed = client.get("/api/examples/")
+    assert [item["id"] for item in listed.json()["items"]] == [created.json()["id"]]
+
+    missing = client.get("/api/examples/999")
+    assert missing.status_code == 404
+    assert missing.json()["error"] == "HTTPException"
@@ -0,0 +1,88 @@
+"""만료 관리자 세션 정리기 테스트"""
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.orm import sessionmaker
+
+from app.models.admin import Admin
+from app.models.admin_session import AdminSession
+from app.utils.admin_utils import SessionReaper, cleanup_expired_sessions
+from app.utils.auth import hash_password, hash_token
+
+
+@pytest.fixture
+def admin(db_session):
+    """세션 소유 관리자"""
+    admin = Admin(
+        email="reaper@admin.com",
+        username="reaperadmin",
+        hashed_password=hash_password("AdminPass123!"),
+        role="super_admin",
+        is_active=True
+    )
+    db_session.add(admin)
+    db_session.commit()
+    db_session.refresh(admin)
+    return admin
+
+
+def add_sessions(db_session, admin, count, expired):
+    """만료/유효 세션 생성"""
+    offset = timedelta(hours=-1) if expired else timedelta(hours=1)
+    prefix = "expired" if expired else "active"
+    db_session.add_all([
+        AdminSession(
+            admin_id=admin.id,
+            token_hash=hash_token(f"{prefix}-{i}"),
+            expires_at=datetime.utcnow() + offset
+        )
+        for i in range(count)
+    ])
+    db_session.commit()
+
+
+def test_cleanup_expired_sessions_in_batches(db_session, admin):
+    """배치 크기와 관계없이 만료 세션만 모두 삭제"""
+    add_sessions(db_session, admin, 7, expired=True)
+    add_sessions(db_session, admin, 3, expired=False)
+
+    deleted = cleanup_expired_sessions(db_session, batch_size=3)
+
+    assert deleted == 7
+    assert db_session.query(AdminSession).count() == 3
+
+
+def test_reaper_reports_batches_and_lock_time(db_session, admin):
+    """정리 결과에 회수 행 수, 배치 수, 잠금 시간 기록"""
+    add_sessions(db_session, admin, 5, expired=True)
+    add_sessions(db_session, admin, 2, expired=False)
+
+    session_factory = sessionmaker(bind=db_session.get_bind())
+    reaper = SessionReaper(session_factory=session_factory, batch_size=2, pause=0)
+    result = reaper.run_once()
+
+    assert result["reclaimed"] == 5
+    assert result["batches"] == 3
+    assert result["lock_time_ms"] >= result["max_batch_lock_time_ms"] > 0
+    assert db_session.query(AdminSession).count() == 2
+
+    stats = reaper.stats()
+    assert stats["runs"] == 1
+    assert stats["total_reclaimed"] == 5
+    assert stats["last_run"] == result
+
+
+def test_session_reaper_endpoint(client, admin):
+    """슈퍼 관리자는 정리 현황 조회 가능"""
+    login = client.post("/api/admin/auth/login", json={
+        "email": admin.email,
+        "password": "AdminPass123!"
+    })
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    response = client.get("/api/admin/system/session-reaper", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert "total_reclaimed" in data
+    assert "last_run" in data
+
+    assert client.get("/api/admin/system/session-reaper").status_code == 401
@@ -0,0 +1,98 @@
+"""JWT 디코딩 캐시 테스트"""
+import time
+import pytest
+from datetime import timedelta
+
+from app.utils.auth import (
+    _decode_token,
+    create_access_token,
+    create_temp_token,
+    decode_access_token,
+    verify_temp_token,
+    get_token_cache
+)
+from app.utils.cache import TTLCache
+from app.utils.exceptions import UnauthorizedException
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """테스트마다 캐시 초기화"""
+    get_token_cache().clear()
+    yield
+    get_token_cache().clear()
+
+
+def test_decode_access_token_uses_cache():
+    """같은 토큰은 두 번째부터 캐시 적중"""
+    cache = get_token_cache()
+    token = create_access_token(data={"sub": "test@example.com"})
+    hits_before = cache.hits
+
+    assert decode_access_token(token).email == "test@example.com"
+    assert decode_access_token(token).email == "test@example.com"
+
+    assert cache.hits == hits_before + 1
+    assert len(cache) == 1
+
+
+def test_cached_payload_not_shared_with_callers():
+    """반환된 payload를 수정해도 캐시된 값은 그대로"""
+    token = create_access_token(data={"sub": "test@example.com"})
+    _decode_token(token).pop("exp")
+    _decode_token(token)["sub"] = "attacker@example.com"
+
+    payload = _decode_token(token)
+    assert payload["sub"] == "test@example.com"
+    assert "exp" in payload
+
+
+def test_invalid_token_not_cached():
+    """검증 실패 토큰은 캐시하지 않음"""
+    with pytest.raises(UnauthorizedException):
+        decode_access_token("invalid.token.value")
+    assert len(get_token_cache()) == 0
+
+
+def test_expired_token_rejected():
+    """만료된 토큰은 캐시되지 않고 거부"""
+    token = create_access_token(data={"sub": "test@example.com"}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(UnauthorizedException):
+        decode_access_token(token)
+    assert len(get_token_cache()) == 0
+
+
+def test_verify_temp_token_uses_cache():
+    """임시 토큰 검증도 캐시 사용, 타입 검사는 유지"""
+    temp_token = create_temp_token("test@example.com")
+    assert verify_temp_token(temp_token) == "test@example.com"
+    assert verify_temp_token(temp_token) == "test@example.com"
+    assert get_token_cache().hits >= 1
+
+    access_token = create_access_token(data={"sub": "test@example.com"})
+    with pytest.raises(UnauthorizedException):
+        verify_temp_token(access_token)
+
+
+def test_ttl_cache_expires_at_deadline():
+    """만료 시각이 지나면 조회되지 않음"""
+    cache = TTLCache(maxsize=10)
+    cache.set("key", "value", expires_at=time.time() + 0.05)
+    assert cache.get("key") == "value"
+    time.sleep(0.06)
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_ttl_cache_lru_eviction():
+    """최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거"""
+    cache = TTLCache(maxsize=2, default_ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
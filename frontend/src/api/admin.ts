@@ -1,4 +1,12 @@
-import { Admin, AdminCreate, AdminLogin, AdminToken, AdminUpdate } from '@/types/admin';
+import {
+  Admin,
+  AdminCreate,
+  AdminListParams,
+  AdminLogin,
+  AdminToken,
+  AdminUpdate,
+  CursorPage,
+} from '@/types/admin';
 import { TwoFactorSettings } from '@/types/user';
 import { getAdminToken } from '@/utils/admin-token';
 
@@ -47,8 +55,12 @@ export async function createAdmin(token: string, data: AdminCreate): Promise<Adm
   return response.json();
 }
 
-export async function getAdmins(token: string): Promise<Admin[]> {
-  const response = await fetch(`${API_URL}/users`, {
+export async function getAdmins(token: string, params: AdminListParams = {}): Promise<CursorPage<Admin>> {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== '') query.set(key, String(value));
+  });
+  const response = await fetch(`${API_URL}/users?${query}`, {
     headers: { 'Authorization': `Bearer ${token}` },
   });
   if (!response.ok) throw new Error(await response.text());
@@ -14,6 +14,11 @@ export default function AdminUsersPage() {
   const { admin } = useAdminAuth();
   const { success, error } = useToast();
   const [admins, setAdmins] = useState<Admin[]>([]);
+  const [total, setTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [search, setSearch] = useState('');
+  // 마지막으로 제출한 검색어 (더 보기는 입력 중인 값이 아니라 이 값으로 다음 페이지 조회)
+  const [query, setQuery] = useState('');
   const [loading, setLoading] = useState(true);
   const [showCreateModal, setShowCreateModal] = useState(false);
   const [showEditModal, setShowEditModal] = useState(false);
@@ -42,12 +47,15 @@ export default function AdminUsersPage() {
     loadAdmins();
   }, [admin]);
 
-  const loadAdmins = async () => {
+  // cursor가 있으면 다음 페이지를 이어 붙이고, 없으면 첫 페이지부터 다시 조회
+  const loadAdmins = async (cursor?: string, q: string = query) => {
     try {
       const token = getAdminToken();
       if (!token) return;
-      const data = await getAdmins(token);
-      setAdmins(data);
+      const data = await getAdmins(token, { cursor, q: q || undefined });
+      setAdmins(cursor ? [...admins, ...data.items] : data.items);
+      setTotal(data.total);
+      setNextCursor(data.next_cursor);
     } catch (err) {
       error(getErrorMessage(err));
     } finally {
@@ -144,6 +152,28 @@ export default function AdminUsersPage() {
           </button>
         </div>
 
+        <form
+          onSubmit={(e) => {
+            e.preventDefault();
+            const submitted = search.trim();
+            setQuery(submitted);
+            loadAdmins(undefined, submitted);
+          }}
+          className="flex items-center gap-2 mb-4"
+        >
+          <input
+            type="text"
+            value={search}
+            onChange={(e) => setSearch(e.target.value)}
+            placeholder="이메일 또는 사용자명으로 시작하는 관리자 검색"
+            className="flex-1 px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
+          />
+          <button type="submit" className="bg-gray-700 hover:bg-gray-800 text-white px-4 py-2 rounded">
+            검색
+          </button>
+          <span className="text-sm text-gray-500">총 {total}명</span>
+        </form>
+
         {loading ? (
           <div className="text-center py-8">로딩 중...</div>
         ) : (
@@ -222,6 +252,16 @@ export default function AdminUsersPage() {
                 ))}
               </tbody>
             </table>
+            {nextCursor && (
+              <div className="p-4 text-center border-t border-gray-200">
+                <button
+                  onClick={() => loadAdmins(nextCursor)}
+                  className="text-blue-600 hover:text-blue-900"
+                >
+                  더 보기 ({admins.length} / {total})
+                </button>
+              </div>
+            )}
           </div>
         )}
 
@@ -31,3 +31,17 @@ export interface AdminUpdate {
   role?: 'admin' | 'super_admin';
   is_active?: boolean;
 }
+
+export interface CursorPage<T> {
+  items: T[];
+  total: number;
+  next_cursor: string | null;
+}
+
+export interface AdminListParams {
+  cursor?: string;
+  limit?: number;
+  role?: 'admin' | 'super_admin';
+  is_active?: boolean;
+  q?: string;
+}